@@ -49,9 +49,19 @@ describe('ApplicationsService', () => {
   });
 
   it('should fetch all applications', async () => {
-    httpService.get.mockReturnValue(of(mockResponse(['app1', 'app2'])));
+    const page = { success: true, applications: ['app1', 'app2'], next_cursor: null };
+    httpService.get.mockReturnValue(of(mockResponse(page)));
     const result = await service.findAll();
-    expect(result).toEqual(['app1', 'app2']);
+    expect(result).toEqual(page);
+  });
+
+  it('should forward the query and return the next cursor', async () => {
+    const page = { success: true, applications: ['app1'], next_cursor: 'abc' };
+    httpService.get.mockReturnValue(of(mockResponse(page)));
+    const query = { status: 'pending', limit: '1' };
+    const result = await service.findAll(query);
+    expect(httpService.get).toHaveBeenCalledWith(expect.stringContaining('/applications/'), { params: query });
+    expect(result).toEqual(page);
   });
 
   it('should fetch one application', async () => {
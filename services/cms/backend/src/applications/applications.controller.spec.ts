@@ -63,9 +63,10 @@ describe('ApplicationsController', () => {
   });
 
   it('should fetch all applications', async () => {
-    const result = await controller.findAll();
+    const query = { status: 'pending' };
+    const result = await controller.findAll(query);
     expect(result).toEqual([mockApp]);
-    expect(appsService.findAll).toHaveBeenCalled();
+    expect(appsService.findAll).toHaveBeenCalledWith(query);
   });
 
   it('should fetch one application by ID', async () => {
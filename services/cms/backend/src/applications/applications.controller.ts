@@ -1,4 +1,4 @@
-import { Controller, Get, Post, Param, Body, UseGuards, Patch, Put, UseInterceptors, UploadedFile, Logger, Req } from '@nestjs/common';
+import { Controller, Get, Post, Param, Query, Body, UseGuards, Patch, Put, UseInterceptors, UploadedFile, Logger, Req } from '@nestjs/common';
 import { ApplicationsService } from './applications.service';
 import { AuthGuard } from '../auth/guards/auth.guard';
 import { RolesGuard } from '../auth/guards/roles.guard';
@@ -17,9 +17,9 @@ export class ApplicationsController {
 
   @Get()
   @Roles(UserRole.HR, UserRole.ADMIN)
-  async findAll() {
+  async findAll(@Query() query?: Record<string, string>) {
     this.logger.log('Fetching all applications');
-    return this.appsService.findAll();
+    return this.appsService.findAll(query);
   }
 
   @Get(':id')
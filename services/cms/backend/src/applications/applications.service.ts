@@ -22,13 +22,13 @@ export class ApplicationsService {
     this.jobUrl = process.env.CAREERS_PAGE || 'http://18.206.154.72:8086/'
   }
 
-  async findAll() {
+  async findAll(query?: Record<string, string>) {
     this.logger.log(`Fetching all applications from: ${this.baseUrl}/applications`);
     try {
       const response = await firstValueFrom(
-        this.httpService.get(`${this.baseUrl}/applications`),
+        this.httpService.get(`${this.baseUrl}/applications/`, { params: query }),
       );
-      return response.data; 
+      return response.data;
     } catch (error) {
       this.logger.error(`Error fetching applications: ${error.message}`, error.stack);
       if (error.response?.status === 401) {
@@ -1,4 +1,4 @@
-import { Controller, Get, Req, Post, Body, Param, UploadedFile, UseInterceptors, UseGuards, UploadedFiles, BadRequestException } from '@nestjs/common';
+import { Controller, Get, Req, Post, Body, Param, Query, UploadedFile, UseInterceptors, UseGuards, UploadedFiles, BadRequestException } from '@nestjs/common';
 import { BulkService } from './bulk.service';
 import { FileFieldsInterceptor, FileInterceptor } from '@nestjs/platform-express';
 import { Express } from 'express';
@@ -59,7 +59,13 @@ export class BulkController {
 
   @Get(':job_id/applications')
   @Roles(UserRole.HR)
-  async getBulkApplications(@Param('job_id') job_id: string) {
-    return await this.bulkService.getBulkApplications(job_id);
+  async getBulkApplications(@Param('job_id') job_id: string, @Query() query?: Record<string, string>) {
+    return await this.bulkService.getBulkApplications(job_id, query);
+  }
+
+  @Get('batches/:batch_id')
+  @Roles(UserRole.HR)
+  async getBulkBatch(@Param('batch_id') batch_id: string) {
+    return await this.bulkService.getBulkBatch(batch_id);
   }
 }
\ No newline at end of file
@@ -4,7 +4,7 @@ import { HttpService } from '@nestjs/axios';
 import { of, throwError } from 'rxjs';
 import { AxiosResponse } from 'axios';
 import { Readable } from 'stream';
-import { Logger } from '@nestjs/common';
+import { Logger, NotFoundException } from '@nestjs/common';
 
 beforeAll(() => {
   jest.spyOn(Logger.prototype, 'error').mockImplementation(() => {});
@@ -105,11 +105,13 @@ describe('BulkService', () => {
 
       mockHttpService.get.mockReturnValueOnce(of(mockResponse));
 
-      const result = await service.getBulkApplications('job-456');
+      const query = { status: 'pending', limit: '20' };
+      const result = await service.getBulkApplications('job-456', query);
 
       expect(result).toEqual([{ application: 'one' }]);
       expect(mockHttpService.get).toHaveBeenCalledWith(
-        expect.stringContaining('/job-456/applications')
+        expect.stringContaining('/bulk/job-456/applications'),
+        { params: query },
       );
     });
 
@@ -122,4 +124,33 @@ describe('BulkService', () => {
       expect(result).toEqual({ success: false, error: 'Error fetching bulk applications' });
     });
   });
+
+  describe('getBulkBatch', () => {
+    it('should return batch progress on success', async () => {
+      const mockResponse: AxiosResponse = {
+        data: { success: true, batch: { _id: 'batch-1', processed_count: 2 } },
+        status: 200,
+        statusText: 'OK',
+        headers: {},
+        config: {
+            headers: undefined
+        },
+      };
+
+      mockHttpService.get.mockReturnValueOnce(of(mockResponse));
+
+      const result = await service.getBulkBatch('batch-1');
+
+      expect(result).toEqual({ success: true, batch: { _id: 'batch-1', processed_count: 2 } });
+      expect(mockHttpService.get).toHaveBeenCalledWith(
+        expect.stringContaining('/bulk/batches/batch-1')
+      );
+    });
+
+    it('should throw NotFoundException when the batch does not exist', async () => {
+      mockHttpService.get.mockReturnValueOnce(throwError(() => ({ message: 'Not Found', response: { status: 404 } })));
+
+      await expect(service.getBulkBatch('missing')).rejects.toBeInstanceOf(NotFoundException);
+    });
+  });
 });
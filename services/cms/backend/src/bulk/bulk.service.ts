@@ -80,11 +80,11 @@ export class BulkService {
     }
   }
 
-  async getBulkApplications(job_id: string) {
+  async getBulkApplications(job_id: string, query?: Record<string, string>) {
     this.logger.log(`Fetching bulk applications for job ID: ${job_id}`);
     try {
       const response = await firstValueFrom(
-        this.httpService.get(`${this.baseUrl}/${job_id}/applications`)
+        this.httpService.get(`${this.baseUrl}/bulk/${job_id}/applications`, { params: query })
       );
       this.logger.debug(`Received data: ${JSON.stringify(response.data)}`);
       return response.data;
@@ -102,4 +102,20 @@ export class BulkService {
       throw new InternalServerErrorException('Error fetching bulk applications');
     }
   }
+
+  async getBulkBatch(batch_id: string) {
+    this.logger.log(`Fetching bulk batch progress for ID: ${batch_id}`);
+    try {
+      const response = await firstValueFrom(
+        this.httpService.get(`${this.baseUrl}/bulk/batches/${batch_id}`)
+      );
+      return response.data;
+    } catch (error) {
+      this.logger.error(`Error fetching bulk batch: ${error.message}`, error.stack);
+      if (error.response?.status === 404) {
+        throw new NotFoundException('Bulk batch not found.');
+      }
+      throw new InternalServerErrorException('Error fetching bulk batch');
+    }
+  }
 }
\ No newline at end of file
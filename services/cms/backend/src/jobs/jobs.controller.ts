@@ -20,8 +20,8 @@ export class JobsController {
  
   @Get('open')
   @Public()
-  async findOpenAll() {
-    return this.jobsService.findOpenAll();
+  async findOpenAll(@Query() query?: Record<string, string>) {
+    return this.jobsService.findOpenAll(query);
   }
 
  
@@ -33,8 +33,8 @@ export class JobsController {
 
   
   @Get("")
-  async findAll() {
-    return this.jobsService.findAll();
+  async findAll(@Query() query?: Record<string, string>) {
+    return this.jobsService.findAll(query);
   }
 
  
@@ -44,8 +44,8 @@ export class JobsController {
   }
 
   @Get(':id/applications')
-  async findApplicationsByJob(@Param('id') id: string) {
-    return this.jobsService.findApplicationsByJob(id);
+  async findApplicationsByJob(@Param('id') id: string, @Query() query?: Record<string, string>) {
+    return this.jobsService.findApplicationsByJob(id, query);
   }
 
   @Post()
@@ -14,10 +14,10 @@ export class JobsService {
 
   
   
-  async findAll() {
+  async findAll(query?: Record<string, string>) {
     try {
       const response = await firstValueFrom(
-        this.httpService.get(`${this.baseUrl}/jobs/`),
+        this.httpService.get(`${this.baseUrl}/jobs/`, { params: query }),
       );
       return response.data;
     } catch (error) {
@@ -39,10 +39,10 @@ export class JobsService {
       return { success: false, error: `Error fetching job ${id}` };
     }
   }
-  async findOpenAll() {
+  async findOpenAll(query?: Record<string, string>) {
     try {
       const response = await firstValueFrom(
-        this.httpService.get(`${this.baseUrl}/jobs/open/`),
+        this.httpService.get(`${this.baseUrl}/jobs/open/`, { params: query }),
       );
       return response.data;
     } catch (error) {
@@ -149,11 +149,11 @@ export class JobsService {
     }
   }
   
-  async findApplicationsByJob(jobId: string) {
+  async findApplicationsByJob(jobId: string, query?: Record<string, string>) {
     this.logger.debug(`Calling GET ${this.baseUrl}/jobs/${jobId}/applications [findApplicationsByJob()]`);
     try {
       const response = await firstValueFrom(
-        this.httpService.get(`${this.baseUrl}/jobs/${jobId}/applications`),
+        this.httpService.get(`${this.baseUrl}/jobs/${jobId}/applications`, { params: query }),
       );
       // this.logger.debug(`Success [findApplicationsByJob(${jobId})]: ${JSON.stringify(response.data)}`);
       return response.data;
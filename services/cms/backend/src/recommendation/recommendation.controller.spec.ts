@@ -52,7 +52,15 @@ describe('RecommendationController', () => {
 
       const result = await controller.createRecommendations(job_id);
       expect(result).toEqual(mockResult);
-      expect(service.createRecommendations).toHaveBeenCalledWith(job_id);
+      expect(service.createRecommendations).toHaveBeenCalledWith(job_id, {});
+    });
+
+    it('should forward top_k and min_similarity to the service', async () => {
+      const job_id = 'job123';
+      mockRecommendationService.createRecommendations.mockResolvedValue({ success: true });
+
+      await controller.createRecommendations(job_id, 20, 0.3);
+      expect(service.createRecommendations).toHaveBeenCalledWith(job_id, { top_k: 20, min_similarity: 0.3 });
     });
   });
 
@@ -69,7 +77,7 @@ describe('RecommendationController', () => {
 
       const result = await controller.getRecommendationsByJobId(job_id);
       expect(result).toEqual(mockResult);
-      expect(service.getRecommendationsByJobId).toHaveBeenCalledWith(job_id);
+      expect(service.getRecommendationsByJobId).toHaveBeenCalledWith(job_id, {});
     });
   });
 });
@@ -12,21 +12,25 @@ export class RecommendationController {
 
   @Post('/')
   // @Roles(UserRole.HR)
-  async createRecommendations(@Body('job_id') job_id: string) {
+  async createRecommendations(
+    @Body('job_id') job_id: string,
+    @Body('top_k') top_k?: number,
+    @Body('min_similarity') min_similarity?: number,
+  ) {
     if (!job_id) {
       return { success: false, error: 'Job ID is required' };
     }
     console.log("we are in controller ----------------------------------------------");
-    const result = await this.recommendationService.createRecommendations(job_id);
+    const result = await this.recommendationService.createRecommendations(job_id, { top_k, min_similarity });
     console.log('Response from post recommendation service:', result);
     return result;
   }
   @Get('/:job_id')
   // @Roles(UserRole.HR, UserRole.HM)
-  async getRecommendationsByJobId(@Param('job_id') job_id: string) {
+  async getRecommendationsByJobId(@Param('job_id') job_id: string, @Query() query: Record<string, any> = {}) {
     if (!job_id) {
       return { success: false, error: 'Job ID is required' };
     }
-    return this.recommendationService.getRecommendationsByJobId(job_id);
+    return this.recommendationService.getRecommendationsByJobId(job_id, query);
   }
 }
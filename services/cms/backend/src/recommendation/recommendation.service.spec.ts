@@ -89,7 +89,8 @@ describe('RecommendationService', () => {
       const result = await service.getRecommendationsByJobId(job_id);
       expect(result).toEqual(mockResponse.data);
       expect(mockHttpService.get).toHaveBeenCalledWith(
-        expect.stringContaining(`/recommendations/${job_id}`)
+        expect.stringContaining(`/recommendations/${job_id}`),
+        { params: {} }
       );
     });
 
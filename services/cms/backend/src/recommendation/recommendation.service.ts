@@ -11,12 +11,12 @@ export class RecommendationService {
     this.baseUrl = process.env.JOB_SERVICE_URL || 'http://job_service_backend:9000';
   }
 
-  async createRecommendations(job_id: string) {
+  async createRecommendations(job_id: string, options: { top_k?: number; min_similarity?: number } = {}) {
     this.logger.debug(`Calling POST ${this.baseUrl}/recommendation for job: ${job_id}`);
     try {
       const response = await firstValueFrom(
         this.httpService.post(`${this.baseUrl}/recommendations`, null, {
-          params: { job_id },
+          params: { job_id, ...options },
         }),
       );
       this.logger.debug(`Success response from createRecommendations()`, response.data);
@@ -37,11 +37,11 @@ export class RecommendationService {
     }
   }
 
-  async getRecommendationsByJobId(job_id: string) {
+  async getRecommendationsByJobId(job_id: string, query: Record<string, any> = {}) {
     this.logger.debug(`Calling GET ${this.baseUrl}/recommendations/${job_id}`);
     try {
       const response = await firstValueFrom(
-        this.httpService.get(`${this.baseUrl}/recommendations/${job_id}`),
+        this.httpService.get(`${this.baseUrl}/recommendations/${job_id}`, { params: query }),
       );
       this.logger.debug(`Success [getRecommendationsByJobId(${job_id})]`);
       return response.data;
@@ -1,6 +1,6 @@
 "use client";
 
-import { useState, useEffect } from "react";
+import { useState, useEffect, useRef } from "react";
 import { useParams, useRouter, useSearchParams } from "next/navigation";
 import {
   Application,
@@ -11,6 +11,7 @@ import {
 import {
   getGeminiRecommendations,
   getJobApplications,
+  getApplicationDetails,
   getOpenJobs,
   updateShortlist,
   fetchAllUsers,
@@ -43,6 +44,10 @@ export default function ApplicationList() {
   const jobId = params.jobId as string;
 
   const [applications, setApplications] = useState<Application[]>([]);
+  // cursor of the next page of applicants, and whether pages past the first were loaded
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const loadedMore = useRef(false);
   const [selectedApp, setSelectedApp] = useState<Application | null>(null);
   const [showShortlistPopup, setShowShortlistPopup] = useState(false);
   const [popupType, setPopupType] = useState<"screening" | "interview">(
@@ -121,10 +126,20 @@ export default function ApplicationList() {
     }
   };
 
-  const handleRecommend = async (application: Application) => {
-    setProcessingAppId(application._id);
+  // the table lists summaries; a popup shows the reasoning, so it gets the full application
+  const selectApplication = (application: Application | null) => {
+    setSelectedApp(application);
+    if (!application) return;
+    getApplicationDetails(application).then((detailed) =>
+      setSelectedApp((current) => (current?._id === detailed._id ? detailed : current))
+    );
+  };
+
+  const handleRecommend = async (summary: Application) => {
+    setProcessingAppId(summary._id);
     setRecommendationError(null);
     try {
+      const application = await getApplicationDetails(summary);
       const jobsResponse = await getOpenJobs();
       if (!jobsResponse.success) throw new Error(jobsResponse.error);
 
@@ -243,11 +258,44 @@ export default function ApplicationList() {
     return () => clearInterval(interval);
   };
 
+  // reloads the first page; applicants of the pages loaded with "Load more" are kept
+  const refreshApplications = async () => {
+    const resp = await getJobApplications(jobId);
+    if (!resp.success) return;
+    const firstPage = new Set(resp.applications.map((app: Application) => app._id));
+    setApplications((prev) =>
+      loadedMore.current
+        ? [...resp.applications, ...prev.filter((app) => !firstPage.has(app._id))]
+        : resp.applications
+    );
+    if (!loadedMore.current) setNextCursor(resp.next_cursor);
+  };
+
+  const loadMoreApplications = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const resp = await getJobApplications(jobId, nextCursor);
+      if (resp.success) {
+        loadedMore.current = true;
+        setApplications((prev) => {
+          const loaded = new Set(prev.map((app) => app._id));
+          return [...prev, ...resp.applications.filter((app: Application) => !loaded.has(app._id))];
+        });
+        setNextCursor(resp.next_cursor);
+      } else {
+        toast.error("Failed to load more applicants");
+      }
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   useEffect(() => {
+    loadedMore.current = false;
     const loadApplications = async () => {
       try {
-        const resp = await getJobApplications(jobId);
-        if (resp.success) setApplications(resp.applications);
+        await refreshApplications();
       } catch (error) {
         console.error("Failed to load applications:", error);
         router.push("/");
@@ -407,7 +455,7 @@ export default function ApplicationList() {
               fromHM={!!fromHM}
               handleRecommend={handleRecommend}
               processingAppId={processingAppId}
-              setSelectedApp={setSelectedApp}
+              setSelectedApp={selectApplication}
               setShowShortlistPopup={setShowShortlistPopup}
               setPopupType={setPopupType}
               dateSortOrder={dateSortOrder}
@@ -416,6 +464,17 @@ export default function ApplicationList() {
               setScoreSortOrder={setScoreSortOrder}
             />
           )}
+          {!showRecommendations && nextCursor && (
+            <div className="flex justify-center mt-4">
+              <button
+                onClick={loadMoreApplications}
+                disabled={loadingMore}
+                className="px-4 py-2 rounded-xl bg-[#FF8A00]/10 text-[#FF6A00] hover:bg-[#FF8A00]/20 disabled:opacity-50"
+              >
+                {loadingMore ? "Loading..." : "Load more applicants"}
+              </button>
+            </div>
+          )}
           {showEmptyState && (
             <div className="empty-state">
               <div className="empty-state-content">
@@ -445,10 +504,7 @@ export default function ApplicationList() {
               application={selectedApp}
               type={popupType}
               onClose={() => setSelectedApp(null)}
-              refreshApplications={async () => {
-                const resp = await getJobApplications(jobId);
-                if (resp.success) setApplications(resp.applications);
-              }}
+              refreshApplications={refreshApplications}
             />
           )}
 
@@ -460,10 +516,7 @@ export default function ApplicationList() {
                 setShowShortlistPopup(false);
                 setSelectedApp(null);
               }}
-              refreshApplications={async () => {
-                const resp = await getJobApplications(jobId);
-                if (resp.success) setApplications(resp.applications);
-              }}
+              refreshApplications={refreshApplications}
             />
           )}
         </div>
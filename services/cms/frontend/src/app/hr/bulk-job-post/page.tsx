@@ -26,12 +26,16 @@ import {
 } from "@/components/ui/select";
 import { motion } from "framer-motion";
 import { RichTextEditor } from "@/components/ui/rich-text-editor";
-import { jobPost, bulkUpload, getJobs } from "@/lib/api";
+import { jobPost, bulkUpload, getBulkBatch, getAllJobs } from "@/lib/api";
 
 // Add bulk upload types
 type JobOption = "existing" | "form" | "file";
 type Job = { _id: string; title: string };
 
+const BATCH_POLL_INTERVAL_MS = 2000;
+// stop waiting after this long; the batch keeps running and its applicants appear on the job
+const BATCH_POLL_TIMEOUT_MS = 60 * 60 * 1000;
+
 const formSchema = z.object({
   title: z.string().min(2, { message: "Job title must be at least 2 characters." }),
   summary: z.string().min(10, { message: "Summary must be at least 10 characters." }),
@@ -76,7 +80,7 @@ export default function BulkJobPostingForm() {
     const fetchJobs = async () => {
       try {
         const [jobsResponse] = await Promise.all([
-          getJobs(),
+          getAllJobs(),
         ]);
 
         if (jobsResponse.success && jobsResponse.jobs) {
@@ -144,9 +148,14 @@ export default function BulkJobPostingForm() {
           break;
       }
 
-      const result = await bulkUpload(formData);
+      let result = await bulkUpload(formData);
       if (result.success) {
-        setApplicants(result.applicants);
+        // Resumes are processed in the background; poll until the batch finishes
+        if (result.batch_id) {
+          toast.info(`Processing ${result.resume_count} resumes...`);
+          result = await waitForBatch(result.batch_id);
+        }
+        setApplicants(result.applicants || []);
         setFailedResumes(result.failed_resumes || []); // Update failed resumes
         toast.success(`Processed ${result.processed_count} resumes`);
 
@@ -170,6 +179,30 @@ export default function BulkJobPostingForm() {
     }
   };
 
+  const waitForBatch = async (batchId: string) => {
+    const deadline = Date.now() + BATCH_POLL_TIMEOUT_MS;
+    while (Date.now() < deadline) {
+      await new Promise((resolve) => setTimeout(resolve, BATCH_POLL_INTERVAL_MS));
+      const progress = await getBulkBatch(batchId);
+      if (!progress.success) {
+        return progress;
+      }
+      const batch = progress.batch;
+      if (batch.status !== "processing") {
+        return {
+          success: batch.status === "completed",
+          error: batch.error,
+          processed_count: batch.processed_count,
+          failed_resumes: batch.failed_resumes,
+        };
+      }
+    }
+    return {
+      success: false,
+      error: "Still processing after an hour; check the job's applications later",
+    };
+  };
+
   return (
     <>
       <motion.div className="w-full max-w-4xl mx-auto px-4" style={{ backgroundColor: '#fff' }}>
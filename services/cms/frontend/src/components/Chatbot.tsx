@@ -2,7 +2,7 @@
 
 import { useState, useEffect } from "react";
 import { Job, Application } from "./jobs/types";
-import { getJobApplications } from "@/lib/api";
+import { getAllJobApplications, getApplicationDetails } from "@/lib/api";
 import { GoogleGenerativeAI } from "@google/generative-ai";
 
 
@@ -175,7 +175,7 @@ ${interview}
             botResponse = "Please select a job first.";
           } else {
             try {
-              const resp = await getJobApplications(selectedJob._id);
+              const resp = await getAllJobApplications(selectedJob._id);
               if (resp.success && resp.applications) {
                 setApplications(resp.applications);
                 setCurrentStep("selectApplicant");
@@ -212,7 +212,7 @@ ${interview}
         setSelectedJob(job);
         setCurrentStep("selectApplicant");
 
-        const resp = await getJobApplications(job._id);
+        const resp = await getAllJobApplications(job._id);
         if (resp.success && resp.applications) {
           setApplications(resp.applications);
           const selectionMessage = getSelectionMessage(
@@ -244,7 +244,8 @@ ${interview}
     } else if (currentStep === "selectApplicant") {
       const selection = parseInt(input) - 1;
       if (selection >= 0 && selection < applications.length) {
-        const app = applications[selection];
+        // the list holds summaries; the prompt needs the parsed CV and reasoning
+        const app = await getApplicationDetails(applications[selection]);
         setSelectedApplication(app);
         setCurrentStep("askQuestion");
         setMessages((prev) => [
@@ -30,7 +30,7 @@ import {
   BarChart,
   LineChart,
 } from "recharts";
-import { getJobs, getApplications } from "@/lib/api";
+import { getAllJobs, getApplications } from "@/lib/api";
 
 const genderConfig = {
   female: {
@@ -63,7 +63,7 @@ export default function Dashboard() {
     const fetchData = async () => {
       try {
         const [jobsResponse, applicationsResponse] = await Promise.all([
-          getJobs(),
+          getAllJobs(),
           getApplications(),
         ]);
 
@@ -38,6 +38,9 @@ export const JobList = () => {
   } | null>(null);
   const [currentPage, setCurrentPage] = useState(1);
   const jobsPerPage = 10;
+  // cursor of the next server page; null once every job is loaded
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [searchQuery, setSearchQuery] = useState("");
   const [sortField, setSortField] = useState("date"); 
   const [selectedFilter, setSelectedFilter] = useState<string | null>("date"); 
@@ -50,6 +53,7 @@ export const JobList = () => {
         const data = await getJobs();
         if (data.success && data.jobs) {
           setJobs(data.jobs);
+          setNextCursor(data.next_cursor);
         } else {
           setError(data.error || 'Failed to load jobs');
         }
@@ -66,6 +70,22 @@ export const JobList = () => {
     setCurrentPage(1);
   }, [searchQuery]);
 
+  const loadMoreJobs = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const data = await getJobs(nextCursor);
+      if (data.success && data.jobs) {
+        setJobs((prev) => [...prev, ...data.jobs]);
+        setNextCursor(data.next_cursor);
+      } else {
+        setError(data.error || 'Failed to load jobs');
+      }
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleStatusChange = async (
     jobId: string,
     newStatus: string,
@@ -381,6 +401,14 @@ const handlePageChange = (page: number) => {
         </div>
       )}
 
+      {nextCursor && (
+        <div className="flex justify-center mt-4">
+          <Button variant="outline" onClick={loadMoreJobs} disabled={loadingMore}>
+            {loadingMore ? "Loading..." : "Load more jobs"}
+          </Button>
+        </div>
+      )}
+
     </div>
   );
 };
\ No newline at end of file
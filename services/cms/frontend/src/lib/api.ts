@@ -98,13 +98,41 @@ const getAuthHeaders = (): Record<string, string> => {
   return token ? { "Authorization": `Bearer ${token}` } : {};
 };
 
+// List endpoints are cursor paginated: one page per call, with the cursor of the next one
+const fetchPage = async (url: string, params: Record<string, string> = {}, cursor?: string | null) => {
+  const query = new URLSearchParams({ ...params, ...(cursor ? { cursor } : {}) });
+  const res = await fetch(`${url}?${query}`, { headers: { ...getAuthHeaders() } });
+  const data = await res.json();
+  return data.success ? { ...data, next_cursor: data.next_cursor || null } : data;
+};
+
+// Follows next_cursor through every page; only for views that need the whole set (statistics, pickers)
+const fetchAllPages = async (url: string, key: string, params: Record<string, string> = {}) => {
+  const items: any[] = [];
+  let cursor: string | null = null;
+  do {
+    const data = await fetchPage(url, params, cursor);
+    if (!data.success) {
+      return data;
+    }
+    items.push(...(data[key] || []));
+    cursor = data.next_cursor;
+  } while (cursor);
+  return { success: true, [key]: items };
+};
+
 // ----- JOBS ENDPOINTS -----
-export async function getJobs() {
+export async function getJobs(cursor?: string | null) {
   try {
-    const headers = { ...getAuthHeaders() };
-    const res = await fetch(`${API_BASE}/jobs`, { headers });
-    const data = await res.json();
-    return data; 
+    return await fetchPage(`${API_BASE}/jobs`, {}, cursor);
+  } catch (error: any) {
+    return { success: false, error: error.message || "Failed to fetch jobs" };
+  }
+}
+
+export async function getAllJobs() {
+  try {
+    return await fetchAllPages(`${API_BASE}/jobs`, "jobs");
   } catch (error: any) {
     return { success: false, error: error.message || "Failed to fetch jobs" };
   }
@@ -148,11 +176,18 @@ export async function updateJob(id: string, jobData: any) {
   }
 }
 
-export async function getJobApplications(jobId: string) {
+// summary view: the parsed CV and reasoning are fetched per application by getApplicationDetails
+export async function getJobApplications(jobId: string, cursor?: string | null) {
   try {
-    const res = await fetch(`${API_BASE}/jobs/${jobId}/applications`, { headers: { ...getAuthHeaders() } });
-    const data = await res.json();
-    return data; 
+    return await fetchPage(`${API_BASE}/jobs/${jobId}/applications`, {}, cursor);
+  } catch (error: any) {
+    return { success: false, error: error.message || "Failed to fetch applications for job" };
+  }
+}
+
+export async function getAllJobApplications(jobId: string) {
+  try {
+    return await fetchAllPages(`${API_BASE}/jobs/${jobId}/applications`, "applications");
   } catch (error: any) {
     return { success: false, error: error.message || "Failed to fetch applications for job" };
   }
@@ -175,7 +210,7 @@ export async function createApplication(appData: any) {
 
 export async function getApplications() {
   try {
-    const jobsResponse = await getJobs();
+    const jobsResponse = await getAllJobs();
     if (!jobsResponse.success) {
       return { success: false, error: jobsResponse.error || "Failed to fetch jobs" };
     }
@@ -183,7 +218,7 @@ export async function getApplications() {
     // Fetch applications for each job
     let mergedApplications: any[] = [];
     for (const job of jobsResponse.jobs) {
-      const applicationsResponse = await getJobApplications(job._id);
+      const applicationsResponse = await getAllJobApplications(job._id);
       if (applicationsResponse.success) {
         mergedApplications = mergedApplications.concat(applicationsResponse.applications);
       } else {
@@ -199,7 +234,7 @@ export async function getApplications() {
 
 export async function getApplicationById(id: string) {
   try {
-    const res = await fetch(`${API_BASE}/applications/${id}`);
+    const res = await fetch(`${API_BASE}/applications/${id}`, { headers: { ...getAuthHeaders() } });
     const data = await res.json();
     return data; 
   } catch (error: any) {
@@ -207,6 +242,21 @@ export async function getApplicationById(id: string) {
   }
 }
 
+// Fills a listed (summary) application with its full screening and interview
+// documents, for the views that show the parsed CV or the reasoning.
+export async function getApplicationDetails<T extends { _id: string; screening?: any; interview?: any }>(application: T): Promise<T> {
+  const resp = await getApplicationById(application._id);
+  if (!resp.success || !resp.application) {
+    console.error(`Failed to fetch details of application ${application._id}:`, resp.error);
+    return application;
+  }
+  return {
+    ...application,
+    screening: resp.application.screening ?? application.screening,
+    interview: resp.application.interview ?? application.interview,
+  };
+}
+
 export async function getMe() {
   try {
     const res = await fetch(`${API_BASE}/users/me/name`, { headers: { ...getAuthHeaders() } });
@@ -582,6 +632,21 @@ export const bulkUpload = async (formData: FormData)=> {
     return { success: false, error: "Bulk upload failed" };
   }
 };
+export const getBulkBatch = async (batchId: string) => {
+  try {
+    const response = await fetch(`${API_BASE}/bulk/batches/${batchId}`, {
+      headers: { ...getAuthHeaders() },
+    });
+    if (!response.ok) {
+      const errorData = await response.json();
+      return { success: false, error: errorData.error || errorData.message || "Failed to fetch bulk progress" };
+    }
+    return await response.json();
+  } catch (error) {
+    console.error("Failed to fetch bulk progress:", error);
+    return { success: false, error: "Failed to fetch bulk progress" };
+  }
+};
 export const uploadJobFile = async (jobFile: File, additionalFields: Record<string, any> = {}) => {
   const url = `${API_BASE}/jobs/job_with_file`;
   const formData = new FormData();
@@ -621,7 +686,7 @@ export const uploadJobFile = async (jobFile: File, additionalFields: Record<stri
 
 
 export async function getOpenJobs() {
-  return getJobs(); // Reuse existing getJobs function
+  return getAllJobs(); // every job is a recommendation candidate
 }
 
 interface GeminiRecommendRequest {
@@ -3,6 +3,7 @@ from fastapi import Request, Depends
 from motor.motor_asyncio import AsyncIOMotorClient
 import redis
 from src.api.core.config import get_settings
+from src.api.db.indexes import ensure_indexes
 
 def setup_dependencies(app):
     settings = get_settings()
@@ -11,6 +12,11 @@ def setup_dependencies(app):
     mongo_client = AsyncIOMotorClient(settings.MONGO_URI)
     app.state.mongo_client = mongo_client
     app.state.mongo_db = mongo_client[settings.MONGO_DB]
+
+    async def create_indexes():
+        await ensure_indexes(app.state.mongo_db)
+
+    app.add_event_handler("startup", create_indexes)
     
     # Redis setup
     app.state.redis_client = redis.Redis.from_url(settings.REDIS_URI, db=0)
@@ -0,0 +1,83 @@
+"""
+Indexes for the collections interview_ai queries, created idempotently at startup.
+
+    python -m src.api.db.indexes            # create the indexes
+    python -m src.api.db.indexes --check    # explain() the hot queries, exit 1 on a COLLSCAN
+    python -m src.api.db.indexes --migrate  # remove the duplicates that block a unique index first
+"""
+import argparse
+import asyncio
+import logging
+import sys
+from mongo_indexes import check_query_plans_async, ensure_indexes_async, remove_duplicates_async
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING
+from src.api.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# (collection, keys, options); shared indexes match job_service's definitions exactly
+INDEXES = [
+    ("interviews", [("application_id", ASCENDING)], {}),
+    # one web screening per application (job_id unset) and one per recommended job
+    ("screening_results", [("application_id", ASCENDING), ("job_id", ASCENDING)], {"unique": True}),
+    ("technical_assessments", [("assessment_id", ASCENDING)], {"unique": True}),
+]
+
+# (collection, filter, sort) for the queries that must be served by an index
+HOT_QUERIES = [
+    ("interviews", {"application_id": "000000000000000000000000"}, None),
+    ("screening_results", {"application_id": "000000000000000000000000"}, None),
+    ("technical_assessments", {"assessment_id": "00000000-0000-0000-0000-000000000000"}, None),
+]
+
+
+# (collection, fields) of unique indexes over data written before they existed;
+# recommendation runs inserted a screening_results row per run, the newest is kept
+DEDUPE = [
+    ("screening_results", ["application_id", "job_id"]),
+]
+
+
+async def ensure_indexes(db, indexes=INDEXES):
+    """Creates the missing indexes; returns the ones that could not be created."""
+    return await ensure_indexes_async(db, indexes)
+
+
+async def check_query_plans(db, queries=HOT_QUERIES):
+    """Returns the hot queries whose winning plan is a COLLSCAN."""
+    return await check_query_plans_async(db, queries)
+
+
+async def migrate(db):
+    for collection, fields in DEDUPE:
+        await remove_duplicates_async(db, collection, fields)
+
+
+async def run(check, migrate_first):
+    settings = get_settings()
+    client = AsyncIOMotorClient(settings.MONGO_URI)
+    try:
+        db = client[settings.MONGO_DB]
+        if migrate_first:
+            await migrate(db)
+        failed = await ensure_indexes(db)
+        collscans = await check_query_plans(db) if check else []
+        return not failed and not collscans
+    finally:
+        client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="explain() the hot queries and fail on a COLLSCAN")
+    parser.add_argument("--migrate", action="store_true", help="remove duplicates under unique indexes first")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if not asyncio.run(run(args.check, args.migrate)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
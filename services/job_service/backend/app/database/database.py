@@ -1,4 +1,4 @@
-from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorClient
 import logging
 from app.utils.config_local import Config
 
@@ -11,7 +11,8 @@ class Database:
             raise ValueError("Failed!")
         try:
 
-            self.client = MongoClient(mongo_uri)
+            # async client: queries are awaited and never block the event loop
+            self.client = AsyncIOMotorClient(mongo_uri)
             logger.info('database connected successfully')
         except Exception as e:
             logger.error("faild to connect to the database")
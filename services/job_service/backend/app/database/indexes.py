@@ -0,0 +1,167 @@
+"""
+Indexes for the collections job_service queries, created idempotently at startup.
+
+    python -m app.database.indexes            # create the indexes
+    python -m app.database.indexes --check    # explain() the hot queries and pipelines, exit 1 on a bad plan
+    python -m app.database.indexes --migrate  # clean up and backfill data first, then create them
+
+Existing deployments run --migrate once, before deploying: unique indexes added
+later cannot be built over the duplicates written before them (startup only logs
+that), and applications screened before screening_score existed need it backfilled.
+"""
+import argparse
+import asyncio
+import logging
+import sys
+from mongo_indexes import (
+    check_pipeline_plans_async, check_query_plans_async, drop_changed_indexes_async, ensure_indexes_async,
+    remove_duplicates_async,
+)
+from pymongo import ASCENDING, DESCENDING
+from app.database.database import database
+from app.database.models.recommendation_model import RECOMMENDATION_FIELDS, RecommendationDocument
+
+logger = logging.getLogger(__name__)
+
+# (collection, keys, options). The other services declare the indexes they share
+# with identical keys and options, so whichever service starts first creates them.
+INDEXES = [
+    ("applications", [("job_id", ASCENDING), ("_id", DESCENDING)], {}),
+    ("applications", [("job_id", ASCENDING), ("screening_score", DESCENDING), ("_id", DESCENDING)], {}),
+    ("applications", [("candidate_id", ASCENDING), ("job_id", ASCENDING)], {}),
+    # one web screening per application (job_id unset) and one per recommended job
+    ("screening_results", [("application_id", ASCENDING), ("job_id", ASCENDING)], {"unique": True}),
+    # recommendation scores already stored for a job
+    ("screening_results", [("job_id", ASCENDING)], {}),
+    # candidates without an email are stored without the field
+    ("candidates", [("email", ASCENDING)], {"unique": True, "sparse": True}),
+    ("interviews", [("application_id", ASCENDING)], {}),
+    # one row per application and run; the listing keeps each application's best score
+    ("recommendations", [("job_id", ASCENDING), ("application_id", ASCENDING), ("score", DESCENDING), ("created_at", DESCENDING)], {}),
+    ("short_list", [("job_id", ASCENDING)], {"unique": True}),
+    ("short_list", [("hiring_manager_id", ASCENDING)], {}),
+    ("jobs", [("job_status", ASCENDING), ("_id", DESCENDING)], {}),
+    ("job_analysis_cache", [("job_ids", ASCENDING)], {}),
+    # extracted CV text, found by content digest or by file URL
+    ("extracted_texts", [("digest", ASCENDING)], {"unique": True, "sparse": True}),
+    ("extracted_texts", [("file_url", ASCENDING)], {}),
+]
+
+# (collection, filter, sort) for the queries that must be served by an index
+HOT_QUERIES = [
+    ("applications", {"job_id": "000000000000000000000000"}, [("_id", DESCENDING)]),
+    ("applications", {"job_id": "000000000000000000000000"}, [("screening_score", DESCENDING), ("_id", DESCENDING)]),
+    ("applications", {"candidate_id": "000000000000000000000000", "job_id": "000000000000000000000000"}, None),
+    ("screening_results", {"application_id": "000000000000000000000000", "job_id": {"$in": [None]}}, None),
+    ("screening_results", {"job_id": "000000000000000000000000"}, None),
+    ("candidates", {"email": "candidate@example.com"}, None),
+    ("interviews", {"application_id": "000000000000000000000000"}, None),
+    ("recommendations", {"job_id": "000000000000000000000000"}, [("application_id", ASCENDING), ("score", DESCENDING), ("created_at", DESCENDING)]),
+    ("short_list", {"job_id": "000000000000000000000000"}, None),
+    ("short_list", {"hiring_manager_id": "000000000000000000000000"}, None),
+    ("jobs", {"job_status": "open"}, [("_id", DESCENDING)]),
+    ("job_analysis_cache", {"job_ids": "000000000000000000000000"}, None),
+    ("extracted_texts", {"digest": "0" * 64}, None),
+    ("extracted_texts", {"file_url": "https://example.com/cv.pdf"}, None),
+]
+
+# (collection, pipeline) for the aggregations whose leading $match/$sort must be served by an index
+HOT_PIPELINES = [
+    ("recommendations", RecommendationDocument.listing_pipeline(
+        "000000000000000000000000", {field: 1 for field in RECOMMENDATION_FIELDS},
+    )),
+]
+
+
+# (collection, fields) of unique indexes over data written before they existed;
+# recommendation runs inserted a screening_results row per run, the newest is kept
+DEDUPE = [
+    ("screening_results", ["application_id", "job_id"]),
+]
+# bulk resumes without an email used to share this address
+PLACEHOLDER_EMAIL = "unknown@example.com"
+
+
+async def ensure_indexes(db=None, indexes=INDEXES):
+    """Creates the missing indexes; returns the ones that could not be created."""
+    return await ensure_indexes_async(db if db is not None else database.db, indexes)
+
+
+async def check_query_plans(db=None, queries=HOT_QUERIES):
+    """Returns the hot queries whose winning plan is a COLLSCAN."""
+    return await check_query_plans_async(db if db is not None else database.db, queries)
+
+
+async def check_pipeline_plans(db=None, pipelines=HOT_PIPELINES):
+    """Returns the hot pipelines whose query layer scans the collection or sorts in memory."""
+    return await check_pipeline_plans_async(db if db is not None else database.db, pipelines)
+
+
+# copies each application's own screening score (no job_id) onto applications
+# written before the screening consumer started setting screening_score
+BACKFILL_SCREENING_SCORE = [
+    {"$match": {"screening_score": {"$exists": False}}},
+    {"$lookup": {
+        "from": "screening_results",
+        "let": {"app_id": {"$toString": "$_id"}},
+        "pipeline": [
+            {"$match": {"$expr": {"$eq": ["$application_id", "$$app_id"]}, "job_id": {"$in": [None]}}},
+            {"$project": {"_id": 0, "score": 1}},
+            {"$limit": 1},
+        ],
+        "as": "screening",
+    }},
+    {"$match": {"screening.score": {"$ne": None}}},
+    {"$project": {"screening_score": {"$arrayElemAt": ["$screening.score", 0]}}},
+    {"$merge": {"into": "applications", "on": "_id", "whenMatched": "merge", "whenNotMatched": "discard"}},
+]
+
+
+async def backfill_screening_scores(db=None):
+    """Sets applications.screening_score from the screening results stored before it existed."""
+    db = db if db is not None else database.db
+    missing = await db["applications"].count_documents({"screening_score": {"$exists": False}})
+    await db["applications"].aggregate(BACKFILL_SCREENING_SCORE, allowDiskUse=True).to_list(None)
+    left = await db["applications"].count_documents({"screening_score": {"$exists": False}})
+    logger.info(f"Backfilled screening_score on {missing - left} applications ({left} have no screening yet)")
+
+
+async def migrate(db=None):
+    """
+    Makes INDEXES buildable and the data they serve complete: removes DEDUPE
+    duplicates, takes the placeholder email off candidates, drops indexes whose
+    options changed (candidates.email became sparse) and backfills
+    applications.screening_score, which score-ordered listings read. Candidates
+    sharing a real email are left to merge by hand.
+    """
+    db = db if db is not None else database.db
+    for collection, fields in DEDUPE:
+        await remove_duplicates_async(db, collection, fields)
+    result = await db["candidates"].update_many({"email": PLACEHOLDER_EMAIL}, {"$unset": {"email": ""}})
+    logger.info(f"Removed the placeholder email from {result.modified_count} candidates")
+    await drop_changed_indexes_async(db, INDEXES)
+    await backfill_screening_scores(db)
+
+
+async def run(check, migrate_first):
+    if migrate_first:
+        await migrate()
+    failed = await ensure_indexes()
+    collscans = await check_query_plans() if check else []
+    bad_pipelines = await check_pipeline_plans() if check else []
+    return not failed and not collscans and not bad_pipelines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="explain() the hot queries and pipelines and fail on a bad plan")
+    parser.add_argument("--migrate", action="store_true", help="remove duplicates and changed indexes and backfill screening_score first")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if not asyncio.run(run(args.check, args.migrate)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
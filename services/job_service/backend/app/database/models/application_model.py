@@ -7,7 +7,19 @@ from pymongo import ReturnDocument, errors
 from app.database.models.candidate_model import CandidateDocument
 from app.database.models.interview_model import InterviewsDocument
 from app.database.models.screen_result_model import ScreeningResultDocument
+from app.utils.pagination import keyset_filter, page_size, paginate
 logger = logging.getLogger(__name__)
+
+RELATED_DOCUMENTS = ("candidate", "screening", "interview")
+# list endpoints sort by newest application or by the score copied from screening
+APPLICATION_SORT_FIELDS = {"date": "_id", "score": "screening_score"}
+# large fields only needed on the application detail view
+SUMMARY_EXCLUDED_FIELDS = (
+    "screening.parsed_cv",
+    "screening.reasoning",
+    "screening.original_message",
+    "interview.interview_reasoning",
+)
 class BaseDocument:
     """Base class for common database operations."""
     collection_name = ""
@@ -21,7 +33,7 @@ class ApplicationDocument(BaseDocument):
     collection_name = "applications"
 
     @classmethod
-    def create_application(cls, application_data):
+    async def create_application(cls, application_data):
         application_data.update({
             "date": datetime.utcnow(),
             
@@ -31,6 +43,8 @@ class ApplicationDocument(BaseDocument):
             "created_at": datetime.utcnow(),
             "candidate_id": application_data["candidate_id"],
             "cv_link": application_data["cv_link"],
+            # SHA-256 of the CV bytes; extraction and screening caches key on it
+            "cv_digest": application_data.get("cv_digest"),
             "application_status":"pending",
             "shortlisted": False,
             "shortlist_comments": [],
@@ -39,12 +53,12 @@ class ApplicationDocument(BaseDocument):
         }
         try:
 
-            result = cls.get_collection().insert_one(application_data)
-            new_application = cls.get_collection().find_one({"_id": result.inserted_id})
+            result = await cls.get_collection().insert_one(application_data)
+            new_application = await cls.get_collection().find_one({"_id": result.inserted_id})
             
             # Update the corresponding job's applications array.
             # Here we assume job_id is stored as an ObjectId reference.
-            database.get_collection("applications").update_one(
+            await database.get_collection("applications").update_one(
                 {"_id": application_data["job_id"]},
                 {"$push": {"applications": result.inserted_id}}
             )
@@ -58,23 +72,24 @@ class ApplicationDocument(BaseDocument):
             raise Exception(f"Error creating application: {e}")
 
     @classmethod
-    def get_application_by_id(cls, application_id):
+    async def get_application_by_id(cls, application_id):
         try:
-            application = cls.get_collection().find_one({"_id": ObjectId(application_id)})
+            application = await cls.get_collection().find_one({"_id": ObjectId(application_id)})
             if application:
                 application["_id"] = str(application["_id"])
                 application["job_id"] = str(application["job_id"])
-                print("application found{}")
-            logger.info(f"no application found{application} {application_id}")
+                logger.debug(f"Application {application_id} found")
+            else:
+                logger.info(f"No application found for {application_id}")
             return application
         except errors.PyMongoError as e:
         
             logger.error(f"Error fetching application by id: {e} {application_id}")
             raise Exception(f"Error fetching application by id: {e} {application_id}")
     @classmethod
-    def get_application_by_candidate_job(cls, candidate_id , job_id):
+    async def get_application_by_candidate_job(cls, candidate_id , job_id):
         try:
-            application = cls.get_collection().find_one({"candidate_id": candidate_id, "job_id": job_id})
+            application = await cls.get_collection().find_one({"candidate_id": candidate_id, "job_id": job_id})
             if application:
                 application["_id"] = str(application["_id"])
                 application["job_id"] = str(application["job_id"])
@@ -83,10 +98,10 @@ class ApplicationDocument(BaseDocument):
             logger.error(f"Error fetching application by candidate_id")
     
     @classmethod
-    def delete_by_id(cls, application_id):
+    async def delete_by_id(cls, application_id):
         """Deletes an application by its ID."""
         try:
-            result = cls.get_collection().delete_one({"_id": ObjectId(application_id)})
+            result = await cls.get_collection().delete_one({"_id": ObjectId(application_id)})
             if result.deleted_count == 0:
                 logger.warning(f"Attempted to delete application {application_id}, but it was not found.")
             return result.deleted_count > 0
@@ -95,11 +110,9 @@ class ApplicationDocument(BaseDocument):
             raise Exception(f"Error deleting application {application_id}: {e}")
     
     @classmethod
-    def get_applications(cls):
+    async def get_applications(cls):
         try:
-            applications = cls.get_collection().find()
-            
-            applications = list(applications)
+            applications = await cls.get_collection().find().to_list(None)
             for app in applications:
                 app["_id"] = str(app["_id"])
                 app["job_id"] = str(app["job_id"])
@@ -110,35 +123,170 @@ class ApplicationDocument(BaseDocument):
             raise Exception(f"Error fetching applications: {e}")
 
     @classmethod
-    def get_applications_by_job(cls, job_id):
+    def details_stages(cls, related=RELATED_DOCUMENTS):
+        """
+        Aggregation stages that join each application with its candidate, screening
+        result and interview in the same round-trip instead of one query per document.
+        """
+        def lookup_one(collection, let, local_field, foreign_field, name, match=None):
+            return {
+                "$lookup": {
+                    "from": collection,
+                    "let": {local_field: let},
+                    "pipeline": [
+                        {"$match": {"$expr": {"$eq": [f"${foreign_field}", f"$${local_field}"]}, **(match or {})}},
+                        {"$limit": 1},
+                    ],
+                    "as": name,
+                }
+            }
+
+        lookups = {
+            "candidate": lookup_one(
+                CandidateDocument.collection_name,
+                {"$convert": {"input": "$candidate_id", "to": "objectId", "onError": None, "onNull": None}},
+                "candidate_oid", "_id", "candidate",
+            ),
+            "screening": lookup_one(
+                ScreeningResultDocument.collection_name, {"$toString": "$_id"}, "app_id", "application_id", "screening",
+                ScreeningResultDocument.OWN_SCREENING,
+            ),
+            "interview": lookup_one(InterviewsDocument.collection_name, {"$toString": "$_id"}, "app_id", "application_id", "interview"),
+        }
+        stages = [lookups[name] for name in related]
+        if related:
+            stages.append({"$set": {name: {"$arrayElemAt": [f"${name}", 0]} for name in related}})
+        return stages
+
+    @staticmethod
+    def serialize_with_details(app, related=RELATED_DOCUMENTS):
+        app["_id"] = str(app["_id"])
+        if "job_id" in app:
+            app["job_id"] = str(app["job_id"])
+        for name in related:
+            app[name] = app.get(name)
+        if app.get("candidate"):
+            app["candidate"]["_id"] = str(app["candidate"]["_id"])
+        for name in ("screening", "interview"):
+            if app.get(name):
+                app[name]["_id"] = str(app[name]["_id"])
+                app[name]["application_id"] = str(app[name]["application_id"])
+        return app
+
+    @classmethod
+    async def get_recommendation_candidates(cls, job_id):
+        """
+        One application per candidate from other jobs to screen against `job_id`:
+        the candidate's latest application with a CV. Candidates who applied to
+        this job, or who already have a recommendation score for it, are skipped.
+        """
         try:
-            logger.debug("GETTING APP BY JOB")
-            applications_cursor = cls.get_collection().find({"job_id": job_id})
-            applications = list(applications_cursor)
-            for app in applications:
-                logger.info("REACH APPS fetching candidate")
-                app["_id"] = str(app["_id"])
-                candidate = CandidateDocument.get_candidate_by_id(app['candidate_id'])
-                screening = ScreeningResultDocument.get_by_application_id(app["_id"]) 
-                interview = InterviewsDocument.get_interview_by_app_id(app["_id"])
-                app["job_id"] = str(app["job_id"])
-                app["candidate"] = candidate
-                app['screening'] = screening
-                app['interview'] = interview
-                if app['screening']:
-                    app['screening']['_id'] = str(app['screening']['_id'])
-                if app['interview']:
-                    app['interview']['_id'] = str(app['interview']['_id'])
+            applied = await cls.get_collection().distinct("candidate_id", {"job_id": job_id})
+            # the screening consumer stores recommendation scores per (application_id, job_id)
+            scored = set(await database.get_collection(ScreeningResultDocument.collection_name).distinct(
+                "application_id", {"job_id": job_id}
+            ))
+            scored.update(await database.get_collection("recommendations").distinct("application_id", {"job_id": job_id}))
 
-            return applications
+            candidates = await cls.get_collection().aggregate([
+                {"$match": {
+                    "job_id": {"$ne": job_id},
+                    "candidate_id": {"$nin": applied},
+                    "cv_link": {"$nin": [None, ""]},
+                }},
+                {"$sort": {"_id": -1}},
+                {"$group": {
+                    "_id": "$candidate_id",
+                    "application_id": {"$first": "$_id"},
+                    "cv_link": {"$first": "$cv_link"},
+                    "cv_digest": {"$first": "$cv_digest"},
+                    "application_ids": {"$push": {"$toString": "$_id"}},
+                }},
+                # a candidate is skipped when any of their applications was scored for this job
+                {"$match": {"application_ids": {"$nin": list(scored)}}},
+                {"$project": {"_id": 0, "candidate_id": "$_id", "application_id": {"$toString": "$application_id"}, "cv_link": 1, "cv_digest": 1}},
+            ]).to_list(None)
+            return candidates
+        except errors.PyMongoError as e:
+            logger.error(f"Error selecting recommendation candidates for job {job_id}: {e}")
+            raise Exception(f"Error selecting recommendation candidates for job {job_id}: {e}")
+
+    @classmethod
+    async def get_applications_by_job(cls, job_id):
+        try:
+            applications = await cls.get_collection().aggregate(
+                [{"$match": {"job_id": job_id}}] + cls.details_stages()
+            ).to_list(None)
+            return [cls.serialize_with_details(app) for app in applications]
         except Exception as e:
             logger.error(f"Error retrieving applications for job {job_id}: {e}")
             raise Exception(f"Error retrieving applications for job {job_id}: {e}")
+
+    @classmethod
+    async def list_applications(cls, job_id=None, status=None, source=None, min_score=None, max_score=None,
+                          sort="date", limit=None, cursor=None, view="summary", fields=None, with_details=True):
+        """
+        One page of applications, newest or best-scored first, joined with their
+        related documents. Returns (applications, next_cursor).
+
+        The summary view leaves out the parsed CV and reasoning blobs; `fields`
+        restricts the top-level fields and skips the lookups that are not requested.
+        """
+        if sort not in APPLICATION_SORT_FIELDS:
+            raise ValueError(f"Unknown sort: {sort}")
+        if view not in ("summary", "full"):
+            raise ValueError(f"Unknown view: {view}")
+        sort_field = APPLICATION_SORT_FIELDS[sort]
+        limit = page_size(limit)
+
+        match = {}
+        if job_id:
+            match["job_id"] = job_id
+        if status:
+            match["application_status"] = status
+        if source:
+            match["source"] = source
+        score_range = {}
+        if min_score is not None:
+            score_range["$gte"] = min_score
+        if max_score is not None:
+            score_range["$lte"] = max_score
+        if score_range:
+            match["screening_score"] = score_range
+        keyset = keyset_filter(cursor, sort_field)
+        if keyset:
+            match = {"$and": [match, keyset]} if match else keyset
+
+        if not with_details:
+            related = ()
+        elif fields:
+            related = tuple(name for name in RELATED_DOCUMENTS if name in fields)
+        else:
+            related = RELATED_DOCUMENTS
+        pipeline = [
+            {"$match": match},
+            {"$sort": {"_id": -1} if sort_field == "_id" else {sort_field: -1, "_id": -1}},
+            {"$limit": limit + 1},
+        ] + cls.details_stages(related)
+        if fields:
+            pipeline.append({"$project": {field: 1 for field in set(fields) | {sort_field}}})
+        if view == "summary" and related:
+            pipeline.append({"$project": {
+                field: 0 for field in SUMMARY_EXCLUDED_FIELDS if field.split(".")[0] in related
+            }})
+
+        try:
+            applications = await cls.get_collection().aggregate(pipeline).to_list(None)
+        except errors.PyMongoError as e:
+            logger.error(f"Error listing applications: {e}")
+            raise Exception(f"Error listing applications: {e}")
+        applications, next_cursor = paginate(applications, limit, sort_field)
+        return [cls.serialize_with_details(app, related) for app in applications], next_cursor
     
     @classmethod
-    def reject_application(cls, application_id):
+    async def reject_application(cls, application_id):
         try:
-            cls.get_collection().update_one(
+            await cls.get_collection().update_one(
                 {"_id": ObjectId(application_id)},
                 {"$set": {"application_status": "rejected"}}
             )
@@ -148,9 +296,9 @@ class ApplicationDocument(BaseDocument):
             raise Exception(f"Error rejecting application: {e}")
     
     @classmethod
-    def accept_application(cls, application_id):
+    async def accept_application(cls, application_id):
         try:
-            cls.get_collection().update_one(
+            await cls.get_collection().update_one(
                 {"_id": ObjectId(application_id)},
                 {"$set": {"application_status": "passed"}}
             )
@@ -159,7 +307,7 @@ class ApplicationDocument(BaseDocument):
             logger.error(f"Error accepting application: {e}")
             raise Exception(f"Error accepting application: {e}")
     @classmethod
-    def update_shortlist(cls, application_id, update_data, user="default_user"):
+    async def update_shortlist(cls, application_id, update_data, user="default_user"):
         """
         Updates the shortlist status of an application. If a shortlist note is provided,
         it appends a new comment (with the comment text, user, and a timestamp) to the
@@ -181,7 +329,7 @@ class ApplicationDocument(BaseDocument):
                 update_query = {
                     "$set": {"shortlisted": update_data.get("shortlisted")}
                 }
-            updated_application = cls.get_collection().find_one_and_update(
+            updated_application = await cls.get_collection().find_one_and_update(
                 {"_id": ObjectId(application_id)},
                 update_query,
                 return_document=ReturnDocument.AFTER
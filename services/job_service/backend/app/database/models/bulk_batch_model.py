@@ -0,0 +1,110 @@
+import logging
+from app.database.database import database
+from datetime import datetime, timedelta
+from bson import ObjectId
+from pymongo import errors, ReturnDocument
+from app.utils.config_local import Config
+logger = logging.getLogger(__name__)
+class BaseDocument:
+    """Base class for common database operations."""
+    collection_name = ""
+
+    @classmethod
+    def get_collection(cls):
+        return database.get_collection(cls.collection_name)
+
+
+class BulkBatchDocument(BaseDocument):
+    """Progress of a bulk ZIP upload that is processed in the background."""
+    collection_name = "bulk_batches"
+
+    @classmethod
+    async def create_batch(cls, job_id, resume_count, hr_id=None):
+        batch = {
+            "job_id": job_id,
+            "hr_id": hr_id,
+            "status": "processing",
+            "resume_count": resume_count,
+            "processed_count": 0,
+            "error_count": 0,
+            "errors": [],
+            "failed_resumes": [],
+            "created_at": datetime.utcnow(),
+            "updated_at": datetime.utcnow(),
+        }
+        try:
+            result = await cls.get_collection().insert_one(batch)
+            return str(result.inserted_id)
+        except errors.PyMongoError as e:
+            logger.error(f"Error creating bulk batch: {e}")
+            raise Exception(f"Error creating bulk batch: {e}")
+
+    @classmethod
+    async def record_success(cls, batch_id):
+        await cls.get_collection().update_one(
+            {"_id": ObjectId(batch_id)},
+            {"$inc": {"processed_count": 1}, "$set": {"updated_at": datetime.utcnow()}}
+        )
+
+    @classmethod
+    async def record_error(cls, batch_id, error, failed_resume=None):
+        update = {
+            "$inc": {"error_count": 1},
+            "$push": {"errors": error},
+            "$set": {"updated_at": datetime.utcnow()},
+        }
+        if failed_resume:
+            update["$push"]["failed_resumes"] = failed_resume
+        await cls.get_collection().update_one({"_id": ObjectId(batch_id)}, update)
+
+    @classmethod
+    async def heartbeat(cls, batch_id):
+        """Records progress that did not finish a resume, so a long batch is not taken for stale."""
+        await cls.get_collection().update_one(
+            {"_id": ObjectId(batch_id), "status": "processing"},
+            {"$set": {"updated_at": datetime.utcnow()}}
+        )
+
+    @classmethod
+    async def finish(cls, batch_id, status="completed", error=None):
+        update = {"status": status, "updated_at": datetime.utcnow(), "finished_at": datetime.utcnow()}
+        if error:
+            update["error"] = error
+        await cls.get_collection().update_one({"_id": ObjectId(batch_id)}, {"$set": update})
+
+    @classmethod
+    async def fail_if_stale(cls, batch_id):
+        """
+        Marks the batch failed when it is still processing but made no progress in
+        Config.BULK_BATCH_STALE_SECONDS: the background task processing it is gone
+        (e.g. the service restarted), so it would otherwise stay processing forever.
+        Returns the updated batch, or None when it is not stale.
+        """
+        now = datetime.utcnow()
+        return await cls.get_collection().find_one_and_update(
+            {
+                "_id": ObjectId(batch_id),
+                "status": "processing",
+                "updated_at": {"$lt": now - timedelta(seconds=Config.BULK_BATCH_STALE_SECONDS)},
+            },
+            {"$set": {
+                "status": "failed",
+                "error": f"No progress for {Config.BULK_BATCH_STALE_SECONDS} seconds; the batch was abandoned",
+                "updated_at": now,
+                "finished_at": now,
+            }},
+            return_document=ReturnDocument.AFTER,
+        )
+
+    @classmethod
+    async def get_batch(cls, batch_id):
+        try:
+            batch = await cls.get_collection().find_one({"_id": ObjectId(batch_id)})
+            if batch and batch["status"] == "processing":
+                batch = await cls.fail_if_stale(batch_id) or batch
+            if batch:
+                batch["_id"] = str(batch["_id"])
+            return batch
+        except errors.PyMongoError as e:
+            logger.error(f"Error fetching bulk batch {batch_id}: {e}")
+            raise Exception(f"Error fetching bulk batch {batch_id}: {e}")
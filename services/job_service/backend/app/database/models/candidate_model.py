@@ -17,36 +17,44 @@ class CandidateDocument(BaseDocument):
     collection_name = "candidates"
 
     @classmethod
-    def create_candidate(cls, candidate_data):
+    async def create_candidate(cls, candidate_data):
+        """
+        Creates the candidate or updates the one with the same email, in one
+        atomic upsert, and returns its id. A candidate without an email (a bulk
+        resume the extractor found none in) is always inserted on its own and
+        stored without the field, which the sparse unique index skips.
+        """
+        candidate_data = dict(candidate_data)
+        email = candidate_data.pop("email", None)
         try:
-            # Check if a candidate with the given email already exists.
-            candidate = cls.get_collection().find_one({"email": candidate_data["email"]})
-            if candidate:
-                # Update candidate fields if needed.
-                cls.get_collection().update_one(
-                    {"_id": candidate["_id"]},
-                    {"$set": candidate_data}
-                )
-                candidate["_id"] = str(candidate["_id"])
-                return candidate["_id"]
-                
-            else:
-                # Insert new candidate. The new document will have an autogenerated _id.
-                result = cls.get_collection().insert_one(candidate_data)
-                new_candidate = cls.get_collection().find_one({"_id": result.inserted_id})
-                logger.info("Candidate created")
-                new_candidate["_id"] = str(new_candidate["_id"])
-                logger.info("Candidate created")
+            if not email:
+                result = await cls.get_collection().insert_one(candidate_data)
+                logger.info("Candidate created without email")
+                return str(result.inserted_id)
+
+            candidate_data["email"] = email
+            for attempt in range(2):
+                try:
+                    candidate = await cls.get_collection().find_one_and_update(
+                        {"email": email},
+                        {"$set": candidate_data},
+                        upsert=True,
+                        projection={"_id": 1},
+                        return_document=ReturnDocument.AFTER,
+                    )
+                    return str(candidate["_id"])
+                except errors.DuplicateKeyError:
+                    # two upserts for a new email raced; the loser matches the winner's document on retry
+                    if attempt:
+                        raise
 
-                return new_candidate["_id"]
-            
         except errors.PyMongoError as e:
             logger.error(f"Error creating/updating candidate: {e} {candidate_data}")
             raise Exception(f"Error creating/updating candidate: {e} {candidate_data}")
     @classmethod
-    def get_candidate_by_id(cls, candidate_id):
+    async def get_candidate_by_id(cls, candidate_id):
         try:
-            candidate = cls.get_collection().find_one({"_id": ObjectId(candidate_id)})
+            candidate = await cls.get_collection().find_one({"_id": ObjectId(candidate_id)})
             candidate["_id"] = str(candidate["_id"])
             return candidate
                 
@@ -57,10 +65,10 @@ class CandidateDocument(BaseDocument):
             raise Exception(f"Error fetching candidate by id: {e} {candidate_id}")
     
     @classmethod
-    def delete_by_id(cls, candidate_id):
+    async def delete_by_id(cls, candidate_id):
         """Deletes a candidate by their ID."""
         try:
-            result = cls.get_collection().delete_one({"_id": ObjectId(candidate_id)})
+            result = await cls.get_collection().delete_one({"_id": ObjectId(candidate_id)})
             if result.deleted_count == 0:
                 logger.warning(f"Attempted to delete candidate {candidate_id}, but it was not found.")
             return result.deleted_count > 0
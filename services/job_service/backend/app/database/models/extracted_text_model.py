@@ -0,0 +1,35 @@
+import logging
+from app.database.database import database
+from datetime import datetime
+from pymongo import errors
+logger = logging.getLogger(__name__)
+class BaseDocument:
+    """Base class for common database operations."""
+    collection_name = ""
+
+    @classmethod
+    def get_collection(cls):
+        return database.get_collection(cls.collection_name)
+
+
+class ExtractedTextDocument(BaseDocument):
+    """
+    Text extracted from a stored CV, keyed by the SHA-256 digest of its bytes and
+    by its file URL. screen_service reads it instead of downloading and parsing
+    the file again; both services write it with the same shape.
+    """
+    collection_name = "extracted_texts"
+
+    @classmethod
+    async def save_text(cls, file_url, text, digest=None):
+        if not text or not text.strip():
+            return
+        query = {"digest": digest} if digest else {"file_url": file_url}
+        fields = {"file_url": file_url, "text": text, "source": "job_service", "created_at": datetime.utcnow()}
+        if digest:
+            fields["digest"] = digest
+        try:
+            await cls.get_collection().update_one(query, {"$setOnInsert": fields}, upsert=True)
+        except errors.PyMongoError as e:
+            # the screen service extracts the text itself on a miss
+            logger.warning(f"Error storing extracted text for {file_url}: {e}")
@@ -17,9 +17,9 @@ class InterviewsDocument(BaseDocument):
     collection_name = "interviews"
 
     @classmethod
-    def get_interview_by_app_id(cls, application_id):
+    async def get_interview_by_app_id(cls, application_id):
         # Find screening results using the application_id foreign key.
-        result = cls.get_collection().find_one({"application_id": application_id})
+        result = await cls.get_collection().find_one({"application_id": application_id})
         if result:
             result["_id"] = str(result["_id"])
             result["application_id"] = str(result["application_id"])
@@ -3,6 +3,7 @@ from app.database.database import database
 from datetime import datetime
 from bson import ObjectId
 from pymongo import ReturnDocument, errors
+from app.utils.pagination import keyset_filter, page_size, paginate
 logger = logging.getLogger(__name__)
 class BaseDocument:
     """Base class for common database operations."""
@@ -17,23 +18,23 @@ class JobDocument(BaseDocument):
     collection_name = "jobs"
 
     @classmethod
-    def create_job(cls, job_data, hr_id):
+    async def create_job(cls, job_data, hr_id):
         job_data["created_at"] = datetime.utcnow()
         job_data["hr_id"] = hr_id
         if job_data.get("post_date", None):
             del job_data["post_date"]
             
         try:
-            result = cls.get_collection().insert_one(job_data)
-            return cls.get_collection().find_one({"_id": ObjectId(result.inserted_id)})
+            result = await cls.get_collection().insert_one(job_data)
+            return await cls.get_collection().find_one({"_id": ObjectId(result.inserted_id)})
         except errors.PyMongoError as e:
             logger.error(f"Error inserting job: {e}")
             raise Exception(f"Error inserting job: {e}")
 
     @classmethod
-    def get_job_by_id(cls, job_id):
+    async def get_job_by_id(cls, job_id):
         try:
-            job = cls.get_collection().find_one({"_id": ObjectId(job_id)})
+            job = await cls.get_collection().find_one({"_id": ObjectId(job_id)})
             if job:
                 job["_id"] = str(job["_id"])
             return job
@@ -42,9 +43,9 @@ class JobDocument(BaseDocument):
             raise Exception(f"Error fetching job by id: {e}")
     
     @classmethod
-    def get_open_job_by_id(cls, job_id):
+    async def get_open_job_by_id(cls, job_id):
         try:
-            job = cls.get_collection().find_one({"_id": ObjectId(job_id), "job_status": "open"})
+            job = await cls.get_collection().find_one({"_id": ObjectId(job_id), "job_status": "open"})
             if job:
                 job["_id"] = str(job["_id"])
             return job
@@ -53,36 +54,44 @@ class JobDocument(BaseDocument):
             raise Exception(f"Error fetching job by id: {e}")
 
     @classmethod
-    def get_all_jobs(cls):
-        try:
-            jobs = list(cls.get_collection().find())
-            for job in jobs:
-                job["_id"] = str(job["_id"])
-            return jobs
-        except errors.PyMongoError as e:
-            logger.error(f"Error fetching all jobs: {e}")
-            raise Exception(f"Error fetching all jobs: {e}")
+    async def get_all_jobs(cls, limit=None, cursor=None, fields=None):
+        return await cls.list_jobs({}, limit, cursor, fields)
+
+    @classmethod
+    async def get_all_open_jobs(cls, limit=None, cursor=None, fields=None):
+        return await cls.list_jobs({"job_status": "open"}, limit, cursor, fields)
+
     @classmethod
-    def get_all_open_jobs(cls):
+    async def list_jobs(cls, query, limit=None, cursor=None, fields=None):
+        """One page of jobs, newest first. Returns (jobs, next_cursor)."""
+        limit = page_size(limit)
+        keyset = keyset_filter(cursor)
+        if keyset:
+            query = {"$and": [query, keyset]} if query else keyset
+        projection = {field: 1 for field in fields} if fields else None
         try:
-            jobs = list(cls.get_collection().find({"job_status": "open"}))
+            jobs = await cls.get_collection().find(query, projection).sort("_id", -1).limit(limit + 1).to_list(None)
+            jobs, next_cursor = paginate(jobs, limit)
             for job in jobs:
                 job["_id"] = str(job["_id"])
-            return jobs
+            return jobs, next_cursor
         except errors.PyMongoError as e:
             logger.error(f"Error fetching all jobs: {e}")
             raise Exception(f"Error fetching all jobs: {e}")
 
     @classmethod
-    def update_job(cls, job_id, update_data):
+    async def update_job(cls, job_id, update_data):
         try:
-            updated_job = cls.get_collection().find_one_and_update(
+            updated_job = await cls.get_collection().find_one_and_update(
                 {"_id": ObjectId(job_id)},
                 {"$set": update_data},
                 return_document=ReturnDocument.AFTER
             )
             if updated_job:
                 updated_job["_id"] = str(updated_job["_id"])
+                # screen_service keys requirement weights by a hash of the description, so an edit
+                # already misses its caches; this only drops the rows of the replaced text
+                await database.get_collection("job_analysis_cache").delete_many({"job_ids": job_id})
             return updated_job
         except errors.PyMongoError as e:
             logger.error(f"Error updating job: {e}")
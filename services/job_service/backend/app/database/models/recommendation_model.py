@@ -6,7 +6,11 @@ from bson import ObjectId
 from pymongo import ReturnDocument, errors
 from app.database.models.application_model import ApplicationDocument
 from app.database.models.candidate_model import CandidateDocument
+from app.utils.pagination import keyset_filter, page_size, paginate
 logger = logging.getLogger(__name__)
+
+# fields returned by the recommendation listing unless `fields` narrows them
+RECOMMENDATION_FIELDS = ("job_id", "application_id", "score", "reasoning", "full_name", "email", "cv_link", "created_at")
 class BaseDocument:
     """Base class for common database operations."""
     collection_name = ""
@@ -20,41 +24,65 @@ class RecommendationDocument(BaseDocument):
     collection_name = "recommendations"
 
     
+    @staticmethod
+    def listing_pipeline(job_id, projection, keyset=None, limit=None):
+        """Aggregation behind get_recommendationsby_job_id; the indexes --check explains it too."""
+        pipeline = [
+            {"$match": {"job_id": job_id}},
+            # the (job_id, application_id, score, created_at) index supplies this order, so there is
+            # no in-memory sort; it does not cover the query, the rows are fetched for their fields
+            {"$sort": {"application_id": 1, "score": -1, "created_at": -1}},
+            # only the requested fields reach $group
+            {"$project": dict(projection, application_id=1)},
+            {"$group": {"_id": "$application_id", "recommendation": {"$first": "$$ROOT"}}},
+            {"$replaceRoot": {"newRoot": "$recommendation"}},
+        ]
+        # the cursor is on the collapsed rows, so every page still groups all of the job's rows
+        # (at most RECOMMENDATION_TOP_K per run); only the final sort and limit shrink with it
+        if keyset:
+            pipeline.append({"$match": keyset})
+        pipeline += [
+            {"$sort": {"score": -1, "_id": -1}},
+            {"$limit": page_size(limit) + 1},
+            {"$project": projection},
+        ]
+        return pipeline
+
     @classmethod
-    def get_recommendationsby_job_id(cls, job_id):
+    async def get_recommendationsby_job_id(cls, job_id, limit=None, cursor=None, fields=None):
+        """
+        One page of a job's recommendations, best score first. Every run appends
+        new rows, so they are collapsed to one per application (highest score,
+        then latest) in the aggregation. Returns (recommendations, next_cursor).
+        """
+        limit = page_size(limit)
+        projection = {field: 1 for field in set(fields or RECOMMENDATION_FIELDS) | {"score"}}
+        pipeline = cls.listing_pipeline(job_id, projection, keyset_filter(cursor, "score"), limit)
         try:
-            recommendations = cls.get_collection().find({"job_id": job_id})
-            logger.info("the recommended applicants are")
-            result = []
-            seen = set()
-            for recommendation in recommendations:
-                if recommendation["application_id"] in seen:
-                    continue
-                
-                seen.add(recommendation["application_id"])
-                recommendation["_id"] = str(recommendation["_id"])  # Convert _id to string
-                result.append(recommendation)
-            logger.info(result)
-            result = sorted(result, key=lambda x: x["score"], reverse=True)
-            return result
+            recommendations = await cls.get_collection().aggregate(pipeline).to_list(None)
         except errors.PyMongoError as e:
             logger.error(f"Error fetching recommend applications by job_id: {e}")
             raise Exception(f"Error fetching recommend applications by job_id: {e}")
+        recommendations, next_cursor = paginate(recommendations, limit, "score")
+        for recommendation in recommendations:
+            recommendation["_id"] = str(recommendation["_id"])
+        return recommendations, next_cursor
+
     @classmethod
-    def create_recommendation(cls, recomendation_data: RecommendationCreate):
+    async def create_recommendation(cls, recomendation_data: RecommendationCreate):
         if not recomendation_data["application_id"]:
-            result = cls.get_collection().insert_one(recomendation_data)
-            return cls.get_collection().find_one({"_id": ObjectId(result.inserted_id)})
+            result = await cls.get_collection().insert_one(recomendation_data)
+            return await cls.get_collection().find_one({"_id": ObjectId(result.inserted_id)})
 
         recomendation_data["created_at"] = datetime.utcnow()
-        applicant = ApplicationDocument.get_application_by_id(recomendation_data['application_id'])
-        candidate = CandidateDocument.get_candidate_by_id(applicant["candidate_id"])
+        applicant = await ApplicationDocument.get_application_by_id(recomendation_data['application_id'])
+        candidate = await CandidateDocument.get_candidate_by_id(applicant["candidate_id"])
         recomendation_data["full_name"] = candidate['full_name'] 
         recomendation_data['email'] = candidate['email']
         recomendation_data["cv_link"] = applicant['cv_link']
         try:
-            result = cls.get_collection().insert_one(recomendation_data)
-            return cls.get_collection().find_one({"_id": ObjectId(result.inserted_id)})
+            result = await cls.get_collection().insert_one(recomendation_data)
+            return await cls.get_collection().find_one({"_id": ObjectId(result.inserted_id)})
         except errors.PyMongoError as e:
             logger.error(f"Error inserting recommendation: {e}")
             raise Exception(f"Error inserting recommendation: {e}")
@@ -17,32 +17,35 @@ class BaseDocument:
     
 class ScreeningResultDocument(BaseDocument):
     collection_name = "screening_results"
+    # an application's own screening has no job_id; recommendation screenings of
+    # the same application for other jobs carry theirs
+    OWN_SCREENING = {"job_id": {"$in": [None]}}
 
     @classmethod
-    def create_result(cls, result_data):
+    async def create_result(cls, result_data):
         # result_data should include: application_id, parsed_cv, score, reasoning, etc.
         result_data["created_at"] = datetime.utcnow()
-        result = cls.get_collection().insert_one(result_data)
-        return cls.get_collection().find_one({"_id": result.inserted_id})
+        result = await cls.get_collection().insert_one(result_data)
+        return await cls.get_collection().find_one({"_id": result.inserted_id})
 
     @classmethod
-    def get_by_application_id(cls, application_id: str):
+    async def get_by_application_id(cls, application_id: str):
         # Find screening results using the application_id foreign key.
-        result = cls.get_collection().find_one({"application_id": application_id})
+        result = await cls.get_collection().find_one({"application_id": application_id, **cls.OWN_SCREENING})
         if result:
             result["_id"] = str(result["_id"])
             result["application_id"] = str(result["application_id"])
         return result
     
     @classmethod
-    def update_or_create_result(cls, application_id, result_data):
+    async def update_or_create_result(cls, application_id, result_data):
         """
         Updates a screening result if it exists, otherwise creates a new one.
         """
         result_data["updated_at"] = datetime.utcnow()
         
         # The filter to find the document
-        query = {"application_id": application_id}
+        query = {"application_id": application_id, **cls.OWN_SCREENING}
         
         # The update to apply
         update = {
@@ -51,7 +54,7 @@ class ScreeningResultDocument(BaseDocument):
         }
         
         # Perform the upsert operation
-        updated_document = cls.get_collection().find_one_and_update(
+        updated_document = await cls.get_collection().find_one_and_update(
             query,
             update,
             upsert=True,
@@ -60,19 +63,19 @@ class ScreeningResultDocument(BaseDocument):
         return updated_document
     
     @classmethod
-    def delete_by_application_id(cls, application_id: str):
-        """Deletes a screening result by its application_id."""
+    async def delete_by_application_id(cls, application_id: str):
+        """Deletes the application's own screening result, leaving its recommendation screenings."""
         try:
-            result = cls.get_collection().delete_one({"application_id": application_id})
+            result = await cls.get_collection().delete_one({"application_id": application_id, **cls.OWN_SCREENING})
             return result.deleted_count > 0
         except errors.PyMongoError as e:
             logger.error(f"Error deleting screening result for application {application_id}: {e}")
             raise
     
     @classmethod
-    def edit_score(cls, application_id: str, update_data: dict):
+    async def edit_score(cls, application_id: str, update_data: dict):
         try:
-            existing_doc = cls.get_collection().find_one({"application_id": application_id})
+            existing_doc = await cls.get_collection().find_one({"application_id": application_id, **cls.OWN_SCREENING})
             logger.info(f"existing doc {existing_doc}")
             
             update_fields = {"score": update_data["score"], "comment": update_data["comment"]}
@@ -80,14 +83,18 @@ class ScreeningResultDocument(BaseDocument):
             if existing_doc and "score" in existing_doc:
                 update_fields["old_score"] = existing_doc["score"]
             
-            updated_result = cls.get_collection().find_one_and_update(
-                {"application_id": application_id},
+            updated_result = await cls.get_collection().find_one_and_update(
+                {"application_id": application_id, **cls.OWN_SCREENING},
                 {"$set": update_fields},
                 return_document=ReturnDocument.AFTER
             )
             logger.info(f"updated result {updated_result}")
 
             if updated_result:
+                # applications carry a copy of the score for score-ordered listings
+                await database.get_collection("applications").update_one(
+                    {"_id": ObjectId(application_id)}, {"$set": {"screening_score": update_data["score"]}}
+                )
                 updated_result["_id"] = str(updated_result["_id"])
                 updated_result["application_id"] = str(updated_result["application_id"])
 
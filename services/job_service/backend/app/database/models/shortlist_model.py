@@ -17,16 +17,16 @@ class ShortListDocument(BaseDocument):
     collection_name = "short_list"
 
     @classmethod
-    def create_request(cls, job_id, hiring_manager_id):
+    async def create_request(cls, job_id, hiring_manager_id):
         try:
             collection = cls.get_collection()
             
             # Check if a document with the same job_id exists
-            existing_request = collection.find_one({"job_id": job_id})
+            existing_request = await collection.find_one({"job_id": job_id})
             
             if existing_request:
                 # Update hr_id if job_id exists
-                collection.update_one(
+                await collection.update_one(
                     {"job_id": job_id}, 
                     {"$set": {"hiring_manager_id": hiring_manager_id, "created_at": datetime.utcnow()}}
                 )
@@ -39,7 +39,7 @@ class ShortListDocument(BaseDocument):
                     "hiring_manager_id": hiring_manager_id,
                     "created_at": datetime.utcnow()
                 }
-                result = collection.insert_one(data)
+                result = await collection.insert_one(data)
                 data["_id"] = str(result.inserted_id)
                 return data
 
@@ -48,13 +48,13 @@ class ShortListDocument(BaseDocument):
             raise Exception(f"Error creating/updating shortlist request: {e}")
 
     @classmethod
-    def get_request_by_hr_manager(cls, hiring_manager_id):
+    async def get_request_by_hr_manager(cls, hiring_manager_id):
         # Find screening results using the application_id foreign key.
         try:
             result_data = cls.get_collection().find({"hiring_manager_id": hiring_manager_id})
             results = []
             if result_data:
-                for result in result_data:
+                async for result in result_data:
                     result["_id"] = str(result["_id"])
                     results.append(result)
             return results
@@ -62,22 +62,22 @@ class ShortListDocument(BaseDocument):
             logger.error(f"Error fetching shortlist request: {e}")
             raise Exception(f"Error fetching shortlist request: {e}")
     @classmethod
-    def delete_request(cls, short_list_id):
+    async def delete_request(cls, short_list_id):
         try:
             # Check if the document exists before attempting to delete
-            existing_request = cls.get_collection().find_one({"_id": ObjectId(short_list_id)})
+            existing_request = await cls.get_collection().find_one({"_id": ObjectId(short_list_id)})
             if not existing_request:
                 raise Exception("Shortlist request does not exist.")
-            cls.get_collection().delete_one({"_id": ObjectId(short_list_id)})
+            await cls.get_collection().delete_one({"_id": ObjectId(short_list_id)})
             return True
         except errors.PyMongoError as e:
             logger.error(f"Error deleting shortlist request: {e}")
             raise Exception(f"Error deleting shortlist request: {e}")
    
     @classmethod
-    def get_request_by_job(cls, jobId):
+    async def get_request_by_job(cls, jobId):
         try:
-            result = cls.get_collection().find_one({"job_id": jobId})
+            result = await cls.get_collection().find_one({"job_id": jobId})
             if result:
                 result["_id"] = str(result["_id"])
             return result
@@ -0,0 +1,46 @@
+import logging
+from app.database.database import database
+from datetime import datetime
+from pymongo import errors
+logger = logging.getLogger(__name__)
+class BaseDocument:
+    """Base class for common database operations."""
+    collection_name = ""
+
+    @classmethod
+    def get_collection(cls):
+        return database.get_collection(cls.collection_name)
+
+
+class StoredFileDocument(BaseDocument):
+    """Registry of uploaded files keyed by the SHA-256 digest of their bytes."""
+    collection_name = "stored_files"
+
+    @classmethod
+    async def get_file_urls(cls, digests):
+        """Returns digest -> file_url for the digests that were uploaded before."""
+        try:
+            documents = cls.get_collection().find({"_id": {"$in": list(digests)}}, {"file_url": 1})
+            return {doc["_id"]: doc["file_url"] async for doc in documents}
+        except errors.PyMongoError as e:
+            # a registry miss only costs an upload
+            logger.warning(f"Error reading stored file registry: {e}")
+            return {}
+
+    @classmethod
+    async def register(cls, digest, file_url, filename, content_type, size):
+        """Records an uploaded file; the first URL stored for a digest is kept."""
+        try:
+            await cls.get_collection().update_one(
+                {"_id": digest},
+                {"$setOnInsert": {
+                    "file_url": file_url,
+                    "filename": filename,
+                    "content_type": content_type,
+                    "size": size,
+                    "created_at": datetime.utcnow(),
+                }},
+                upsert=True,
+            )
+        except errors.PyMongoError as e:
+            logger.warning(f"Error registering stored file {digest}: {e}")
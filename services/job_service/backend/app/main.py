@@ -2,6 +2,8 @@
 from app.logger import setup_logging
 setup_logging()
 
+import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.routes.jobs import router as job_router
 from app.routes.applications import router as application_router
@@ -9,10 +11,32 @@ from app.routes.bulk_application import router as bulk_router
 from app.routes.short_list import router as short_list_router
 from app.routes.recommendations import router as recommendation_router
 from app.routes.requeue import router as requeue_router
+from app.utils.publisher import start_publisher, close_publisher
+from app.utils.cloud_storage import start_storage_client, close_storage_client
+from app.utils.executors import start_executors, shutdown_executors, executor_stats
+from app.database.indexes import ensure_indexes
 from fastapi.middleware.cors import CORSMiddleware  
 
+logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Jobs API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await ensure_indexes()
+    try:
+        await start_publisher()
+    except Exception as e:
+        # the publisher reconnects lazily on the first publish
+        logger.error(f"RabbitMQ publisher not started: {e}")
+    await start_storage_client()
+    start_executors()
+    yield
+    shutdown_executors()
+    await close_storage_client()
+    await close_publisher()
+
+
+app = FastAPI(title="Jobs API", lifespan=lifespan)
 
 
 app.add_middleware(
@@ -30,6 +54,14 @@ app.include_router(bulk_router, prefix = '/bulk', tags = ["bulk"])
 app.include_router(short_list_router, prefix="/short_list", tags=["short_list"])
 app.include_router(recommendation_router, prefix="/recommendations", tags=["recommendations"])
 app.include_router(requeue_router, prefix="/re", tags=["requeue"])
+
+
+@app.get("/metrics/executors", tags=["metrics"])
+async def get_executor_metrics():
+    """Load of the parse process pool and blocking-call thread pool: calls waiting and in flight, queue and run times."""
+    return executor_stats()
+
+
 if __name__ == '__main__':
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=9000)
@@ -1,12 +1,14 @@
 import re
-from typing import Any, Dict
-from fastapi import APIRouter, File, Form, HTTPException, Response, UploadFile, status
+from typing import Any, Dict, Optional
+from fastapi import APIRouter, File, Form, HTTPException, Query, Response, UploadFile, status
 import logging
 import os
 import requests
-import fitz
 from app.utils.publisher import publish_application
-from app.utils.cloud_storage import upload_file
+from app.utils.executors import run_blocking, run_parse
+from app.utils.parsing import count_pdf_pages
+from app.utils.cloud_storage import store_file
+from app.utils.pagination import split_fields
 from dotenv import load_dotenv
 import google.generativeai as genai
 from app.database.models.job_model import   JobDocument
@@ -190,8 +192,7 @@ async def create_application(
             # Reset file pointer to the beginning so it can be read again for upload
             await cv.seek(0)
 
-            with fitz.open(stream=pdf_bytes, filetype="pdf") as pdf_doc:
-                num_pages = len(pdf_doc)
+            num_pages = await run_parse(count_pdf_pages, pdf_bytes)
             
             if num_pages > 3:
                 response.status_code = status.HTTP_400_BAD_REQUEST
@@ -226,7 +227,7 @@ async def create_application(
     
     try:
         # Save file locally and get file path
-        file_path = await upload_file(cv)
+        file_path, cv_digest = await store_file(cv)
         candidate_data = {
             "email": email,
             "phone_number": phone_number,
@@ -239,7 +240,7 @@ async def create_application(
         }
         
         try:
-            JobDocument.get_job_by_id(job_id)
+            await JobDocument.get_job_by_id(job_id)
         except Exception as e:
             logger.warning(f"Job with {job_id} is not found")
             response.status_code = status.HTTP_404_NOT_FOUND
@@ -248,9 +249,9 @@ async def create_application(
                 "error": f"Job with {job_id} is not found"
 
             }
-        candidate_id = CandidateDocument.create_candidate(candidate_data)
+        candidate_id = await CandidateDocument.create_candidate(candidate_data)
 
-        app = ApplicationDocument.get_application_by_candidate_job(candidate_id , job_id)
+        app = await ApplicationDocument.get_application_by_candidate_job(candidate_id , job_id)
         if app:
             response.status_code = status.HTTP_409_CONFLICT
         
@@ -270,19 +271,20 @@ async def create_application(
             "gender": gender,
             "disability": disability,
             "cv_link": file_path,  # Store local path
+            "cv_digest": cv_digest,
             "experience_years": experience_years,
             "candidate_id": candidate_id,
             "source": "web"
 
         }
         # Store in database
-        new_application = ApplicationDocument.create_application(application_data)
+        new_application = await ApplicationDocument.create_application(application_data)
         if not new_application:
             logger.error(f"Application creation failed for {application_data}")
             raise HTTPException(status_code=400, detail="Application creation failed")
         
 
-        job = JobDocument.get_job_by_id(job_id)
+        job = await JobDocument.get_job_by_id(job_id)
 
         try: 
             await publish_application({
@@ -290,13 +292,14 @@ async def create_application(
                 "job_skills": str(job["skills"]),
                 "application_id": new_application,
                 "resume_path": file_path,
+                "resume_digest": cv_digest,
                 "from": "web",
                 "job_id": job_id,
             })
         except Exception as e:
             try:
-                ApplicationDocument.delete_by_id(new_application)
-                CandidateDocument.delete_by_id(candidate_id)
+                await ApplicationDocument.delete_by_id(new_application)
+                await CandidateDocument.delete_by_id(candidate_id)
                 logger.info(f"Successfully rolled back application {new_application} and candidate {candidate_id}.")
             except Exception as rollback_e:
                 # If rollback fails, this is a critical state that needs manual intervention.
@@ -309,12 +312,13 @@ async def create_application(
             }
         # notify the user
         try:
-            send_email_notification(
+            await run_blocking(
+                send_email_notification,
                 email,
                 "Thank you for applying!",
                 type="application_received",
                 name=full_name,
-                title=JobDocument.get_job_by_id(job_id)['title']
+                title=(await JobDocument.get_job_by_id(job_id))['title']
             )
         except Exception as e:
             logger.error(f"Error sending email notification: {str(e)}")
@@ -326,20 +330,32 @@ async def create_application(
     
 
 @router.get("/", status_code=status.HTTP_200_OK)
-async def get_applications():
+async def get_applications(
+    response: Response,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    source: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+):
     try:
-        applications = ApplicationDocument.get_applications()
-        return list(applications)
+        applications, next_cursor = await ApplicationDocument.list_applications(
+            status=status_filter, source=source, limit=limit, cursor=cursor,
+            fields=split_fields(fields), with_details=False,
+        )
+        return {"success": True, "applications": applications, "next_cursor": next_cursor}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.warning(f"Error fetching applications: {str(e)}")
 
 @router.get("/{application_id}", response_model=dict)
 async def get_application(response: Response,application_id: str):
     try:
-        application = ApplicationDocument.get_application_by_id(application_id)
-        candidate = CandidateDocument.get_candidate_by_id(application['candidate_id'])
-        screening = ScreeningResultDocument.get_by_application_id(application_id) 
-        interview = InterviewsDocument.get_interview_by_app_id(application_id)
+        application = await ApplicationDocument.get_application_by_id(application_id)
+        candidate = await CandidateDocument.get_candidate_by_id(application['candidate_id'])
+        screening = await ScreeningResultDocument.get_by_application_id(application_id) 
+        interview = await InterviewsDocument.get_interview_by_app_id(application_id)
         if not application:
             response.status_code = status.HTTP_404_NOT_FOUND
             return {
@@ -368,27 +384,28 @@ async def reject_application(application_id: str):
     """
     try:
         # Retrieve application details first
-        application = ApplicationDocument.get_application_by_id(application_id)
+        application = await ApplicationDocument.get_application_by_id(application_id)
         if not application:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
                                 detail=f"Application {application_id} not found.")
         
         # Get candidate, job, screening, and interview data
-        candidate = CandidateDocument.get_candidate_by_id(application['candidate_id'])
-        job = JobDocument.get_job_by_id(application['job_id'])
-        screening = ScreeningResultDocument.get_by_application_id(application_id)
-        interview = InterviewsDocument.get_interview_by_app_id(application_id)
+        candidate = await CandidateDocument.get_candidate_by_id(application['candidate_id'])
+        job = await JobDocument.get_job_by_id(application['job_id'])
+        screening = await ScreeningResultDocument.get_by_application_id(application_id)
+        interview = await InterviewsDocument.get_interview_by_app_id(application_id)
         
         name = candidate['full_name']
         title = job['title']
         
         # Generate feedback using Gemini integration
-        rejection_reason, suggestion = generate_rejection_feedback(name, screening, interview, title)
+        rejection_reason, suggestion = await run_blocking(generate_rejection_feedback, name, screening, interview, title)
         
-        result = ApplicationDocument.reject_application(application_id)
+        result = await ApplicationDocument.reject_application(application_id)
         if result:
             # Send an email notification with the generated feedback
-            send_email_notification(
+            await run_blocking(
+                send_email_notification,
                 candidate['email'],
                 "Application Rejected",
                 type="application_rejected",
@@ -411,16 +428,17 @@ async def reject_application(application_id: str):
 async def accept_application(application_id: str):
     try:
         # Attempt to accept (pass) the application.
-        result = ApplicationDocument.accept_application(application_id)
+        result = await ApplicationDocument.accept_application(application_id)
         try:
-            application = ApplicationDocument.get_application_by_id(application_id)
+            application = await ApplicationDocument.get_application_by_id(application_id)
             job_id = application['job_id']
             candidate_id = application['candidate_id']
-            job = JobDocument.get_job_by_id(job_id)
-            candidate = CandidateDocument.get_candidate_by_id(candidate_id)
+            job = await JobDocument.get_job_by_id(job_id)
+            candidate = await CandidateDocument.get_candidate_by_id(candidate_id)
             name = candidate['full_name']
             title = job['title']
-            send_email_notification(
+            await run_blocking(
+                send_email_notification,
                 candidate['email'],
                 "Congratulations! Your application has been accepted!",
                 type="application_passed",
@@ -446,7 +464,7 @@ async def update_shortlist(application_id: str, update: ShortlistUpdate):
         # Update the application record with shortlist status and note
         update_data = update.dict()
         current_user = update_data.get("user", "User")
-        updated_app = ApplicationDocument.update_shortlist(application_id, update_data, current_user)
+        updated_app = await ApplicationDocument.update_shortlist(application_id, update_data, current_user)
         if not updated_app:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -468,7 +486,7 @@ async def edit_score(response: Response, application_id : str, update: EditScore
     try:
         update_data = update.dict()
         # Update the application record with shortlist status and note
-        screening_item = ScreeningResultDocument.edit_score(application_id, update_data)
+        screening_item = await ScreeningResultDocument.edit_score(application_id, update_data)
         if not screening_item:
             response.status_code=status.HTTP_404_NOT_FOUND
             return {
@@ -1,20 +1,35 @@
 import os
+import shutil
+import asyncio
 import zipfile
 import tempfile
 import logging
 from typing import  Optional
-from fastapi import APIRouter, File, Form, HTTPException, Response, UploadFile, status, Depends
-from app.utils.publisher import publish_application
-from app.utils.cloud_storage import upload_file
+from fastapi import APIRouter, BackgroundTasks, File, Form, HTTPException, Query, Response, UploadFile, status, Depends
+from app.utils.publisher import publish_applications
+from app.utils.cloud_storage import upload_file, upload_many
+from app.utils.config_local import Config
 from app.database.models.job_model import JobDocument
 from app.database.models.application_model import ApplicationDocument
 from app.database.models.candidate_model import CandidateDocument
-from app.utils.extract_applicant_information import extract_applicant_information
+from app.database.models.bulk_batch_model import BulkBatchDocument
+from app.database.models.extracted_text_model import ExtractedTextDocument
+from app.utils.extract_applicant_information import extract_applicant_information_from_text
 from app.utils.extract_job_requirement import extract_job_requirement
-import magic
+from app.utils.executors import run_blocking, run_parse
+from app.utils.parsing import MAGIC_HEADER_BYTES, extract_resume_text, sniff_mime_types
+from app.utils.pagination import split_fields
 import re
 logger = logging.getLogger(__name__)
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+ALLOWED_RESUME_TYPES = {
+    "application/pdf",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "application/msword",
+    "application/octet-stream",  #DOCX
+}
+
 def validate_job_input(
     job_id: Optional[str] = Form(None),
     job_file: Optional[UploadFile] = File(None)
@@ -64,6 +79,7 @@ router = APIRouter()
 async def create_bulk_application(
     
     response: Response,
+    background_tasks: BackgroundTasks,
     job_inputs: dict = Depends(validate_job_input),
     zipfolder: UploadFile = File(...),
     hr_id: str = Form(None),
@@ -74,7 +90,7 @@ async def create_bulk_application(
     logger.info(f"Received job inputs: {job_inputs}")
     
     if job_id:
-        job = JobDocument.get_job_by_id(job_id)
+        job = await JobDocument.get_job_by_id(job_id)
     elif job_file:
 
         allowed_file_types = {"application/pdf", "application/vnd.openxmlformats-officedocument.wordprocessingml.document", 
@@ -88,7 +104,7 @@ async def create_bulk_application(
         #         }
         # additional checks using magic
         file_content = await job_file.read()
-        mime = magic.from_buffer(file_content, mime=True)
+        [mime] = await run_parse(sniff_mime_types, [file_content[:MAGIC_HEADER_BYTES]])
         if mime not in allowed_file_types:
             response.status_code=status.HTTP_400_BAD_REQUEST
             return {
@@ -98,11 +114,11 @@ async def create_bulk_application(
         job_file.file.seek(0)
         try:
             file_path = await upload_file(job_file)
-            extracted_job_requirement = extract_job_requirement(file_path)
+            extracted_job_requirement = await run_blocking(extract_job_requirement, file_path)
             logger.info(extract_job_requirement)
-            job = JobDocument.create_job(extracted_job_requirement, hr_id)
+            job = await JobDocument.create_job(extracted_job_requirement, hr_id)
             job_id = str(job["_id"])
-            job = JobDocument.get_job_by_id(job_id)
+            job = await JobDocument.get_job_by_id(job_id)
         except Exception as e:
             logger.critical(f"Error creating application: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Internal Server Error: {e}")
@@ -118,156 +134,237 @@ async def create_bulk_application(
     
     if not zipfolder.filename.lower().endswith(".zip"):
         raise HTTPException(status_code=400, detail="Uploaded file must be a ZIP file.")
+
+    # The ZIP is streamed to disk and read entry by entry in the background, so
+    # neither the archive nor its extracted contents are held in memory.
+    workdir = tempfile.mkdtemp(prefix="bulk_")
     try:
-        failed_resumes = []
-        with tempfile.TemporaryDirectory() as tmpdirname:
-            zip_path = os.path.join(tmpdirname, zipfolder.filename)
-            with open(zip_path, "wb") as f:
-                content = await zipfolder.read()
-                f.write(content)
-            
-            try:
-                with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                    zip_ref.extractall(tmpdirname)
-            except Exception as e:
-                raise HTTPException(status_code=400, detail=f"Error extracting ZIP file: {str(e)}")
-            
-            resume_files = []
-            for root, dirs, files in os.walk(tmpdirname):
-                for file in files:
-                    if file.lower().endswith((".pdf", ".docx", ".txt")):
-                        file_path = os.path.join(root, file)
-                        # resume_files.append(file_path)
-                        resume_files.append({"filename": file,"path": file_path})
-                        
-                        
-            if not resume_files:
-                raise HTTPException(status_code=400, detail="No resume files found in the ZIP folder.")
-            
-            processed_count = 0
-            errors = []
-            allowed_file_types = {
-                                "application/pdf",
-                                "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                                "application/msword",
-                                "application/octet-stream",  #DOCX 
-                                 }
-            
-            for resume in resume_files:
-                try:
-                    if not os.path.exists(resume["path"]):
-                        raise Exception(f"File not found: {resume['path']} for {resume['filename']}")
-
-                    # if contains_script_code(file_path):
-                        # raise Exception(f"File Contains script")
-                    # remove due to false positives
-                    
-                    
-                    # Determine MIME type
-                    content_type = magic.from_file(resume["path"], mime=True)
-                    if content_type not in allowed_file_types:
-                        raise Exception(f"File type not allowed: {content_type}")
-
-                    # if file_path.lower().endswith(".pdf"):
-                    #     content_type = "application/pdf"
-                    # elif file_path.lower().endswith(".docx"):
-                    #     content_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-                    # else:
-                    #     content_type = "text/plain"
-                    
-                    with open(resume["path"], "rb") as f:
-                        try:
-                           upload_file_obj = UploadFile(
-                            filename=os.path.basename(resume["path"]),
-                            file=f,
-                            headers={"content-type": content_type}  
-                        )
-                           f.seek(0)  # Reset file pointer
-                        
-                           cv_link = await upload_file(upload_file_obj)
-                        except Exception as e:
-                            failed_resumes.append(resume["filename"])
-                            logger.critical(f"Failed to upload file {resume['filename']}: {str(e)}")
-                            continue
-
-
-                    # Extract information
-                    extracted_info = extract_applicant_information(resume["path"])
-                    # Create candidate
-                    candidate_data = {
-                        "email": extracted_info.get("email", "unknown@example.com"),
-                        "phone_number": extracted_info.get("phone_number", "Unknown"),
-                        "gender": extracted_info.get("gender", "Unknown"),
-                        "experience_years": extracted_info.get("experience_years", "0"),
-                        "full_name": extracted_info.get("full_name", "Unknown Candidate"),
-                        "feedback": "",
-                        "disability": extracted_info.get("disability", "Unknown"),
-                        "skills": []
-                    }
-                    
-                    candidate_id = CandidateDocument.create_candidate(candidate_data)
-                    
-                    # if ApplicationDocument.get_application_by_candidate_job(candidate_id, job_id):
-                    #     errors.append(f"Duplicate application for {candidate_data['email']}")
-                    #     continue
-
-                    # Create application
-                    application_data = {
-                        "job_id": job_id,
-                        "email": candidate_data["email"],
-                        "full_name": candidate_data["full_name"],
-                        "phone_number": candidate_data["phone_number"],
-                        "gender": candidate_data["gender"],
-                        "disability": candidate_data["disability"],
-                        "cv_link": cv_link,
-                        "experience_years": candidate_data["experience_years"],
-                        "candidate_id": candidate_id,
-                        "source": "bulk"
-                    }
-                    
-                    new_application = ApplicationDocument.create_application(application_data)
-                    if not new_application:
-                        raise Exception("Application creation failed")
-
-                    await publish_application({
-                        "job_description": str(job["description"]),
-                        "job_skills": str(job["skills"]),
-                        "application_id": new_application,
-                        "resume_path": cv_link,
-                    })
-                    
-                    processed_count += 1
-
-                except Exception as e:
-                    logger.critical(f"Failed to process {resume['filename']}: {str(e)}", exc_info=True)
-                    errors.append(f"{os.path.basename(resume['path'])}: {str(e)}")
-                    continue
-            
-            return {
-                "success": True if processed_count > 0 else False,
-                "processed_count": processed_count,
-                "resume_count": len(resume_files),
-                "error_count": len(errors),
-                "errors": errors,
-                "failed_resumes": failed_resumes,
-                "message": f"Processed {processed_count} resumes" + 
-                        f" with {len(errors)} errors" if errors else ""
-                        }
-        
+        zip_path = os.path.join(workdir, "upload.zip")
+        # one blocking call for the whole copy, not one executor slot per chunk
+        await run_blocking(save_upload, zipfolder.file, zip_path)
+
+        try:
+            resume_entries = await run_blocking(list_resume_entries, zip_path)
+        except zipfile.BadZipFile as e:
+            raise HTTPException(status_code=400, detail=f"Error extracting ZIP file: {str(e)}")
+
+        if not resume_entries:
+            raise HTTPException(status_code=400, detail="No resume files found in the ZIP folder.")
+
+        batch_id = await BulkBatchDocument.create_batch(job_id, len(resume_entries), hr_id)
+    except Exception:
+        await run_blocking(shutil.rmtree, workdir, ignore_errors=True)
+        raise
+
+    background_tasks.add_task(process_bulk_batch, batch_id, workdir, zip_path, resume_entries, job, job_id)
+    logger.info(f"Bulk batch {batch_id} queued with {len(resume_entries)} resumes for job {job_id}")
+    return {
+        "success": True,
+        "batch_id": batch_id,
+        "status": "processing",
+        "resume_count": len(resume_entries),
+        "processed_count": 0,
+        "failed_resumes": [],
+        "message": f"Processing {len(resume_entries)} resumes",
+    }
+
+
+def save_upload(source, path):
+    """Copies an uploaded file's spooled content to path, UPLOAD_CHUNK_SIZE at a time."""
+    source.seek(0)
+    with open(path, "wb") as f:
+        shutil.copyfileobj(source, f, UPLOAD_CHUNK_SIZE)
+
+
+def list_resume_entries(zip_path):
+    """Names of the PDF, DOCX and TXT files in a ZIP archive."""
+    with zipfile.ZipFile(zip_path, "r") as archive:
+        return [
+            info.filename for info in archive.infolist()
+            if not info.is_dir()
+            and not info.filename.startswith("__MACOSX/")
+            and info.filename.lower().endswith((".pdf", ".docx", ".txt"))
+        ]
+
+
+def read_entries(archive, entries):
+    """Reads archive entries in order; an unreadable entry yields its exception."""
+    contents = []
+    for entry in entries:
+        try:
+            contents.append(archive.read(entry))
+        except Exception as e:
+            contents.append(e)
+    return contents
+
+
+async def process_bulk_batch(batch_id, workdir, zip_path, resume_entries, job, job_id):
+    """
+    Processes the resumes Config.BULK_UPLOAD_BATCH at a time: each group is read
+    from the archive, uploaded concurrently with upload_many, then turned into
+    applications with at most Config.BULK_CONCURRENCY in flight. The saved
+    applications of a group are queued for screening with one batch publish.
+    Progress is recorded on the batch document.
+    """
+    semaphore = asyncio.Semaphore(Config.BULK_CONCURRENCY)
+    try:
+        archive = await run_blocking(zipfile.ZipFile, zip_path, "r")
+        with archive:
+            for start in range(0, len(resume_entries), Config.BULK_UPLOAD_BATCH):
+                entries = resume_entries[start:start + Config.BULK_UPLOAD_BATCH]
+                await BulkBatchDocument.heartbeat(batch_id)
+                contents = await run_blocking(read_entries, archive, entries)
+                # one round trip to the parse pool for the whole group, headers only
+                content_types = await run_parse(
+                    sniff_mime_types,
+                    [b"" if isinstance(content, Exception) else content[:MAGIC_HEADER_BYTES] for content in contents],
+                )
+
+                resumes = []
+                for entry, content, content_type in zip(entries, contents, content_types):
+                    filename = os.path.basename(entry)
+                    if isinstance(content, Exception):
+                        logger.critical(f"Failed to read {entry} from archive: {str(content)}")
+                        await BulkBatchDocument.record_error(batch_id, f"{filename}: {str(content)}")
+                        continue
+                    if content_type not in ALLOWED_RESUME_TYPES:
+                        await BulkBatchDocument.record_error(batch_id, f"{filename}: File type not allowed: {content_type}")
+                        continue
+                    resumes.append((filename, content, content_type))
+
+                uploads = await upload_many(resumes, document_category="resume")
+                await BulkBatchDocument.heartbeat(batch_id)
+
+                async def run(filename, content, cv_link, cv_digest):
+                    async with semaphore:
+                        return await process_resume(batch_id, filename, content, cv_link, cv_digest, job, job_id)
+
+                tasks = []
+                for (filename, content, _), upload in zip(resumes, uploads):
+                    if isinstance(upload, Exception):
+                        logger.critical(f"Failed to upload file {filename}: {str(upload)}")
+                        await BulkBatchDocument.record_error(batch_id, f"{filename}: {str(upload)}", failed_resume=filename)
+                        continue
+                    cv_link, cv_digest = upload
+                    tasks.append(run(filename, content, cv_link, cv_digest))
+                # the group's screening messages go out together, with one confirm wait
+                saved = [saved for saved in await asyncio.gather(*tasks) if saved]
+                await publish_group(batch_id, saved)
+        await BulkBatchDocument.finish(batch_id)
+        logger.info(f"Bulk batch {batch_id} completed")
     except Exception as e:
-        response.status_code = status.HTTP_400_BAD_REQUEST
-        return {
-            "success": False,
-            "error": "error occured during processing",
-            "message": str(e)
+        logger.critical(f"Bulk batch {batch_id} failed: {str(e)}", exc_info=True)
+        await BulkBatchDocument.finish(batch_id, status="failed", error=str(e))
+    finally:
+        await run_blocking(shutil.rmtree, workdir, ignore_errors=True)
+
+
+async def publish_group(batch_id, saved):
+    """
+    Queues the screening of a group of saved resumes ((filename, message) pairs)
+    with one batch publish, and records each one as processed or failed.
+    """
+    if not saved:
+        return
+    unconfirmed = await publish_applications([message for _, message in saved])
+    unconfirmed_ids = {message["application_id"] for message in unconfirmed}
+    for filename, message in saved:
+        if message["application_id"] in unconfirmed_ids:
+            await BulkBatchDocument.record_error(batch_id, f"{filename}: screening could not be queued", failed_resume=filename)
+        else:
+            await BulkBatchDocument.record_success(batch_id)
+
+
+async def process_resume(batch_id, filename, content, cv_link, cv_digest, job, job_id):
+    """
+    Extracts the applicant from an uploaded resume and stores the application.
+    Returns (filename, screening message) for the caller to publish, or None on failure.
+    """
+    try:
+        # Extract information
+        resume_text = await run_parse(extract_resume_text, content, filename)
+        # the screen service reads this text instead of downloading and parsing the CV again
+        await ExtractedTextDocument.save_text(cv_link, resume_text, cv_digest)
+        extracted_info = await run_blocking(extract_applicant_information_from_text, resume_text)
+        # Create candidate
+        candidate_data = {
+            # no placeholder: a shared fake address would merge unrelated applicants
+            "email": extracted_info.get("email"),
+            "phone_number": extracted_info.get("phone_number", "Unknown"),
+            "gender": extracted_info.get("gender", "Unknown"),
+            "experience_years": extracted_info.get("experience_years", "0"),
+            "full_name": extracted_info.get("full_name", "Unknown Candidate"),
+            "feedback": "",
+            "disability": extracted_info.get("disability", "Unknown"),
+            "skills": []
+        }
+
+        candidate_id = await CandidateDocument.create_candidate(candidate_data)
+
+        # Create application
+        application_data = {
+            "job_id": job_id,
+            "email": candidate_data["email"],
+            "full_name": candidate_data["full_name"],
+            "phone_number": candidate_data["phone_number"],
+            "gender": candidate_data["gender"],
+            "disability": candidate_data["disability"],
+            "cv_link": cv_link,
+            "cv_digest": cv_digest,
+            "experience_years": candidate_data["experience_years"],
+            "candidate_id": candidate_id,
+            "source": "bulk"
         }
 
+        new_application = await ApplicationDocument.create_application(application_data)
+        if not new_application:
+            raise Exception("Application creation failed")
+
+        return filename, {
+            "job_description": str(job["description"]),
+            "job_skills": str(job["skills"]),
+            "application_id": new_application,
+            "resume_path": cv_link,
+            "resume_digest": cv_digest,
+            "from": "bulk",
+            "job_id": job_id,
+        }
+
+    except Exception as e:
+        logger.critical(f"Failed to process {filename}: {str(e)}", exc_info=True)
+        await BulkBatchDocument.record_error(batch_id, f"{filename}: {str(e)}")
+
+
+@router.get("/batches/{batch_id}", response_model=dict)
+async def get_bulk_batch(response: Response, batch_id: str):
+    """Progress of a bulk upload started with POST /bulk/."""
+    try:
+        batch = await BulkBatchDocument.get_batch(batch_id)
+    except Exception as e:
+        logger.error(f"Error retrieving bulk batch: {e}")
+        raise HTTPException(status_code=500, detail=f"Error retrieving bulk batch: {e}")
+    if not batch:
+        response.status_code = status.HTTP_404_NOT_FOUND
+        return {"success": False, "error": f"bulk batch with id {batch_id} not found"}
+    return {"success": True, "batch": batch}
+
 
 #Get all bulk applications for a specific job
 @router.get("/{job_id}/applications", response_model=dict)
-async def get_job_applications(response: Response,job_id: str):
+async def get_job_applications(
+    response: Response,
+    job_id: str,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    min_score: Optional[float] = None,
+    max_score: Optional[float] = None,
+    sort: str = "date",
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    view: str = "summary",
+    fields: Optional[str] = None,
+):
     try:
-        job = JobDocument.get_job_by_id(job_id)
+        job = await JobDocument.get_job_by_id(job_id)
         if not job:
             response.status_code = status.HTTP_404_NOT_FOUND
             return {
@@ -275,13 +372,16 @@ async def get_job_applications(response: Response,job_id: str):
                 "error": f"job application with id {job_id} not found"
             }
         
-        applications = ApplicationDocument.get_applications_by_job(job_id)
-        bulk_applications = []
-        for app in applications:
-            if app["source"] == "bulk":
-                bulk_applications.append(app)
+        try:
+            bulk_applications, next_cursor = await ApplicationDocument.list_applications(
+                job_id=job_id, source="bulk", status=status_filter, min_score=min_score, max_score=max_score,
+                sort=sort, limit=limit, cursor=cursor, view=view, fields=split_fields(fields),
+            )
+        except ValueError as ve:
+            response.status_code = status.HTTP_400_BAD_REQUEST
+            return {"success": False, "error": str(ve)}
 
-        return {"success": True, "applications": bulk_applications}
+        return {"success": True, "applications": bulk_applications, "next_cursor": next_cursor}
     except HTTPException:
         logger.error(HTTPException)
     except Exception as e:
@@ -1,29 +1,36 @@
 import logging
-from fastapi import APIRouter, HTTPException, status, Response, UploadFile,File, Form
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, status, Response, UploadFile,File, Form
 from app.schemas.job_schema import JobCreate, JobUpdate
 from app.database.models.job_model import JobDocument
 from app.database.models.application_model import  ApplicationDocument
 from datetime import datetime
 from app.utils.extract_job_requirement import extract_job_requirement
+from app.utils.executors import run_blocking
 from app.utils.cloud_storage import upload_file
+from app.utils.pagination import split_fields
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 @router.get("/", response_model=dict)
-async def get_jobs():
+async def get_jobs(limit: Optional[int] = None, cursor: Optional[str] = None, fields: Optional[str] = None):
     try:
-        jobs = JobDocument.get_all_jobs()
-        return {"success": True, "jobs": jobs}
+        jobs, next_cursor = await JobDocument.get_all_jobs(limit, cursor, split_fields(fields))
+        return {"success": True, "jobs": jobs, "next_cursor": next_cursor}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error retrieving jobs: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving jobs: {e}")
 
 @router.get("/open", response_model=dict)
-async def get_open_jobs():
+async def get_open_jobs(limit: Optional[int] = None, cursor: Optional[str] = None, fields: Optional[str] = None):
     try:
-        jobs = JobDocument.get_all_open_jobs()
-        return {"success": True, "jobs": jobs}
+        jobs, next_cursor = await JobDocument.get_all_open_jobs(limit, cursor, split_fields(fields))
+        return {"success": True, "jobs": jobs, "next_cursor": next_cursor}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error retrieving jobs: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving jobs: {e}")
@@ -33,7 +40,7 @@ async def get_open_jobs():
 @router.get("/{job_id}", response_model=dict)
 async def get_job(response: Response,job_id: str):
     try:
-        job = JobDocument.get_job_by_id(job_id)
+        job = await JobDocument.get_job_by_id(job_id)
         if not job:
             response.status_code = status.HTTP_404_NOT_FOUND
             return {
@@ -47,7 +54,7 @@ async def get_job(response: Response,job_id: str):
 @router.get("/open/{job_id}", response_model=dict)
 async def get_open_job(response: Response,job_id: str):
     try:
-        job = JobDocument.get_open_job_by_id(job_id)
+        job = await JobDocument.get_open_job_by_id(job_id)
         if not job:
             response.status_code = status.HTTP_404_NOT_FOUND
             return {
@@ -70,7 +77,7 @@ async def create_job(job: JobCreate, hr_id: str):
         job_data = job.dict()
         if not job_data.get("post_date"):
             job_data["post_date"] = datetime.now()
-        new_job = JobDocument.create_job(job_data, hr_id)
+        new_job = await JobDocument.create_job(job_data, hr_id)
         if new_job is None:
             raise Exception("Job creation failed")
         new_job['_id'] = str(new_job['_id'])
@@ -95,8 +102,8 @@ async def create_job_file(
     
     try:
         file_path = await upload_file(job_file)
-        extracted_job_requirement = extract_job_requirement(file_path)
-        job = JobDocument.create_job(extracted_job_requirement, hr_id)
+        extracted_job_requirement = await run_blocking(extract_job_requirement, file_path)
+        job = await JobDocument.create_job(extracted_job_requirement, hr_id)
         job_id = str(job["_id"])
         # job = JobDocument.get_job_by_id(job_id)
         return {
@@ -149,7 +156,7 @@ async def update_job(response: Response, job_id: str, job_update: JobUpdate):
                 "error": "No update fields provided"
             }
 
-        updated_job = JobDocument.update_job(job_id, update_data)
+        updated_job = await JobDocument.update_job(job_id, update_data)
         
         if not updated_job:
             response.status_code = status.HTTP_404_NOT_FOUND
@@ -173,9 +180,21 @@ async def update_job(response: Response, job_id: str, job_update: JobUpdate):
 
 #Get all applications for a specific job
 @router.get("/{job_id}/applications", response_model=dict)
-async def get_job_applications(response: Response,job_id: str):
+async def get_job_applications(
+    response: Response,
+    job_id: str,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    source: Optional[str] = None,
+    min_score: Optional[float] = None,
+    max_score: Optional[float] = None,
+    sort: str = "date",
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    view: str = "summary",
+    fields: Optional[str] = None,
+):
     try:
-        job = JobDocument.get_job_by_id(job_id)
+        job = await JobDocument.get_job_by_id(job_id)
         if not job:
             response.status_code = status.HTTP_404_NOT_FOUND
             return {
@@ -183,8 +202,15 @@ async def get_job_applications(response: Response,job_id: str):
                 "error": f"job application with id {job_id} not found"
             }
         
-        applications = ApplicationDocument.get_applications_by_job(job_id)
-        return {"success": True, "applications": applications}
+        try:
+            applications, next_cursor = await ApplicationDocument.list_applications(
+                job_id=job_id, status=status_filter, source=source, min_score=min_score, max_score=max_score,
+                sort=sort, limit=limit, cursor=cursor, view=view, fields=split_fields(fields),
+            )
+        except ValueError as ve:
+            response.status_code = status.HTTP_400_BAD_REQUEST
+            return {"success": False, "error": str(ve)}
+        return {"success": True, "applications": applications, "next_cursor": next_cursor}
     except HTTPException:
         logger.error(HTTPException)
         raise HTTPException(status_code=500, detail=f"Error retrieving applications: {e}")
@@ -1,66 +1,103 @@
-from fastapi import APIRouter, HTTPException, status, Response
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, status, Response
 from app.database.models.job_model import JobDocument
 from app.database.models.application_model import  ApplicationDocument
 from app.database.models.recommendation_model import RecommendationDocument
 from datetime import datetime
+from uuid import uuid4
 from app.utils.publisher import publish_application
+from app.utils.config_local import Config
+from app.utils.pagination import split_fields
 router = APIRouter()
 
 
 
 @router.post("/", status_code=status.HTTP_201_CREATED, response_model=dict)
-async def create_recommendations(response: Response,job_id: str):
+async def create_recommendations(
+    response: Response,
+    job_id: str,
+    top_k: Optional[int] = Query(None, ge=1),
+    min_similarity: Optional[float] = Query(None, ge=-1.0, le=1.0),
+):
     try:
-        job = JobDocument.get_job_by_id(job_id)
+        job = await JobDocument.get_job_by_id(job_id)
         if not job:
             response.status_code = status.HTTP_404_NOT_FOUND
             return {
                 "sucess": False,
                 "error": f"job with id {job_id} not found"
             }
-        existed_applications = ApplicationDocument.get_applications_by_job(job_id)
-        
-        existed_application_ids = [app['_id'] for app in existed_applications]
-        applications = [application for application in ApplicationDocument.get_applications() if application["_id"] not in existed_application_ids ]
+        applications = await ApplicationDocument.get_recommendation_candidates(job_id)
         if len(applications) == 0:
             response.status_code = status.HTTP_201_CREATED            
             return {
                 "sucess": False,
                 "error": f"job with id {job_id} has no recommended applications"
             }
-        for application in applications:
-            await publish_application({
-                "job_description": str(job["description"]),
-                "job_skills": str(job["skills"]),
-                "application_id": str(application["_id"]),
-                "resume_path": application["cv_link"],
-                "from": "recommendation",
-                "job_id": job_id,
-            })
+        top_k = top_k or Config.RECOMMENDATION_TOP_K
+        min_similarity = Config.RECOMMENDATION_MIN_SIMILARITY if min_similarity is None else min_similarity
+        # one run message: the screen service ranks the candidates by CV embedding
+        # similarity and sends only the top_k to LLM scoring
+        run_id = uuid4().hex
+        await publish_application({
+            "from": "recommendation_run",
+            "run_id": run_id,
+            "job_id": job_id,
+            "job_description": str(job["description"]),
+            "job_skills": str(job["skills"]),
+            "top_k": top_k,
+            "min_similarity": min_similarity,
+            "candidates": applications,
+        })
         response.status_code = status.HTTP_201_CREATED
-        return {"success": True, "detail": "All the applicants data send to the screening service" , "status": "processing"}
+        return {
+            "success": True,
+            "detail": "All the applicants data send to the screening service",
+            "status": "processing",
+            "run_id": run_id,
+            "candidate_count": len(applications),
+            "top_k": top_k,
+            "min_similarity": min_similarity,
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting recommendations: {e}")
 
 @router.get("/{job_id}", response_model=dict)
-async def get_recomendation_by_job_id(response: Response,job_id: str):
+async def get_recomendation_by_job_id(
+    response: Response,
+    job_id: str,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+):
     try:
-        job = JobDocument.get_job_by_id(job_id)
+        job = await JobDocument.get_job_by_id(job_id)
         if not job:
             response.status_code = status.HTTP_404_NOT_FOUND
             return {
                 "sucess": False,
                 "error": f"job with id {job_id} not found"
             }
-        recommended_applications = RecommendationDocument.get_recommendationsby_job_id(job_id)
-        if not recommended_applications:
+        try:
+            recommended_applications, next_cursor = await RecommendationDocument.get_recommendationsby_job_id(
+                job_id, limit=limit, cursor=cursor, fields=split_fields(fields)
+            )
+        except ValueError as ve:
+            response.status_code = status.HTTP_400_BAD_REQUEST
+            return {"success": False, "error": str(ve)}
+        if not recommended_applications and not cursor:
             return {
                 "sucess": True,
                 "status": "not_processed",
                 "error": f"recommended application with job_id {job_id} not processed yet"
             }
         
-        return {"success": True, "status" : "processed" , "recommend_applications": recommended_applications}
+        return {
+            "success": True,
+            "status" : "processed",
+            "recommend_applications": recommended_applications,
+            "next_cursor": next_cursor,
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving recommendations: {e}")
 
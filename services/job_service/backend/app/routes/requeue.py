@@ -32,7 +32,7 @@ async def requeue(request: Request):
                 detail="Invalid payload: 'applicationId' and 'screening.original_message' are required.",
             )
         await publish_application(original_message)
-        ScreeningResultDocument.delete_by_application_id(application_id)
+        await ScreeningResultDocument.delete_by_application_id(application_id)
         return {"status": "success", "message": "Original message has been requeued."}
     except Exception as e:
         logger.error(f"Failed to requeue message: {e}")
@@ -22,10 +22,10 @@ async def short_list_request(
     job_id = payload.job_id
 
     try:
-        if JobDocument.get_job_by_id(job_id) is None:
+        if await JobDocument.get_job_by_id(job_id) is None:
             response.status_code = status.HTTP_404_NOT_FOUND
             return {"success": False, "error": f"job with job_id {job_id} not found"}
-        short_list = ShortListDocument.create_request(job_id, hiring_manager_id)
+        short_list = await ShortListDocument.create_request(job_id, hiring_manager_id)
         if short_list is None:
             response.status_code = status.HTTP_400_BAD_REQUEST
             return {"success": False, "error": "Short list request failed"}
@@ -38,7 +38,7 @@ async def short_list_request(
 @router.get("/{hiring_manager_id}", response_model=dict)
 async def get_short_list_requests(response: Response, hiring_manager_id: str):
     try:
-        short_list = ShortListDocument.get_request_by_hr_manager(hiring_manager_id)
+        short_list = await ShortListDocument.get_request_by_hr_manager(hiring_manager_id)
         response.status_code = status.HTTP_200_OK
         return {"success": True, "short_list": short_list}
     except Exception as e:
@@ -47,7 +47,7 @@ async def get_short_list_requests(response: Response, hiring_manager_id: str):
 @router.delete("/{short_list_id}", response_model=dict)
 async def delete_short_list_request(response: Response, short_list_id: str,):
     try:
-        short_list = ShortListDocument.delete_request(short_list_id)
+        short_list = await ShortListDocument.delete_request(short_list_id)
    
         if not short_list:
             response.status_code = status.HTTP_404_NOT_FOUND
@@ -59,7 +59,7 @@ async def delete_short_list_request(response: Response, short_list_id: str,):
 @router.get("/job/{job_id}", response_model=dict)
 async def get_short_list_by_job(response: Response, job_id: str):
     try:
-        short_list = ShortListDocument.get_request_by_job(job_id)
+        short_list = await ShortListDocument.get_request_by_job(job_id)
         return {"success": True, "short_list": short_list}
     except Exception as e:
         
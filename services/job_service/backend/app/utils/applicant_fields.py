@@ -0,0 +1,242 @@
+"""
+Deterministic extraction of applicant contact fields from resume text. Fields
+this pass cannot determine are left out, and only those are asked of the LLM.
+"""
+import re
+import threading
+from datetime import date
+
+APPLICANT_FIELDS = ("email", "full_name", "phone_number", "gender", "disability", "experience_years")
+
+EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)*\.[a-zA-Z]{2,}")
+PHONE_RE = re.compile(r"(?<![\w/])\+?\(?\d[\d \t().-]{7,18}\d(?![\w/])")
+PHONE_LABEL_RE = re.compile(r"\b(?:phone|mobile|mob|tel|telephone|cell|whatsapp|contact)\b", re.IGNORECASE)
+YEAR_RE = re.compile(r"(?<!\d)(?:19|20)\d{2}(?!\d)")
+NAME_LABEL_RE = re.compile(r"^\s*(?:full\s+)?name\s*[:\-]\s*(.+)$", re.IGNORECASE)
+NAME_LINE_RE = re.compile(r"^[^\W\d_][^\W\d_.'\-]*\.?(?:[\s'\-][^\W\d_][^\W\d_.'\-]*\.?){1,3}$")
+GENDER_RE = re.compile(r"^\s*(?:gender|sex)\s*[:\-]\s*(male|female|m|f)\b", re.IGNORECASE | re.MULTILINE)
+DISABILITY_RE = re.compile(r"^\s*disability(?:\s+status)?\s*[:\-]\s*(.+)$", re.IGNORECASE | re.MULTILINE)
+EXPLICIT_YEARS_RE = re.compile(
+    r"(\d{1,2}(?:\.\d)?)\s*\+?\s*(?:years?|yrs?)\s+(?:of\s+)?(?:\w+\s+){0,3}experience", re.IGNORECASE
+)
+
+# lines near the top that are not a name: headings, contact labels and job titles
+HEADER_WORDS = {
+    "resume", "curriculum", "vitae", "cv", "profile", "summary", "contact", "address", "email",
+    "phone", "mobile", "objective", "experience", "education", "skills", "linkedin", "github",
+    "engineer", "developer", "manager", "analyst", "designer", "officer", "assistant",
+    "consultant", "specialist", "intern", "accountant", "scientist", "administrator",
+    "professional", "management", "project", "certified", "certificate", "university", "college",
+}
+# the contact block: a phone number is only taken from these lines or from a phone-labelled one
+HEADER_LINES = 10
+# how far above (and below) the email or phone line a name may sit, leaving room for a job title
+NAME_LINES_ABOVE = 2
+NAME_LINES_BELOW = 1
+
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "sept": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sept?|oct|nov|dec)[a-z]*\.?"
+_DATE = r"(?:(?P<{p}m>{month})\s*|(?P<{p}n>\d{{1,2}})[/.-])?(?P<{p}y>(?:19|20)\d{{2}})"
+DATE_RANGE_RE = re.compile(
+    _DATE.format(p="s", month=_MONTH)
+    + r"\s*(?:-|–|—|to|until)\s*(?:"
+    + _DATE.format(p="e", month=_MONTH)
+    + r"|(?P<present>present|current|now|ongoing|date|today))",
+    re.IGNORECASE,
+)
+SECTION_RE = re.compile(
+    r"^\s*(?P<title>(?:work\s+|professional\s+|employment\s+)?(?:experience|employment(?:\s+history)?|work\s+history)"
+    r"|education|skills|projects|certifications?|references|languages|awards|publications|volunteering|interests)"
+    r"\s*:?\s*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+def extract_email(text):
+    match = EMAIL_RE.search(text)
+    return match.group(0) if match else None
+
+
+def _lines(text):
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+def _phone_in(line):
+    """The first phone-shaped run in line; dates and year ranges ("2015 - 2019 2020") are not phones."""
+    for match in PHONE_RE.finditer(line):
+        candidate = match.group(0).strip()
+        digits = re.sub(r"\D", "", candidate)
+        if not 9 <= len(digits) <= 15 or len(YEAR_RE.findall(candidate)) >= 2:
+            continue
+        return candidate
+    return None
+
+
+def extract_phone_number(text):
+    """A phone number in the header lines or on a phone-labelled line."""
+    lines = _lines(text)
+    for i, line in enumerate(lines):
+        if i >= HEADER_LINES and not PHONE_LABEL_RE.search(line):
+            continue
+        phone = _phone_in(line)
+        if phone:
+            return phone
+    return None
+
+
+def _name_in(line):
+    if not NAME_LINE_RE.match(line):
+        return None
+    if HEADER_WORDS & {word.lower().strip(".") for word in line.split()}:
+        return None
+    return line.title() if line.isupper() else line
+
+
+def extract_full_name(text):
+    """
+    A name-shaped line that is either labelled as the name or sits next to the
+    email or phone line of the header. Anything else is left to the LLM: a lone
+    title-cased header line is as likely a certification or job title.
+    """
+    lines = _lines(text)
+    for line in lines:
+        labelled = NAME_LABEL_RE.match(line)
+        if labelled:
+            name = _name_in(labelled.group(1).strip())
+            if name:
+                return name
+
+    header = lines[:HEADER_LINES]
+    for i, line in enumerate(header):
+        if not (EMAIL_RE.search(line) or _phone_in(line)):
+            continue
+        # nearest line first, above before below
+        nearby = [i - offset for offset in range(1, NAME_LINES_ABOVE + 1)]
+        nearby += [i + offset for offset in range(1, NAME_LINES_BELOW + 1)]
+        for j in nearby:
+            if 0 <= j < len(header):
+                name = _name_in(header[j])
+                if name:
+                    return name
+    return None
+
+
+def extract_gender(text):
+    """Only an explicit gender field counts; anything else is 'Unknown'."""
+    match = GENDER_RE.search(text)
+    if not match:
+        return "Unknown"
+    return "Male" if match.group(1).lower().startswith("m") else "Female"
+
+
+def extract_disability(text):
+    match = DISABILITY_RE.search(text)
+    return match.group(1).strip() if match else "Unknown"
+
+
+def _month_index(year, month):
+    return int(year) * 12 + (int(month) - 1 if month else 0)
+
+
+def _range_months(match, today):
+    start_month = MONTHS.get((match.group("sm") or "")[:3].lower()) or match.group("sn")
+    start = _month_index(match.group("sy"), start_month)
+    if match.group("present"):
+        end = _month_index(today.year, today.month)
+    else:
+        end_month = MONTHS.get((match.group("em") or "")[:3].lower()) or match.group("en")
+        # a bare end year counts through December
+        end = _month_index(match.group("ey"), end_month or 12)
+    if not 1 <= int(start_month or 1) <= 12 or end < start:
+        return None
+    return start, end
+
+
+def experience_section(text):
+    """Text under the experience heading, up to the next section heading."""
+    headings = list(SECTION_RE.finditer(text))
+    for i, heading in enumerate(headings):
+        title = heading.group("title").lower()
+        if "experience" in title or "employment" in title or "work" in title:
+            end = headings[i + 1].start() if i + 1 < len(headings) else len(text)
+            return text[heading.end():end]
+    return None
+
+
+def extract_experience_years(text, today=None):
+    """
+    An explicit "N years of experience" claim, otherwise the union of the date
+    ranges in the experience section. None when neither is present.
+    """
+    claims = [float(value) for value in EXPLICIT_YEARS_RE.findall(text)]
+    if claims:
+        years = max(claims)
+    else:
+        section = experience_section(text)
+        if section is None:
+            return None
+        today = today or date.today()
+        ranges = sorted(filter(None, (_range_months(m, today) for m in DATE_RANGE_RE.finditer(section))))
+        if not ranges:
+            return None
+        # overlapping jobs are counted once
+        months, (current_start, current_end) = 0, ranges[0]
+        for start, end in ranges[1:]:
+            if start <= current_end:
+                current_end = max(current_end, end)
+            else:
+                months += current_end - current_start
+                current_start, current_end = start, end
+        months += current_end - current_start
+        years = round(months / 12, 1)
+    return f"{years:g}"
+
+
+EXTRACTORS = {
+    "email": extract_email,
+    "full_name": extract_full_name,
+    "phone_number": extract_phone_number,
+    "gender": extract_gender,
+    "disability": extract_disability,
+    "experience_years": extract_experience_years,
+}
+
+
+def extract_applicant_fields(text):
+    """Returns the fields found locally; undetermined fields are omitted."""
+    fields = {}
+    for name, extractor in EXTRACTORS.items():
+        value = extractor(text)
+        if value:
+            fields[name] = value
+    return fields
+
+
+class FallbackStats:
+    """Counts resumes processed and how many needed the LLM for some field."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.resumes = 0
+        self.fallbacks = 0
+        self.missing = dict.fromkeys(APPLICANT_FIELDS, 0)
+
+    def record(self, missing_fields):
+        with self.lock:
+            self.resumes += 1
+            if missing_fields:
+                self.fallbacks += 1
+            for name in missing_fields:
+                self.missing[name] += 1
+
+    def snapshot(self):
+        with self.lock:
+            rate = self.fallbacks / self.resumes if self.resumes else 0.0
+            return {"resumes": self.resumes, "llm_fallbacks": self.fallbacks,
+                    "fallback_rate": round(rate, 3), "missing": dict(self.missing)}
+
+
+FALLBACK_STATS = FallbackStats()
@@ -1,9 +1,15 @@
 import os
+import io
+import asyncio
+import hashlib
 import logging
 import httpx
 import uuid
 from fastapi import HTTPException, UploadFile
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential
 from app.utils.config_local import Config as config
+from app.database.models.stored_file_model import StoredFileDocument
+from app.utils.executors import run_blocking
 import json
 import magic
 
@@ -14,52 +20,89 @@ logger = logging.getLogger(__name__)
 HR_UPLOAD_URL = config.UPLOAD_URL
 HR_UPLOAD_USER = config.UPLOAD_USER
 HR_UPLOAD_PASSWORD = config.UPLOAD_PASSWORD
+ALLOWED_UPLOAD_TYPES = {
+    "application/pdf",
+    "application/msword",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "application/octet-stream" #docx
+}
+VALID_DOCUMENT_CATEGORIES = {"resume", "contract", "id_document", "timesheet", "other"}
+UPLOAD_ATTEMPTS = 3
+DIGEST_CHUNK_SIZE = 1024 * 1024
 
-async def upload_file(
-    file: UploadFile,
-    document_category: str = "other"
-) -> str:
-    """
-    Uploads an incoming file to the Agentic HR HTTP API and returns its public URL.
-    Raises HTTPException on invalid type or upload failure.
-    """
-    # 1. Validate MIME type
-    allowed_types = {
-        "application/pdf",
-        "application/msword",
-        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        "application/octet-stream" #docx
-    }
-    if file.content_type not in allowed_types:
+# One keep-alive client per process, opened in the app lifespan
+_client = None
+_lock = asyncio.Lock()
+
+
+def _http2_available():
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+async def start_storage_client():
+    """Opens the shared upload client: pooled keep-alive connections and Basic auth set up once."""
+    global _client
+    async with _lock:
+        if _client is not None:
+            return _client
+        http2 = config.UPLOAD_HTTP2 and _http2_available()
+        if config.UPLOAD_HTTP2 and not http2:
+            logger.warning("UPLOAD_HTTP2 is set but the h2 package is not installed; using HTTP/1.1")
+        _client = httpx.AsyncClient(
+            auth=(HR_UPLOAD_USER, HR_UPLOAD_PASSWORD),
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=config.UPLOAD_MAX_CONNECTIONS,
+                max_keepalive_connections=config.UPLOAD_MAX_CONNECTIONS,
+            ),
+            timeout=httpx.Timeout(config.UPLOAD_TIMEOUT),
+        )
+        return _client
+
+
+async def close_storage_client():
+    global _client
+    async with _lock:
+        if _client is not None:
+            await _client.aclose()
+        _client = None
+
+
+async def get_storage_client():
+    if _client is not None:
+        return _client
+    return await start_storage_client()
+
+
+def _validate_upload(content_type, document_category):
+    if content_type not in ALLOWED_UPLOAD_TYPES:
         raise HTTPException(
             status_code=400,
             detail="Invalid file type. Only PDF and DOCX allowed."
         )
-    
-    
-    # 2. Validate or coerce document_category
-    valid_categories = {"resume", "contract", "id_document", "timesheet", "other"}
-    if document_category not in valid_categories:
+    if document_category not in VALID_DOCUMENT_CATEGORIES:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid document_category. Must be one of {valid_categories}."
+            detail=f"Invalid document_category. Must be one of {VALID_DOCUMENT_CATEGORIES}."
         )
 
-    # 3. Generate a random UUID4 for file_id
-    file_id = str(uuid.uuid4()) 
 
-    # 4. Construct the upload URL
+async def _post_file(filename, file, content_type, document_category):
+    """Uploads one file on the shared client under a fresh file id and returns its URL."""
+    file_id = str(uuid.uuid4())
     url = f"{HR_UPLOAD_URL}/api/hr-upload/upload/{file_id}"
 
-    # 5. Perform the POST with Basic Auth and multipart/form-data
     try:
-        async with httpx.AsyncClient(auth=(HR_UPLOAD_USER, HR_UPLOAD_PASSWORD)) as client:
-            response = await client.post(
-                url,
-                headers={"x-document-category": document_category},
-                files={"file": (file.filename, file.file, file.content_type)}
-            )  # :contentReference[oaicite:1]{index=1}
-
+        client = await get_storage_client()
+        response = await client.post(
+            url,
+            headers={"x-document-category": document_category},
+            files={"file": (filename, file, content_type)}
+        )
     except httpx.HTTPError as e:
         logger.critical(f"Error connecting to upload service: {str(e)}")
         raise HTTPException(
@@ -67,7 +110,6 @@ async def upload_file(
             detail=f"Error connecting to upload service: {str(e)}"
         )
 
-    # 6. Handle non-200 responses
     if response.status_code != 200:
         logger.critical(f"Upload failed: {response.text}")
         raise HTTPException(
@@ -75,7 +117,6 @@ async def upload_file(
             detail=f"Upload failed: {response.text}"
         )
 
-    # 7. Parse and return the uploaded file URL
     data = response.json()
     file_url = data.get("file_url")
     if not file_url:
@@ -84,5 +125,106 @@ async def upload_file(
             status_code=500,
             detail="Unexpected response format: missing 'file_url'"
         )
+    return file_url
+
+
+def file_digest(file):
+    """SHA-256 hex digest and size of a file object; it is left at position 0."""
+    digest = hashlib.sha256()
+    size = 0
+    file.seek(0)
+    while chunk := file.read(DIGEST_CHUNK_SIZE):
+        digest.update(chunk)
+        size += len(chunk)
+    file.seek(0)
+    return digest.hexdigest(), size
+
+
+async def store_file(
+    file: UploadFile,
+    document_category: str = "other"
+) -> tuple:
+    """
+    Uploads a file unless identical bytes were uploaded before, and returns
+    (file_url, sha256 digest). A known digest returns the registered URL without
+    a network transfer. Raises HTTPException on invalid type or upload failure.
+    """
+    _validate_upload(file.content_type, document_category)
+    digest, size = await run_blocking(file_digest, file.file)
+    known = await StoredFileDocument.get_file_urls([digest])
+    if digest in known:
+        logger.info(f"{file.filename} already stored as {digest[:12]}, skipping upload")
+        return known[digest], digest
 
+    file_url = await _post_file(file.filename, file.file, file.content_type, document_category)
+    await StoredFileDocument.register(digest, file_url, file.filename, file.content_type, size)
+    return file_url, digest
+
+
+async def upload_file(
+    file: UploadFile,
+    document_category: str = "other"
+) -> str:
+    """
+    Uploads an incoming file to the Agentic HR HTTP API and returns its public URL.
+    Raises HTTPException on invalid type or upload failure.
+    """
+    file_url, _ = await store_file(file, document_category)
     return file_url
+
+
+def _is_retryable(exception):
+    """Connection errors, timeouts and 5xx answers; a rejected file is not retried."""
+    return isinstance(exception, HTTPException) and exception.status_code >= 500
+
+
+async def _upload_with_retry(filename, content, content_type, document_category):
+    async for attempt in AsyncRetrying(
+        retry=retry_if_exception(_is_retryable),
+        stop=stop_after_attempt(UPLOAD_ATTEMPTS),
+        wait=wait_exponential(multiplier=0.5, max=5),
+        reraise=True,
+    ):
+        with attempt:
+            return await _post_file(filename, io.BytesIO(content), content_type, document_category)
+
+
+def _digests(contents):
+    return [hashlib.sha256(content).hexdigest() for content in contents]
+
+
+async def upload_many(files, document_category="other", concurrency=None):
+    """
+    Uploads (filename, content bytes, content_type) tuples on the shared client
+    with at most `concurrency` (default Config.UPLOAD_CONCURRENCY) uploads in
+    flight, retrying each file on its own. Files whose digest is already
+    registered are not uploaded, and identical files in the list are uploaded
+    once. Returns one entry per file, in order: (file_url, digest), or the
+    exception that made it fail.
+    """
+    semaphore = asyncio.Semaphore(concurrency or config.UPLOAD_CONCURRENCY)
+    digests = await run_blocking(_digests, [content for _, content, _ in files])
+    known = await StoredFileDocument.get_file_urls(set(digests))
+    if known:
+        logger.info(f"{sum(d in known for d in digests)} of {len(files)} files already stored, skipping their upload")
+
+    async def upload(filename, content, content_type, digest):
+        _validate_upload(content_type, document_category)
+        if digest in known:
+            return known[digest]
+        async with semaphore:
+            file_url = await _upload_with_retry(filename, content, content_type, document_category)
+        await StoredFileDocument.register(digest, file_url, filename, content_type, len(content))
+        return file_url
+
+    uploads = {}
+    for (filename, content, content_type), digest in zip(files, digests):
+        if digest not in uploads:
+            uploads[digest] = asyncio.ensure_future(upload(filename, content, content_type, digest))
+    await asyncio.gather(*uploads.values(), return_exceptions=True)
+
+    results = []
+    for digest in digests:
+        task = uploads[digest]
+        results.append(task.exception() or (task.result(), digest))
+    return results
@@ -12,6 +12,46 @@ class Config:
     UPLOAD_PASSWORD = os.getenv("UPLOAD_PASSWORD",  None)
  
     GEMINI_KEY = os.getenv("GEMINI_API_KEY", None)
+    # number of resumes from one bulk ZIP processed concurrently
+    BULK_CONCURRENCY = int(os.getenv("BULK_CONCURRENCY", 8))
+    # shared upload client: pooled connections, uploads in flight per upload_many
+    # call, request timeout in seconds and HTTP/2 (needs the h2 package)
+    UPLOAD_MAX_CONNECTIONS = int(os.getenv("UPLOAD_MAX_CONNECTIONS", 32))
+    UPLOAD_CONCURRENCY = int(os.getenv("UPLOAD_CONCURRENCY", 16))
+    UPLOAD_TIMEOUT = float(os.getenv("UPLOAD_TIMEOUT", 60))
+    UPLOAD_HTTP2 = os.getenv("UPLOAD_HTTP2", "false").lower() == "true"
+    # resumes read from a bulk ZIP and uploaded together before they are processed
+    BULK_UPLOAD_BATCH = int(os.getenv("BULK_UPLOAD_BATCH", 100))
+    # seconds without progress after which a processing bulk batch is reported as failed
+    # (its worker died or restarted); progress is every processed resume and uploaded group
+    BULK_BATCH_STALE_SECONDS = int(os.getenv("BULK_BATCH_STALE_SECONDS", 900))
+    # channels kept open on the shared RabbitMQ publisher connection
+    PUBLISHER_CHANNEL_POOL_SIZE = int(os.getenv("PUBLISHER_CHANNEL_POOL_SIZE", 4))
+    # recommendation pre-filter: candidates sent to LLM scoring and their minimum
+    # CV/job cosine similarity, unless a request overrides them
+    RECOMMENDATION_TOP_K = int(os.getenv("RECOMMENDATION_TOP_K", 50))
+    RECOMMENDATION_MIN_SIMILARITY = float(os.getenv("RECOMMENDATION_MIN_SIMILARITY", 0.2))
+    # OCR of image-only PDFs: worker processes (1 OCRs on the calling thread),
+    # render resolution bounds and pages whose text is kept in memory
+    OCR_WORKERS = int(os.getenv("OCR_WORKERS", min(4, os.cpu_count() or 1)))
+    OCR_MIN_DPI = int(os.getenv("OCR_MIN_DPI", 150))
+    OCR_MAX_DPI = int(os.getenv("OCR_MAX_DPI", 300))
+    OCR_CACHE_SIZE = int(os.getenv("OCR_CACHE_SIZE", 256))
+    # document text extraction (doc_extraction): worker processes (0 extracts on the
+    # calling thread) and extracted texts kept in memory, keyed by content digest
+    EXTRACTION_WORKERS = int(os.getenv("EXTRACTION_WORKERS", 0))
+    EXTRACTION_CACHE_SIZE = int(os.getenv("EXTRACTION_CACHE_SIZE", 128))
+    # executors for blocking work in request handlers: parse worker processes and
+    # blocking-call threads, calls each lets in at once (more wait on the event
+    # loop) and the queue time in seconds above which a call is logged
+    PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", min(4, os.cpu_count() or 1)))
+    PARSE_MAX_IN_FLIGHT = int(os.getenv("PARSE_MAX_IN_FLIGHT", 32))
+    BLOCKING_WORKERS = int(os.getenv("BLOCKING_WORKERS", 32))
+    BLOCKING_MAX_IN_FLIGHT = int(os.getenv("BLOCKING_MAX_IN_FLIGHT", 128))
+    EXECUTOR_QUEUE_WARNING = float(os.getenv("EXECUTOR_QUEUE_WARNING", 5.0))
+    # page size of the job and application list endpoints
+    DEFAULT_PAGE_SIZE = int(os.getenv("DEFAULT_PAGE_SIZE", 50))
+    MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", 200))
 
     if not GEMINI_KEY:
         logger.error("Gemini_key not set")
@@ -0,0 +1,165 @@
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from app.utils.config_local import Config
+
+logger = logging.getLogger(__name__)
+
+
+def _timed_call(fn, args, kwargs):
+    """
+    Runs fn in the executor and reports when it started and finished, so the
+    caller can tell time spent queued from time spent running. Exceptions are
+    returned rather than raised so their timings are kept too.
+    """
+    started = time.time()
+    try:
+        return True, fn(*args, **kwargs), started, time.time()
+    except Exception as e:
+        return False, e, started, time.time()
+
+
+class ExecutorStats:
+    """Counters and timings of one executor. Only touched on the event loop thread."""
+
+    def __init__(self, name, workers, max_in_flight):
+        self.name = name
+        self.workers = workers
+        self.max_in_flight = max_in_flight
+        self.waiting = 0  # held back on the event loop by max_in_flight
+        self.in_flight = 0  # handed to the executor: queued there or running
+        self.completed = 0
+        self.failed = 0
+        self.queue_time_total = 0.0
+        self.queue_time_max = 0.0
+        self.run_time_total = 0.0
+        self.run_time_max = 0.0
+
+    def record(self, queue_time, run_time, ok):
+        if ok:
+            self.completed += 1
+        else:
+            self.failed += 1
+        self.queue_time_total += queue_time
+        self.queue_time_max = max(self.queue_time_max, queue_time)
+        self.run_time_total += run_time
+        self.run_time_max = max(self.run_time_max, run_time)
+
+    def snapshot(self):
+        calls = self.completed + self.failed
+        return {
+            "workers": self.workers,
+            "max_in_flight": self.max_in_flight,
+            "waiting": self.waiting,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "failed": self.failed,
+            "queue_time_avg": self.queue_time_total / calls if calls else 0.0,
+            "queue_time_max": self.queue_time_max,
+            "run_time_avg": self.run_time_total / calls if calls else 0.0,
+            "run_time_max": self.run_time_max,
+        }
+
+
+class _Executor:
+    """
+    An executor behind a limit on calls in flight. Calls over the limit wait
+    on the event loop, so a burst of uploads cannot queue unbounded work (and
+    the bytes it holds) inside the executor. Queue time runs from the call to
+    the moment a worker picks the function up.
+    """
+
+    def __init__(self, name, factory, workers, max_in_flight):
+        self.name = name
+        self.factory = factory
+        self.executor = None
+        self.slots = asyncio.Semaphore(max_in_flight)
+        self.stats = ExecutorStats(name, workers, max_in_flight)
+
+    def start(self):
+        if self.executor is None:
+            self.executor = self.factory()
+        return self.executor
+
+    def shutdown(self, wait=True):
+        if self.executor is not None:
+            self.executor.shutdown(wait=wait, cancel_futures=True)
+        self.executor = None
+
+    async def run(self, fn, *args, **kwargs):
+        called = time.time()
+        self.stats.waiting += 1
+        try:
+            await self.slots.acquire()
+        finally:
+            self.stats.waiting -= 1
+        self.stats.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            ok, result, started, finished = await loop.run_in_executor(self.start(), _timed_call, fn, args, kwargs)
+        except BrokenProcessPool:
+            # a crashed worker takes the pool down; the next call starts a new one
+            logger.error(f"{self.name} executor broke running {getattr(fn, '__name__', fn)}, restarting it")
+            self.stats.failed += 1
+            self.shutdown(wait=False)
+            raise
+        finally:
+            self.stats.in_flight -= 1
+            self.slots.release()
+
+        queue_time = started - called
+        self.stats.record(queue_time, finished - started, ok)
+        if queue_time > Config.EXECUTOR_QUEUE_WARNING:
+            logger.warning(f"{getattr(fn, '__name__', fn)} waited {queue_time:.1f}s for the {self.name} executor")
+        if not ok:
+            raise result
+        return result
+
+
+# CPU-bound parsing (PDF page counting, file sniffing, text extraction and OCR)
+# runs in spawned processes, since the app process also runs threads
+_parse = _Executor(
+    "parse",
+    lambda: ProcessPoolExecutor(max_workers=Config.PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn")),
+    Config.PARSE_WORKERS,
+    Config.PARSE_MAX_IN_FLIGHT,
+)
+# blocking I/O: synchronous SDK and HTTP calls (Gemini, notifications), archive and file access
+_blocking = _Executor(
+    "blocking",
+    lambda: ThreadPoolExecutor(max_workers=Config.BLOCKING_WORKERS, thread_name_prefix="blocking"),
+    Config.BLOCKING_WORKERS,
+    Config.BLOCKING_MAX_IN_FLIGHT,
+)
+
+
+async def run_parse(fn, *args, **kwargs):
+    """
+    Runs fn(*args, **kwargs) on the parse process pool. fn must be a module-level
+    function and its arguments and result picklable.
+    """
+    return await _parse.run(fn, *args, **kwargs)
+
+
+async def run_blocking(fn, *args, **kwargs):
+    """Runs a blocking fn(*args, **kwargs) on the blocking-call thread pool."""
+    return await _blocking.run(fn, *args, **kwargs)
+
+
+def start_executors():
+    """Starts both executors, so the first upload does not wait for them."""
+    _parse.start()
+    _blocking.start()
+
+
+def shutdown_executors():
+    _parse.shutdown()
+    _blocking.shutdown()
+
+
+def executor_stats():
+    """Current counters and queue/run times (seconds) of both executors."""
+    return {executor.name: executor.stats.snapshot() for executor in (_parse, _blocking)}
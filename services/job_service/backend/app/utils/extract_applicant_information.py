@@ -4,6 +4,7 @@ from app.utils.config_local import Config
 from dotenv import load_dotenv
 import google.generativeai as genai
 from app.utils.file_reader import extract_text_from_file
+from app.utils.applicant_fields import APPLICANT_FIELDS, FALLBACK_STATS, extract_applicant_fields
 import logging
 
 load_dotenv()
@@ -34,7 +35,45 @@ def extract_applicant_information(resume_file_path):
 
     # Extract text from the resume file
     extracted_applicant_resume = extract_text_from_file(resume_file_path)
+    return extract_applicant_information_from_text(extracted_applicant_resume)
 
+# output_format entries of the prompt, per field
+FIELD_FORMATS = {
+    "email": "string",
+    "full_name": "string",
+    "phone_number": "string",
+    "gender": "string ('Male' or 'Female' or 'Unknown')",
+    "disability": "string or 'Unknown'",
+    "experience_years": "string",
+}
+
+def extract_applicant_information_from_text(extracted_applicant_resume):
+    """
+    Extracts specific details from already extracted resume text. A local regex
+    pass runs first; the AI model is only asked for the fields it could not
+    determine.
+    """
+    result = extract_applicant_fields(extracted_applicant_resume)
+    missing = [field for field in APPLICANT_FIELDS if field not in result]
+    FALLBACK_STATS.record(missing)
+    if not missing:
+        return result
+
+    stats = FALLBACK_STATS.snapshot()
+    logger.info(
+        f"Asking the AI model for {missing}; LLM fallback rate "
+        f"{stats['llm_fallbacks']}/{stats['resumes']} ({stats['fallback_rate']:.1%})"
+    )
+    llm_result = extract_applicant_information_with_model(extracted_applicant_resume, missing)
+    if "error" in llm_result:
+        return {**result, "error": llm_result["error"]}
+    result.update({field: llm_result[field] for field in missing if field in llm_result})
+    return result
+
+def extract_applicant_information_with_model(extracted_applicant_resume, fields=APPLICANT_FIELDS):
+    """
+    Extracts the given fields from already extracted resume text using an AI model.
+    """
     # Sanitize and truncate the extracted text to prevent prompt injection and manage prompt length
     sanitized_resume = extracted_applicant_resume.replace('"', '\\"').replace('\n', ' ')
 
@@ -43,14 +82,7 @@ def extract_applicant_information(resume_file_path):
     {{
       "task": "Extract specific details from the provided resume text and output them as a JSON object. If any information is not available, set its value to 'Unknown'.",
       "resume_text": "{sanitized_resume}",
-      "output_format": {{
-        "email": "string",
-        "full_name": "string",
-        "phone_number": "string",
-        "gender": "string ('Male' or 'Female' or 'Unknown')",
-        "disability": "string or 'Unknown'",
-        "experience_years": "string"
-      }},
+      "output_format": {json.dumps({field: FIELD_FORMATS[field] for field in fields})},
       "instructions": [
         {{
           "step": 1,
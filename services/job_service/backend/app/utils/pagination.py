@@ -0,0 +1,68 @@
+import base64
+import json
+import logging
+from bson import ObjectId
+from bson.errors import InvalidId
+from app.utils.config_local import Config
+
+logger = logging.getLogger(__name__)
+
+
+def page_size(limit):
+    """Clamps a requested page size; None means the default page size."""
+    if limit is None:
+        return Config.DEFAULT_PAGE_SIZE
+    return max(1, min(int(limit), Config.MAX_PAGE_SIZE))
+
+
+def split_fields(fields):
+    """Parses the comma separated `fields` query parameter."""
+    if not fields:
+        return None
+    return [field.strip() for field in fields.split(",") if field.strip()]
+
+
+def encode_cursor(document, sort_field="_id"):
+    """Opaque cursor pointing just past `document` in (sort_field desc, _id desc) order."""
+    payload = {"id": str(document["_id"])}
+    if sort_field != "_id":
+        payload["value"] = document.get(sort_field)
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_cursor(cursor):
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+        return ObjectId(payload["id"]), payload.get("value")
+    except (ValueError, KeyError, TypeError, InvalidId) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def keyset_filter(cursor, sort_field="_id"):
+    """
+    Filter selecting the documents after `cursor` for a descending sort on
+    (sort_field, _id). Documents missing sort_field sort last, as MongoDB does.
+    """
+    if not cursor:
+        return {}
+    last_id, last_value = decode_cursor(cursor)
+    if sort_field == "_id":
+        return {"_id": {"$lt": last_id}}
+    if last_value is None:
+        return {sort_field: None, "_id": {"$lt": last_id}}
+    return {"$or": [
+        {sort_field: {"$lt": last_value}},
+        {sort_field: last_value, "_id": {"$lt": last_id}},
+        {sort_field: None},
+    ]}
+
+
+def paginate(documents, limit, sort_field="_id"):
+    """
+    Splits a page fetched with limit + 1 into the page and the cursor of the next
+    one (None on the last page). Must run before _id is stringified.
+    """
+    if len(documents) <= limit:
+        return documents, None
+    documents = documents[:limit]
+    return documents, encode_cursor(documents[-1], sort_field)
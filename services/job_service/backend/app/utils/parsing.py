@@ -0,0 +1,42 @@
+"""
+Parsing run on the parse process pool (app.utils.executors.run_parse). The
+functions are module-level and take and return plain bytes and strings, so
+they pickle across the process boundary.
+"""
+import fitz  # PyMuPDF
+import magic
+from doc_extraction import Extractor
+from app.utils.config_local import Config
+
+# libmagic only needs the leading bytes to identify PDF/DOCX
+MAGIC_HEADER_BYTES = 2048
+
+_extractor = None
+
+
+def _worker_extractor():
+    """The extractor of this worker process. It is already one of PARSE_WORKERS, so it OCRs inline."""
+    global _extractor
+    if _extractor is None:
+        _extractor = Extractor(
+            cache_size=Config.EXTRACTION_CACHE_SIZE,
+            ocr_workers=1,
+            ocr_min_dpi=Config.OCR_MIN_DPI,
+            ocr_max_dpi=Config.OCR_MAX_DPI,
+            ocr_cache_size=Config.OCR_CACHE_SIZE,
+        )
+    return _extractor
+
+
+def count_pdf_pages(content: bytes) -> int:
+    with fitz.open(stream=content, filetype="pdf") as doc:
+        return len(doc)
+
+
+def sniff_mime_types(headers: list) -> list:
+    """libmagic MIME type of each file, given its first MAGIC_HEADER_BYTES."""
+    return [magic.from_buffer(header, mime=True) for header in headers]
+
+
+def extract_resume_text(content: bytes, filename: str) -> str:
+    return _worker_extractor().extract(content, filename)
@@ -1,4 +1,6 @@
+import asyncio
 import aio_pika
+from aio_pika.pool import Pool
 from app.utils.config_local import Config
 from tenacity import retry, wait_fixed, stop_after_attempt
 import json
@@ -6,24 +8,95 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-@retry(wait=wait_fixed(2), stop=stop_after_attempt(5))
+PUBLISH_ATTEMPTS = 5
+PUBLISH_RETRY_WAIT = 2
+
+# One robust connection per process, shared by a small pool of confirm-enabled channels
+_connection = None
+_channel_pool = None
+_lock = asyncio.Lock()
+
+
+async def start_publisher():
+    """Opens the shared connection, creates the channel pool and declares the queue once."""
+    global _connection, _channel_pool
+    async with _lock:
+        if _channel_pool is not None:
+            return _channel_pool
+        connection = await aio_pika.connect_robust(Config.RABBITMQ_URL)
+
+        async def get_channel():
+            return await connection.channel(publisher_confirms=True)
+
+        channel_pool = Pool(get_channel, max_size=Config.PUBLISHER_CHANNEL_POOL_SIZE)
+        async with channel_pool.acquire() as channel:
+            await channel.declare_queue(Config.QUEUE_NAME, durable=True)
+        _connection, _channel_pool = connection, channel_pool
+        logger.info("RabbitMQ publisher connected")
+        return _channel_pool
+
+
+async def close_publisher():
+    global _connection, _channel_pool
+    async with _lock:
+        if _channel_pool is not None:
+            await _channel_pool.close()
+        if _connection is not None:
+            await _connection.close()
+        _connection, _channel_pool = None, None
+
+
+async def get_channel_pool():
+    if _channel_pool is not None:
+        return _channel_pool
+    return await start_publisher()
+
+
+def _build_message(message):
+    return aio_pika.Message(
+        body=json.dumps(message, ensure_ascii=False).encode(),
+        delivery_mode=aio_pika.DeliveryMode.PERSISTENT
+    )
+
+
+@retry(wait=wait_fixed(PUBLISH_RETRY_WAIT), stop=stop_after_attempt(PUBLISH_ATTEMPTS))
 async def publish_application(message):
     """Publishes a message to RabbitMQ with retry handling."""
     try:
-        connection = await aio_pika.connect_robust(Config.RABBITMQ_URL)
-        async with connection:
-            channel = await connection.channel(publisher_confirms=True)
-            await channel.declare_queue(Config.QUEUE_NAME, durable=True)
-            
-            await channel.default_exchange.publish(
-                aio_pika.Message(
-                    body=json.dumps(message, ensure_ascii=False).encode(),
-                    delivery_mode=aio_pika.DeliveryMode.PERSISTENT
-                ),
-                routing_key=Config.QUEUE_NAME
-            )
+        channel_pool = await get_channel_pool()
+        async with channel_pool.acquire() as channel:
+            await channel.default_exchange.publish(_build_message(message), routing_key=Config.QUEUE_NAME)
         logger.info(f"Message sent successfully for app_id: {message.get('application_id')}")
     except Exception as e:
         logger.critical(f"Published failed to send message: {str(e)}")
         raise  # Re-raise to trigger retry
 
+
+async def publish_applications(messages):
+    """
+    Publishes many messages on one channel. The publishes are pipelined and their
+    confirms awaited together; only the messages that were not confirmed are retried.
+    Returns the messages still unconfirmed after PUBLISH_ATTEMPTS (empty when all went through).
+    """
+    pending = list(messages)
+    for attempt in range(1, PUBLISH_ATTEMPTS + 1):
+        if not pending:
+            break
+        try:
+            channel_pool = await get_channel_pool()
+            async with channel_pool.acquire() as channel:
+                results = await asyncio.gather(
+                    *(channel.default_exchange.publish(_build_message(m), routing_key=Config.QUEUE_NAME) for m in pending),
+                    return_exceptions=True,
+                )
+            failed = [m for m, result in zip(pending, results) if isinstance(result, BaseException)]
+        except Exception as e:
+            logger.critical(f"Batch publish attempt {attempt} failed: {str(e)}")
+            failed = pending
+        logger.info(f"Batch publish attempt {attempt}: {len(pending) - len(failed)}/{len(pending)} messages confirmed")
+        pending = failed
+        if pending and attempt < PUBLISH_ATTEMPTS:
+            await asyncio.sleep(PUBLISH_RETRY_WAIT)
+    if pending:
+        logger.critical(f"Failed to publish {len(pending)} of {len(messages)} messages")
+    return pending
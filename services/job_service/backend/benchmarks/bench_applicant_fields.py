@@ -0,0 +1,64 @@
+"""
+Runs the local applicant field extractor over a folder (or ZIP) of resumes and
+reports how many would still need the LLM, per field, and how long the local
+pass takes. No LLM is called.
+
+Usage (from services/job_service/backend):
+    python -m benchmarks.bench_applicant_fields path/to/resumes.zip
+"""
+import argparse
+import os
+import statistics
+import time
+import zipfile
+from collections import Counter
+
+from app.utils.applicant_fields import APPLICANT_FIELDS, extract_applicant_fields
+from app.utils.file_reader import extract_text_from_bytes
+
+RESUME_EXTENSIONS = (".pdf", ".docx", ".txt")
+
+
+def iter_resumes(path):
+    """Yields (filename, content) for every resume in a folder or ZIP archive."""
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            for name in archive.namelist():
+                if name.lower().endswith(RESUME_EXTENSIONS) and not name.startswith("__MACOSX/"):
+                    yield os.path.basename(name), archive.read(name)
+        return
+    for root, _, files in os.walk(path):
+        for name in files:
+            if name.lower().endswith(RESUME_EXTENSIONS):
+                with open(os.path.join(root, name), "rb") as f:
+                    yield name, f.read()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="folder or ZIP archive of resumes")
+    args = parser.parse_args()
+
+    missing, timings, resumes, fallbacks = Counter(), [], 0, 0
+    for filename, content in iter_resumes(args.path):
+        text = extract_text_from_bytes(content, filename)
+        start = time.perf_counter()
+        fields = extract_applicant_fields(text)
+        timings.append(time.perf_counter() - start)
+
+        absent = [field for field in APPLICANT_FIELDS if field not in fields]
+        missing.update(absent)
+        resumes += 1
+        fallbacks += bool(absent)
+
+    if not resumes:
+        print("no resumes found")
+        return
+    print(f"resumes: {resumes}, needing the LLM: {fallbacks} ({fallbacks / resumes:.1%})")
+    print(f"local pass: median {statistics.median(timings) * 1000:.2f}ms per resume")
+    for field in APPLICANT_FIELDS:
+        print(f"  {field:<17} missing in {missing[field]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Seeds a local MongoDB with one job and N applications (each with a candidate,
+screening result and interview) and compares the old per-application lookups
+with the $lookup aggregation in ApplicationDocument.get_applications_by_job.
+
+Usage (from services/job_service/backend):
+    MONGODB_URI=mongodb://localhost:27017/hr_db python -m benchmarks.bench_applications_by_job --applications 5000
+
+The seeded documents are tagged and removed afterwards.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+# Config asserts these on import; the benchmark only talks to MongoDB
+os.environ.setdefault("MONGODB_URI", "mongodb://localhost:27017/hr_db")
+for name in ("UPLOAD_URL", "UPLOAD_USER", "UPLOAD_PASSWORD"):
+    os.environ.setdefault(name, "")
+
+from bson import ObjectId
+
+from app.database.database import database
+from app.database.models.application_model import ApplicationDocument
+from app.database.models.candidate_model import CandidateDocument
+from app.database.models.interview_model import InterviewsDocument
+from app.database.models.screen_result_model import ScreeningResultDocument
+
+SEED_TAG = "bench_applications_by_job"
+
+
+async def seed(count):
+    job_id = str(ObjectId())
+    candidates, applications, screenings, interviews = [], [], [], []
+    for i in range(count):
+        candidate_id, application_id = ObjectId(), ObjectId()
+        candidates.append({
+            "_id": candidate_id, "seed": SEED_TAG, "full_name": f"Candidate {i}",
+            "email": f"candidate{i}@example.com", "skills": ["python", "mongodb"],
+        })
+        applications.append({
+            "_id": application_id, "seed": SEED_TAG, "job_id": job_id,
+            "candidate_id": str(candidate_id), "cv_link": f"https://example.com/cv/{i}.pdf",
+            "application_status": "pending", "shortlisted": False, "shortlist_comments": [], "source": "bench",
+        })
+        screenings.append({
+            "seed": SEED_TAG, "application_id": str(application_id), "score": i % 100,
+            "reasoning": "lorem ipsum " * 40, "parsed_cv": {"skills": ["python"]},
+        })
+        if i % 2 == 0:
+            interviews.append({"seed": SEED_TAG, "application_id": str(application_id), "interview_status": "pending"})
+
+    await database.get_collection(CandidateDocument.collection_name).insert_many(candidates)
+    await database.get_collection(ApplicationDocument.collection_name).insert_many(applications)
+    await database.get_collection(ScreeningResultDocument.collection_name).insert_many(screenings)
+    if interviews:
+        await database.get_collection(InterviewsDocument.collection_name).insert_many(interviews)
+    return job_id
+
+
+async def cleanup():
+    for collection in (CandidateDocument, ApplicationDocument, ScreeningResultDocument, InterviewsDocument):
+        await database.get_collection(collection.collection_name).delete_many({"seed": SEED_TAG})
+
+
+async def n_plus_one(job_id):
+    """The previous implementation: three extra queries per application."""
+    applications = await ApplicationDocument.get_collection().find({"job_id": job_id}).to_list(None)
+    for app in applications:
+        app["_id"] = str(app["_id"])
+        app["candidate"] = await CandidateDocument.get_candidate_by_id(app["candidate_id"])
+        app["screening"] = await ScreeningResultDocument.get_by_application_id(app["_id"])
+        app["interview"] = await InterviewsDocument.get_interview_by_app_id(app["_id"])
+    return applications
+
+
+async def measure(fn, job_id, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = await fn(job_id)
+        timings.append(time.perf_counter() - start)
+    return result, timings
+
+
+async def run(args):
+    await cleanup()
+    job_id = await seed(args.applications)
+    try:
+        legacy, legacy_times = await measure(n_plus_one, job_id, args.repeat)
+        current, current_times = await measure(ApplicationDocument.get_applications_by_job, job_id, args.repeat)
+        assert len(legacy) == len(current) == args.applications
+        legacy_by_id = {app["_id"]: app for app in legacy}
+        for app in current:
+            expected = legacy_by_id[app["_id"]]
+            assert app["candidate"]["_id"] == expected["candidate"]["_id"]
+            assert (app["screening"] or {}).get("_id") == (expected["screening"] or {}).get("_id")
+            assert (app["interview"] or {}).get("_id") == (expected["interview"] or {}).get("_id")
+
+        print(f"applications: {args.applications}, repeats: {args.repeat}")
+        print(f"N+1 lookups: median {statistics.median(legacy_times):.3f}s ({1 + 3 * args.applications} queries)")
+        print(f"aggregation: median {statistics.median(current_times):.3f}s (1 query)")
+    finally:
+        await cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--applications", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
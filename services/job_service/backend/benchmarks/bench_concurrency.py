@@ -0,0 +1,85 @@
+"""
+Requests per second of an application listing under parallel load, served with
+the previous blocking pymongo calls ("sync") and with the Motor document classes
+("async"). Both handlers run inside `async def` routes on a single event loop,
+as they would in one uvicorn worker.
+
+Usage (from services/job_service/backend):
+    MONGODB_URI=mongodb://localhost:27017/hr_db python -m benchmarks.bench_concurrency --concurrency 50 --requests 2000
+
+The seeded documents are tagged and removed afterwards.
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.bench_applications_by_job import cleanup, seed
+
+import httpx
+from fastapi import FastAPI
+from pymongo import MongoClient
+
+from app.database.models.application_model import ApplicationDocument
+from app.utils.config_local import Config
+
+PAGE_SIZE = 50
+
+
+def build_app():
+    app = FastAPI()
+    sync_db = MongoClient(Config.MONGODB_URL).hr_db
+
+    @app.get("/sync/{job_id}")
+    async def list_sync(job_id: str):
+        # the pre-Motor pattern: a blocking driver call inside an async route
+        applications = list(sync_db.applications.find({"job_id": job_id}).sort("_id", -1).limit(PAGE_SIZE))
+        return {"count": len(applications)}
+
+    @app.get("/async/{job_id}")
+    async def list_async(job_id: str):
+        applications, _ = await ApplicationDocument.list_applications(job_id=job_id, limit=PAGE_SIZE, with_details=False)
+        return {"count": len(applications)}
+
+    return app
+
+
+async def load(client, path, total, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            response = await client.get(path)
+            response.raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    return total / (time.perf_counter() - start)
+
+
+async def run(args):
+    await cleanup()
+    job_id = await seed(args.applications)
+    try:
+        transport = httpx.ASGITransport(app=build_app())
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for mode in ("sync", "async"):
+                # warm up connections and the query plan cache
+                await load(client, f"/{mode}/{job_id}", args.concurrency, args.concurrency)
+                rps = await load(client, f"/{mode}/{job_id}", args.requests, args.concurrency)
+                print(f"{mode:>5}: {rps:8.1f} req/s ({args.requests} requests, concurrency {args.concurrency})")
+    finally:
+        await cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--applications", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
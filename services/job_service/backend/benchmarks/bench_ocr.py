@@ -0,0 +1,94 @@
+"""
+Builds synthetic scanned CVs (text pages rasterized and re-embedded as images,
+so the PDFs have no text layer) and compares the previous OCR loop (300 DPI RGB,
+one page at a time on the calling thread) with doc_extraction's OcrEngine, cold
+and with its page cache warm.
+
+Usage (from services/job_service/backend):
+    OCR_WORKERS=4 python -m benchmarks.bench_ocr --documents 5 --pages 3
+"""
+import argparse
+import os
+import statistics
+import time
+
+# Config asserts these on import; the benchmark makes no network calls
+for name in ("UPLOAD_URL", "UPLOAD_USER", "UPLOAD_PASSWORD"):
+    os.environ.setdefault(name, "")
+
+import fitz  # PyMuPDF
+import pytesseract
+from PIL import Image
+
+from doc_extraction import OcrEngine
+
+from app.utils.config_local import Config
+
+PARAGRAPH = (
+    "Senior backend engineer with {years} years of experience building Python services. "
+    "Designed FastAPI and MongoDB systems handling {load} requests per second, "
+    "introduced RabbitMQ based pipelines and mentored a team of {team} developers. "
+)
+
+
+def synthetic_scan(seed, pages, scan_dpi=200):
+    """A PDF whose pages are grayscale scans of generated CV text."""
+    source = fitz.open()
+    for page_num in range(pages):
+        page = source.new_page()
+        text = "\n\n".join(
+            PARAGRAPH.format(years=seed + i, load=1000 * (page_num + 1), team=i + 2) for i in range(8)
+        )
+        page.insert_textbox(page.rect + (50, 50, -50, -50), f"Candidate {seed}\n\n{text}", fontsize=11)
+
+    scanned = fitz.open()
+    for page in source:
+        pix = page.get_pixmap(dpi=scan_dpi, colorspace=fitz.csGRAY)
+        target = scanned.new_page(width=page.rect.width, height=page.rect.height)
+        target.insert_image(target.rect, pixmap=pix)
+    return scanned.tobytes()
+
+
+def legacy_ocr(doc):
+    """The previous extract_text_from_image_pdf loop."""
+    text = []
+    for page_num, page in enumerate(doc):
+        pix = page.get_pixmap(dpi=300)
+        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+        text.append(f"--- PAGE {page_num + 1} ---\n{pytesseract.image_to_string(img)}")
+    return '\n'.join(text)
+
+
+def measure(fn, documents):
+    timings = []
+    for content in documents:
+        with fitz.open(stream=content, filetype="pdf") as doc:
+            start = time.perf_counter()
+            fn(doc)
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=5)
+    parser.add_argument("--pages", type=int, default=3)
+    args = parser.parse_args()
+
+    engine = OcrEngine(Config.OCR_WORKERS, Config.OCR_MIN_DPI, Config.OCR_MAX_DPI, Config.OCR_CACHE_SIZE)
+    ocr_document = engine.ocr_document
+    documents = [synthetic_scan(seed, args.pages) for seed in range(args.documents)]
+    # start the worker processes outside the timed runs
+    measure(ocr_document, [synthetic_scan(args.documents, 2)])
+
+    legacy = measure(legacy_ocr, documents)
+    cold = measure(ocr_document, documents)
+    warm = measure(ocr_document, documents)
+
+    print(f"{args.documents} scanned CVs x {args.pages} pages, OCR_WORKERS={Config.OCR_WORKERS}")
+    for label, timings in (("legacy", legacy), ("pool (cold)", cold), ("pool (cached)", warm)):
+        print(f"{label:>14}: median {statistics.median(timings):.2f}s per CV")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Compares PDF text extraction over a corpus of CVs: the previous path (pdfminer
+layout analysis on a temporary file) against the doc_extraction PDF backend
+(PyMuPDF text layer, in memory, result cache off). Reports throughput and
+output parity as the word-sequence similarity of the two texts. Scanned PDFs,
+which both paths OCR, are skipped.
+
+Usage (from services/job_service/backend):
+    python -m benchmarks.bench_pdf_extraction path/to/cvs --repeat 3
+"""
+import argparse
+import difflib
+import os
+import statistics
+import tempfile
+import time
+
+from doc_extraction import MIN_TEXT_CHARS, Extractor
+from pdfminer.high_level import extract_text
+
+# texts whose word sequences agree less than this are listed
+PARITY_WARNING = 0.9
+
+
+def current_extract(content):
+    return Extractor(cache_size=0, ocr=False).extract(content, "cv.pdf")
+
+
+def legacy_extract(content):
+    """The previous extract_text_from_pdf_bytes without its OCR fallback."""
+    with tempfile.NamedTemporaryFile(delete=True, suffix='.pdf') as tmp:
+        tmp.write(content)
+        tmp.seek(0)
+        return extract_text(tmp.name)
+
+
+def parity(a, b):
+    return difflib.SequenceMatcher(None, a.split(), b.split(), autojunk=False).ratio()
+
+
+def timed(fn, content, repeat):
+    timings, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(content)
+        timings.append(time.perf_counter() - start)
+    return result, min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="folder of PDF files")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    legacy_total = current_total = size_total = 0.0
+    scores, divergent, skipped = [], [], 0
+    for root, _, files in os.walk(args.path):
+        for name in sorted(files):
+            if not name.lower().endswith(".pdf"):
+                continue
+            with open(os.path.join(root, name), "rb") as f:
+                content = f.read()
+            legacy_text, legacy_time = timed(legacy_extract, content, args.repeat)
+            if len(legacy_text.strip()) < MIN_TEXT_CHARS:
+                skipped += 1
+                continue
+            current_text, current_time = timed(current_extract, content, args.repeat)
+
+            legacy_total += legacy_time
+            current_total += current_time
+            size_total += len(content)
+            score = parity(legacy_text, current_text)
+            scores.append(score)
+            if score < PARITY_WARNING:
+                divergent.append((name, score))
+
+    if not scores:
+        print(f"no text PDFs found ({skipped} scanned skipped)")
+        return
+    megabytes = size_total / (1024 * 1024)
+    print(f"{len(scores)} PDFs ({megabytes:.1f} MB), {skipped} scanned skipped")
+    print(f"pdfminer: {len(scores) / legacy_total:7.1f} docs/s {megabytes / legacy_total:6.2f} MB/s")
+    print(f"PyMuPDF:  {len(scores) / current_total:7.1f} docs/s {megabytes / current_total:6.2f} MB/s "
+          f"({legacy_total / current_total:.1f}x)")
+    print(f"parity: mean {statistics.mean(scores):.3f}, min {min(scores):.3f}")
+    for name, score in sorted(divergent, key=lambda item: item[1]):
+        print(f"  {score:.3f} {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# tests/test_applicant_fields.py
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.utils.applicant_fields import (
+    extract_applicant_fields,
+    extract_experience_years,
+    extract_full_name,
+    extract_phone_number,
+)
+
+RESUME = """Abebe Kebede
+Data Analyst
+abebe.kebede@example.com | +251 911 234 567
+Addis Ababa, Ethiopia
+
+Experience
+Data Analyst, Acme  Jan 2019 - Jan 2021
+"""
+
+
+def test_phone_in_contact_line():
+    assert extract_phone_number(RESUME) == "+251 911 234 567"
+
+
+def test_phone_on_labelled_line_below_the_header():
+    text = "\n".join(["Summary"] + [f"line {i}" for i in range(20)] + ["Mobile: (011) 555-0199-22"])
+    assert extract_phone_number(text) == "(011) 555-0199-22"
+
+
+def test_year_ranges_are_not_phones():
+    assert extract_phone_number("Experience 2015 - 2019 2020 - 2023") is None
+    assert extract_phone_number("ID 2019-2020-123") is None
+
+
+def test_digits_outside_the_header_are_not_phones():
+    text = "\n".join(["Jane Doe"] + [f"line {i}" for i in range(20)] + ["Order 123456789012"])
+    assert extract_phone_number(text) is None
+
+
+def test_name_next_to_contact_line():
+    assert extract_full_name(RESUME) == "Abebe Kebede"
+
+
+def test_labelled_name():
+    assert extract_full_name("Curriculum Vitae\nName: JANE DOE\nSkills: SQL") == "Jane Doe"
+
+
+def test_name_needs_evidence():
+    assert extract_full_name("Project Management Professional\nSkills\nExcel") is None
+    assert extract_full_name("Jane Doe\nSkills\nExcel") is None
+
+
+def test_title_next_to_contact_line_is_not_a_name():
+    text = "Project Management Professional\njane@example.com"
+    assert extract_full_name(text) is None
+
+
+def test_experience_from_date_ranges():
+    assert extract_experience_years(RESUME) == "2"
+
+
+def test_applicant_fields_omit_undetermined():
+    fields = extract_applicant_fields(RESUME)
+    assert fields["email"] == "abebe.kebede@example.com"
+    assert fields["full_name"] == "Abebe Kebede"
+    assert fields["phone_number"] == "+251 911 234 567"
+    assert "experience_years" in fields
@@ -0,0 +1,63 @@
+# tests/test_screen_result_model.py
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("motor")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+# app.utils.config_local checks these at import; the tests never connect
+for name in ("UPLOAD_URL", "UPLOAD_USER", "UPLOAD_PASSWORD"):
+    os.environ.setdefault(name, "test")
+
+from app.database.models.screen_result_model import ScreeningResultDocument
+
+
+def matches(document, query):
+    for field, condition in query.items():
+        if isinstance(condition, dict) and "$in" in condition:
+            if document.get(field) not in condition["$in"]:
+                return False
+        elif document.get(field) != condition:
+            return False
+    return True
+
+
+class FakeCollection:
+    def __init__(self, documents):
+        self.documents = documents
+
+    async def find_one(self, query):
+        return next((dict(d) for d in self.documents if matches(d, query)), None)
+
+    async def delete_one(self, query):
+        for i, document in enumerate(self.documents):
+            if matches(document, query):
+                del self.documents[i]
+                return type("Result", (), {"deleted_count": 1})()
+        return type("Result", (), {"deleted_count": 0})()
+
+
+@pytest.fixture
+def screenings(monkeypatch):
+    # the recommendation screening comes first, so an unfiltered lookup would hit it
+    documents = [
+        {"_id": 1, "application_id": "app-1", "job_id": "other-job", "score": 40},
+        {"_id": 2, "application_id": "app-1", "score": 80},
+    ]
+    monkeypatch.setattr(ScreeningResultDocument, "get_collection", classmethod(lambda cls: FakeCollection(documents)))
+    return documents
+
+
+def test_get_by_application_id_returns_own_screening(screenings):
+    result = asyncio.run(ScreeningResultDocument.get_by_application_id("app-1"))
+    assert result["_id"] == "2"
+
+
+def test_delete_by_application_id_keeps_recommendation_screenings(screenings):
+    assert asyncio.run(ScreeningResultDocument.delete_by_application_id("app-1"))
+    assert [d["_id"] for d in screenings] == [1]
+    assert not asyncio.run(ScreeningResultDocument.delete_by_application_id("app-1"))
@@ -51,11 +51,10 @@ export async function findJobs({
   type?: string;
   skills?: string;
 }): Promise<Job[]> {
-  const jobs = await getJobs();
+  const jobs = await getAllJobs();
 
   
   return jobs
-    .map(formatJobDetails) 
     .filter((job) => {
       const matchesSearch = search
         ? job.title.toLowerCase().includes(search.toLowerCase()) ||
@@ -79,16 +78,33 @@ export async function findJobs({
     });
 }
 
-export async function getJobs(): Promise<Job[]> {
-  try {
-    const response = await fetch(`${API_BASE}/jobs/open`);
-    if (!response.ok) {
-      throw new Error(`Error fetching jobs: ${response.statusText}`);
-    }
+export type JobsPage = {
+  jobs: Job[];
+  next_cursor: string | null;
+};
 
-    const data = await response.json();
-    
-    return (data.jobs || []).map(formatJobDetails); 
+// one page of open jobs; pass next_cursor to get the following one
+export async function getJobs(cursor?: string | null): Promise<JobsPage> {
+  const response = await fetch(`${API_BASE}/jobs/open${cursor ? `?cursor=${encodeURIComponent(cursor)}` : ""}`);
+  if (!response.ok) {
+    throw new Error(`Error fetching jobs: ${response.statusText}`);
+  }
+
+  const data = await response.json();
+  return { jobs: (data.jobs || []).map(formatJobDetails), next_cursor: data.next_cursor || null };
+}
+
+// every open job, following next_cursor; only for lookups over the whole board
+export async function getAllJobs(): Promise<Job[]> {
+  try {
+    const jobs: Job[] = [];
+    let cursor: string | null = null;
+    do {
+      const page: JobsPage = await getJobs(cursor);
+      jobs.push(...page.jobs);
+      cursor = page.next_cursor;
+    } while (cursor);
+    return jobs;
   } catch (error) {
     console.error("Failed to fetch jobs:", error);
     return [];
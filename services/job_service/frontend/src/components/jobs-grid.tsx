@@ -3,6 +3,7 @@
 import { useEffect, useState } from "react";
 import Link from "next/link";
 import { Badge } from "@/components/ui/badge";
+import { Button } from "@/components/ui/button";
 import { Card } from "@/components/ui/card";
 import { formatDate } from "@/lib/utils";
 import { getJobs, Job } from "@/actions/get-api";
@@ -14,13 +15,17 @@ export default function JobsGrid() {
   const [jobs, setJobs] = useState<Job[]>([]);
   const [loading, setLoading] = useState<boolean>(true);
   const [error, setError] = useState<string>("");
+  // cursor of the next page of jobs; null once every job is loaded
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState<boolean>(false);
 
-  // Load jobs once on mount.
+  // Load the first page once on mount.
   useEffect(() => {
     async function loadJobs() {
       try {
-        const fetchedJobs = await getJobs();
-        setJobs(fetchedJobs);
+        const page = await getJobs();
+        setJobs(page.jobs);
+        setNextCursor(page.next_cursor);
       } catch (err: any) {
         console.error(err);
         setError(err.message || "Failed to load jobs");
@@ -31,7 +36,29 @@ export default function JobsGrid() {
     loadJobs();
   }, []);
 
-  // Client-side filtering
+  async function loadMoreJobs() {
+    setLoadingMore(true);
+    try {
+      const page = await getJobs(nextCursor);
+      setJobs((prev) => [...prev, ...page.jobs]);
+      setNextCursor(page.next_cursor);
+    } catch (err: any) {
+      console.error(err);
+      setError(err.message || "Failed to load jobs");
+    } finally {
+      setLoadingMore(false);
+    }
+  }
+
+  const loadMore = nextCursor && (
+    <div className="flex justify-center mt-6">
+      <Button variant="outline" onClick={loadMoreJobs} disabled={loadingMore}>
+        {loadingMore ? "Loading..." : "Load more jobs"}
+      </Button>
+    </div>
+  );
+
+  // Client-side filtering over the jobs loaded so far
   const filteredJobs = jobs.filter((job) => {
     if (job.job_status.toLowerCase() === 'closed') return false;
     const matchesSearch = search
@@ -77,6 +104,7 @@ export default function JobsGrid() {
 
   if (!filteredJobs.length) {
     return (
+      <>
       <div className="border-2 border-dashed border-primary/20 rounded-xl p-8 text-center">
         <div className="text-2xl text-primary/50 mb-4"></div>
         <h3 className="text-xl font-semibold text-primary mb-2">
@@ -86,10 +114,13 @@ export default function JobsGrid() {
           Check back later or subscribe to job alerts
         </p>
       </div>
+      {loadMore}
+      </>
     );
   }
 
   return (
+    <>
     <div className="grid gap-4 md:grid-cols-2 lg:grid-cols-3">
       {filteredJobs.map((job) => (
         <Link
@@ -150,5 +181,7 @@ export default function JobsGrid() {
         </Link>
       ))}
     </div>
+    {loadMore}
+    </>
   );
 }
@@ -0,0 +1,15 @@
+from .backends import MIN_TEXT_CHARS, UnsupportedFormat, register_backend
+from .extractor import Extractor, extract_text, read_source
+from .ocr import OcrEngine
+from .sniff import sniff_content_type
+
+__all__ = [
+    "Extractor",
+    "MIN_TEXT_CHARS",
+    "OcrEngine",
+    "UnsupportedFormat",
+    "extract_text",
+    "read_source",
+    "register_backend",
+    "sniff_content_type",
+]
@@ -0,0 +1,91 @@
+import io
+import logging
+
+from . import sniff
+
+logger = logging.getLogger(__name__)
+
+# fewer characters than this in the text layer means a scanned PDF, which is OCRed
+MIN_TEXT_CHARS = 50
+
+# content type -> backend(content: bytes, ocr: OcrEngine | None) -> str
+BACKENDS = {}
+
+
+class UnsupportedFormat(ValueError):
+    """No backend extracts text from the document's content type."""
+
+
+def register_backend(*content_types):
+    """Registers the decorated function as the backend for content_types, replacing any previous one."""
+    def decorator(backend):
+        for content_type in content_types:
+            BACKENDS[content_type] = backend
+        return backend
+    return decorator
+
+
+def get_backend(content_type):
+    try:
+        return BACKENDS[content_type]
+    except KeyError:
+        raise UnsupportedFormat(f"Unsupported content type: {content_type}") from None
+
+
+@register_backend(sniff.PDF)
+def extract_pdf(content, ocr):
+    """
+    Text of a PDF from PyMuPDF's native text layer, OCRed when the layer is
+    (nearly) empty. pdfminer is only used when PyMuPDF cannot read the file.
+    """
+    import fitz  # PyMuPDF
+    from pdfminer.high_level import extract_text
+
+    try:
+        doc = fitz.open(stream=content, filetype="pdf")
+    except Exception as e:
+        logger.warning(f"PyMuPDF could not open the PDF, falling back to pdfminer: {str(e)}")
+        return extract_text(io.BytesIO(content))
+
+    with doc:
+        try:
+            text = '\n'.join(page.get_text("text", sort=True) for page in doc)
+        except Exception as e:
+            logger.warning(f"PyMuPDF text extraction failed, falling back to pdfminer: {str(e)}")
+            text = extract_text(io.BytesIO(content))
+
+        # Check if text extraction might have failed (image-based PDF)
+        if len(text.strip()) < MIN_TEXT_CHARS and ocr is not None:
+            logger.info("Low text count, attempting OCR")
+            return ocr.ocr_document(doc)
+        return text
+
+
+@register_backend(sniff.DOCX)
+def extract_docx(content, ocr):
+    from docx import Document
+
+    doc = Document(io.BytesIO(content))
+    return '\n'.join(para.text for para in doc.paragraphs)
+
+
+@register_backend(sniff.PPTX)
+def extract_pptx(content, ocr):
+    from pptx import Presentation
+
+    presentation = Presentation(io.BytesIO(content))
+    return '\n'.join(
+        shape.text for slide in presentation.slides for shape in slide.shapes if hasattr(shape, "text")
+    )
+
+
+@register_backend(sniff.PNG, sniff.JPEG, sniff.TIFF)
+def extract_image(content, ocr):
+    if ocr is None:
+        raise UnsupportedFormat("Images need OCR, which is disabled")
+    return ocr.ocr_picture(content)
+
+
+@register_backend(sniff.TEXT)
+def extract_plain_text(content, ocr):
+    return content.decode('utf-8', errors='replace')
@@ -0,0 +1,35 @@
+import threading
+from collections import OrderedDict
+
+
+class ResultCache:
+    """Thread-safe, size-bounded LRU of extraction results; a maxsize of 0 disables it."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            if key not in self.data:
+                return None
+            self.data.move_to_end(key)
+            return self.data[key]
+
+    def set(self, key, value):
+        if self.maxsize <= 0:
+            return
+        with self.lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+            while len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+
+    def __len__(self):
+        with self.lock:
+            return len(self.data)
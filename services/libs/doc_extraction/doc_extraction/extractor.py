@@ -0,0 +1,147 @@
+import hashlib
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from .backends import get_backend
+from .cache import ResultCache
+from .ocr import OcrEngine
+from .sniff import HEADER_BYTES, sniff_content_type
+
+logger = logging.getLogger(__name__)
+
+# size of the reads from file objects and paths
+CHUNK_SIZE = 1024 * 1024
+
+# OCR engines of a pool worker process, one per OCR settings tuple
+_worker_engines = {}
+
+
+def _worker_engine(ocr_settings):
+    if ocr_settings is None:
+        return None
+    engine = _worker_engines.get(ocr_settings)
+    if engine is None:
+        min_dpi, max_dpi, cache_size = ocr_settings
+        # a worker is already one of several processes, so it OCRs its pages itself
+        engine = _worker_engines[ocr_settings] = OcrEngine(1, min_dpi, max_dpi, cache_size)
+    return engine
+
+
+def _run_backend(backend, content, ocr_settings):
+    """Runs in the extraction pool worker processes."""
+    return backend(content, _worker_engine(ocr_settings))
+
+
+def read_source(source):
+    """
+    Content and sha256 hex digest of bytes, a binary file object or a path.
+    File objects and paths are read in CHUNK_SIZE pieces, hashed as they arrive.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        content = bytes(source)
+        return content, hashlib.sha256(content).hexdigest()
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            return read_source(f)
+
+    digest = hashlib.sha256()
+    chunks = []
+    while chunk := source.read(CHUNK_SIZE):
+        digest.update(chunk)
+        chunks.append(chunk)
+    return b"".join(chunks), digest.hexdigest()
+
+
+class Extractor:
+    """
+    Extracts text from documents, picking the backend from the content type
+    sniffed out of the document's first bytes.
+
+    cache_size: extracted texts kept in memory, keyed on the content digest
+    workers: extraction worker processes; 0 extracts on the calling thread
+    ocr: OCR scanned PDFs and images (needs tesseract); without it a scanned
+        PDF yields its (empty) text layer and images are unsupported
+    ocr_workers, ocr_min_dpi, ocr_max_dpi, ocr_cache_size: see OcrEngine; with
+        extraction workers each of them OCRs its own pages instead
+    """
+
+    def __init__(self, cache_size: int = 256, workers: int = 0, ocr: bool = True, ocr_workers: int = 1,
+                 ocr_min_dpi: int = 150, ocr_max_dpi: int = 300, ocr_cache_size: int = 256):
+        self.cache = ResultCache(cache_size)
+        self.workers = workers
+        self.ocr = OcrEngine(ocr_workers, ocr_min_dpi, ocr_max_dpi, ocr_cache_size) if ocr else None
+        self._ocr_settings = (ocr_min_dpi, ocr_max_dpi, ocr_cache_size) if ocr else None
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self):
+        """The extraction process pool, started on first use. Spawned, since the callers are threaded."""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def _reset_pool(self):
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def close(self):
+        """Stops the extraction and OCR worker processes."""
+        self._reset_pool()
+        if self.ocr is not None:
+            self.ocr.close()
+
+    def _run(self, backend, content):
+        if self.workers <= 0:
+            return backend(content, self.ocr)
+        try:
+            return self._get_pool().submit(_run_backend, backend, content, self._ocr_settings).result()
+        except BrokenProcessPool:
+            # a crashed worker takes the pool down; extract here and start a new pool next time
+            logger.error("Extraction process pool broke, extracting on the calling thread")
+            self._reset_pool()
+            return backend(content, self.ocr)
+
+    def content_type(self, source, filename: str = None, content_type: str = None) -> str:
+        """Sniffed content type of a document."""
+        content, _ = read_source(source)
+        return sniff_content_type(content[:HEADER_BYTES], filename, content_type)
+
+    def extract(self, source, filename: str = None, content_type: str = None) -> str:
+        """
+        Text of a document given as bytes, a binary file object or a path.
+        filename and content_type are hints for formats the header bytes leave
+        ambiguous. Raises UnsupportedFormat when no backend handles the document.
+        """
+        content, digest = read_source(source)
+        sniffed = sniff_content_type(content[:HEADER_BYTES], filename, content_type)
+        key = f"{digest}:{sniffed}"
+        text = self.cache.get(key)
+        if text is not None:
+            return text
+
+        text = self._run(get_backend(sniffed), content)
+        self.cache.set(key, text)
+        return text
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def extract_text(source, filename: str = None, content_type: str = None) -> str:
+    """Extractor.extract on a process-wide Extractor with the default settings."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = Extractor()
+    return _default.extract(source, filename, content_type)
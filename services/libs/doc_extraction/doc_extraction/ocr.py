@@ -0,0 +1,130 @@
+import hashlib
+import io
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from .cache import ResultCache
+
+logger = logging.getLogger(__name__)
+
+# longer page side in pixels that OCR is tuned for: a letter page at 300 DPI
+OCR_TARGET_PIXELS = 3300
+
+
+def ocr_image(width, height, samples):
+    """OCRs one 8-bit grayscale image. Runs in the worker processes."""
+    import pytesseract
+    from PIL import Image
+
+    return pytesseract.image_to_string(Image.frombuffer("L", (width, height), samples, "raw", "L", 0, 1))
+
+
+class OcrEngine:
+    """
+    Tesseract OCR of scanned PDF pages and images. Pages are rendered in
+    grayscale at a resolution adapted to the page and OCRed on a spawned
+    process pool of `workers` (1 OCRs on the calling thread); text of a page
+    seen before (same rendered pixels) comes from an LRU of `cache_size` pages.
+    """
+
+    def __init__(self, workers: int = 1, min_dpi: int = 150, max_dpi: int = 300, cache_size: int = 256):
+        self.workers = workers
+        self.min_dpi = min_dpi
+        self.max_dpi = max_dpi
+        self.cache = ResultCache(cache_size)
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self):
+        """The OCR process pool, started on first use. Spawned, since the callers are threaded."""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def close(self):
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def page_dpi(self, page):
+        """
+        Render resolution for a page: OCR_TARGET_PIXELS on the longer side, within
+        [min_dpi, max_dpi], and never above the resolution of the largest
+        embedded scan, since rendering finer than the source adds no detail.
+        """
+        longest_inches = max(page.rect.width, page.rect.height) / 72
+        dpi = OCR_TARGET_PIXELS / longest_inches if longest_inches else self.max_dpi
+        native = 0
+        for image in page.get_images(full=True):
+            width, height = image[2], image[3]
+            native = max(native, max(width, height) / longest_inches if longest_inches else 0)
+        if native:
+            dpi = min(dpi, native)
+        return int(max(self.min_dpi, min(self.max_dpi, dpi)))
+
+    def _render(self, page):
+        """Grayscale pixmap of a page: one byte per pixel, no RGB conversion or alpha."""
+        import fitz  # PyMuPDF
+
+        pix = page.get_pixmap(dpi=self.page_dpi(page), colorspace=fitz.csGRAY, alpha=False)
+        return pix.width, pix.height, pix.samples
+
+    def _cached_ocr(self, width, height, samples):
+        key = hashlib.sha256(samples).hexdigest()
+        text = self.cache.get(key)
+        if text is None:
+            text = ocr_image(width, height, samples)
+            self.cache.set(key, text)
+        return text
+
+    def ocr_document(self, doc):
+        """
+        OCRs every page of an open fitz document. Pages are rendered here and
+        OCRed on the process pool while the next pages render.
+        """
+        pending = []
+        parallel = self.workers > 1 and len(doc) > 1
+        for page in doc:
+            width, height, samples = self._render(page)
+            key = hashlib.sha256(samples).hexdigest()
+            cached = self.cache.get(key)
+            if cached is not None:
+                pending.append((key, cached, None))
+            elif parallel:
+                pending.append((key, None, self._get_pool().submit(ocr_image, width, height, samples)))
+            else:
+                pending.append((key, ocr_image(width, height, samples), None))
+            del samples
+
+        texts = []
+        for page_num, (key, text, future) in enumerate(pending):
+            if future is not None:
+                try:
+                    text = future.result()
+                except BrokenProcessPool:
+                    # a crashed worker takes the pool down; OCR this page here and start a new pool next time
+                    logger.error("OCR process pool broke, OCRing on the calling thread")
+                    self.close()
+                    text = ocr_image(*self._render(doc[page_num]))
+            self.cache.set(key, text)
+            texts.append(f"--- PAGE {page_num + 1} ---\n{text}")
+        return '\n'.join(texts)
+
+    def ocr_picture(self, content: bytes):
+        """OCRs an image file (PNG, JPEG, TIFF; every frame of a multi-page TIFF)."""
+        from PIL import Image, ImageSequence
+
+        texts = []
+        with Image.open(io.BytesIO(content)) as image:
+            for frame in ImageSequence.Iterator(image):
+                gray = frame.convert("L")
+                texts.append(self._cached_ocr(gray.width, gray.height, gray.tobytes()))
+        return '\n'.join(texts)
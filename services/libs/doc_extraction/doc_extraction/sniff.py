@@ -0,0 +1,84 @@
+import os
+
+# bytes read from the start of a document to decide its type
+HEADER_BYTES = 4096
+
+PDF = "application/pdf"
+DOCX = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+PPTX = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+XLSX = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+DOC = "application/msword"
+ZIP = "application/zip"
+PNG = "image/png"
+JPEG = "image/jpeg"
+TIFF = "image/tiff"
+TEXT = "text/plain"
+UNKNOWN = "application/octet-stream"
+
+EXTENSIONS = {
+    ".pdf": PDF,
+    ".docx": DOCX,
+    ".pptx": PPTX,
+    ".xlsx": XLSX,
+    ".doc": DOC,
+    ".png": PNG,
+    ".jpg": JPEG,
+    ".jpeg": JPEG,
+    ".tif": TIFF,
+    ".tiff": TIFF,
+    ".txt": TEXT,
+}
+
+# part names that identify an OOXML package, as they appear in its local file headers
+_OOXML_PARTS = ((b"word/", DOCX), (b"ppt/", PPTX), (b"xl/", XLSX))
+_OLE2 = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+
+
+def _hinted_type(filename, content_type):
+    declared = (content_type or "").split(";")[0].strip().lower()
+    extension = os.path.splitext(filename or "")[1].lower()
+    return declared, EXTENSIONS.get(extension)
+
+
+def _is_text(header):
+    if b"\x00" in header:
+        return False
+    try:
+        header.decode("utf-8")
+    except UnicodeDecodeError as e:
+        # a multi-byte character cut off by the end of the header is still text
+        return e.start >= len(header) - 3 and len(header) >= HEADER_BYTES
+    return True
+
+
+def sniff_content_type(header: bytes, filename: str = None, content_type: str = None) -> str:
+    """
+    Content type of a document from its first bytes. The filename extension
+    and the declared content type are only used to tell apart formats the
+    header cannot, such as an OOXML package whose first entry is not under
+    word/, ppt/ or xl/; they never override the magic bytes.
+    """
+    declared, by_extension = _hinted_type(filename, content_type)
+
+    # PDF readers accept junk before the signature, within the first KiB
+    if b"%PDF-" in header[:1024]:
+        return PDF
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return PNG
+    if header.startswith(b"\xff\xd8\xff"):
+        return JPEG
+    if header.startswith((b"II*\x00", b"MM\x00*")):
+        return TIFF
+    if header.startswith(b"PK\x03\x04"):
+        for part, ooxml_type in _OOXML_PARTS:
+            if part in header:
+                return ooxml_type
+        for hint in (declared, by_extension):
+            if hint in (DOCX, PPTX, XLSX):
+                return hint
+        return ZIP
+    if header.startswith(_OLE2):
+        return DOC
+    if header and _is_text(header):
+        return TEXT
+    return UNKNOWN
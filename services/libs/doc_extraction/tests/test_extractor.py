@@ -0,0 +1,62 @@
+# tests/test_extractor.py
+import io
+
+import pytest
+
+from doc_extraction import Extractor, UnsupportedFormat, read_source, register_backend
+from doc_extraction import backends, extractor
+
+
+@pytest.fixture
+def counting_text_backend(monkeypatch):
+    calls = []
+
+    def backend(content, ocr):
+        calls.append(content)
+        return content.decode("utf-8")
+
+    monkeypatch.setitem(backends.BACKENDS, "text/plain", backend)
+    return calls
+
+
+def test_sources_read_alike(tmp_path, monkeypatch):
+    monkeypatch.setattr(extractor, "CHUNK_SIZE", 4)
+    content = b"Senior engineer, ten years of Python"
+    path = tmp_path / "cv.txt"
+    path.write_bytes(content)
+
+    expected = read_source(content)
+    assert read_source(io.BytesIO(content)) == expected
+    assert read_source(path) == expected
+    assert read_source(str(path)) == expected
+
+
+def test_result_cached_on_digest(counting_text_backend):
+    ext = Extractor(ocr=False)
+    assert ext.extract(b"same resume") == "same resume"
+    assert ext.extract(io.BytesIO(b"same resume"), filename="other.txt") == "same resume"
+    assert ext.extract(b"another resume") == "another resume"
+    assert counting_text_backend == [b"same resume", b"another resume"]
+
+
+def test_cache_disabled(counting_text_backend):
+    ext = Extractor(cache_size=0, ocr=False)
+    ext.extract(b"resume")
+    ext.extract(b"resume")
+    assert len(counting_text_backend) == 2
+
+
+def test_unsupported_format():
+    with pytest.raises(UnsupportedFormat):
+        Extractor(ocr=False).extract(b"\x00\x01binary", "cv.bin")
+
+
+def test_images_need_ocr():
+    with pytest.raises(UnsupportedFormat):
+        Extractor(ocr=False).extract(b"\x89PNG\r\n\x1a\n....")
+
+
+def test_registered_backend(monkeypatch):
+    monkeypatch.setattr(backends, "BACKENDS", dict(backends.BACKENDS))
+    register_backend("application/zip")(lambda content, ocr: "archive")
+    assert Extractor(ocr=False).extract(b"PK\x03\x04rest") == "archive"
@@ -0,0 +1,42 @@
+# tests/test_sniff.py
+import io
+import zipfile
+
+from doc_extraction import sniff_content_type
+from doc_extraction import sniff
+
+
+def ooxml(first_part):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr(first_part, "<xml/>")
+    return buffer.getvalue()
+
+
+def test_magic_bytes_win_over_hints():
+    assert sniff_content_type(b"%PDF-1.7\n...", "resume.docx", "text/plain") == sniff.PDF
+    assert sniff_content_type(b"\x89PNG\r\n\x1a\n....", "scan.pdf") == sniff.PNG
+    assert sniff_content_type(b"\xff\xd8\xff\xe0....") == sniff.JPEG
+
+
+def test_pdf_signature_after_leading_junk():
+    assert sniff_content_type(b"\r\n\x00junk%PDF-1.4\n") == sniff.PDF
+
+
+def test_ooxml_by_part_name():
+    assert sniff_content_type(ooxml("word/document.xml")) == sniff.DOCX
+    assert sniff_content_type(ooxml("ppt/presentation.xml")) == sniff.PPTX
+
+
+def test_ooxml_falls_back_to_hints():
+    header = ooxml("[Content_Types].xml")
+    assert sniff_content_type(header) == sniff.ZIP
+    assert sniff_content_type(header, "cv.docx") == sniff.DOCX
+    assert sniff_content_type(header, content_type=sniff.PPTX + "; charset=binary") == sniff.PPTX
+
+
+def test_text_and_binary():
+    assert sniff_content_type("Jane Doe — Engineer\n".encode("utf-8")) == sniff.TEXT
+    assert sniff_content_type(b"\x00\x01\x02\x03", "notes.txt") == sniff.UNKNOWN
+    assert sniff_content_type(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1rest") == sniff.DOC
+    assert sniff_content_type(b"") == sniff.UNKNOWN
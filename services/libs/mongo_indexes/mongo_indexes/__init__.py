@@ -0,0 +1,27 @@
+from .indexes import (
+    check_pipeline_plans,
+    check_pipeline_plans_async,
+    check_query_plans,
+    check_query_plans_async,
+    drop_changed_indexes,
+    drop_changed_indexes_async,
+    ensure_indexes,
+    ensure_indexes_async,
+    plan_stages,
+    remove_duplicates,
+    remove_duplicates_async,
+)
+
+__all__ = [
+    "check_pipeline_plans",
+    "check_pipeline_plans_async",
+    "check_query_plans",
+    "check_query_plans_async",
+    "drop_changed_indexes",
+    "drop_changed_indexes_async",
+    "ensure_indexes",
+    "ensure_indexes_async",
+    "plan_stages",
+    "remove_duplicates",
+    "remove_duplicates_async",
+]
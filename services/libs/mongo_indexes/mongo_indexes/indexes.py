@@ -0,0 +1,210 @@
+"""
+Index maintenance shared by the services. Each service keeps its own INDEXES
+((collection, keys, options)) and HOT_QUERIES ((collection, filter, sort))
+lists and calls these with its database: the plain functions take a pymongo
+database, the *_async ones a Motor database.
+"""
+import logging
+from pymongo import errors
+
+logger = logging.getLogger(__name__)
+
+# MongoDB's error code for a unique index violated by existing documents
+DUPLICATE_KEY = 11000
+
+
+def _log_failure(collection, keys, e):
+    logger.error(f"Failed to create index {keys} on {collection}: {e}")
+    if getattr(e, "code", None) == DUPLICATE_KEY:
+        logger.error(f"{collection} holds duplicates under {keys}; remove them with the service's indexes --migrate")
+
+
+def ensure_indexes(db, indexes):
+    """
+    Creates every index that does not exist yet. A failure (for example existing
+    duplicates under a unique index) is logged and does not stop the others.
+    Returns the names of the indexes that could not be created.
+    """
+    failed = []
+    for collection, keys, options in indexes:
+        try:
+            name = db[collection].create_index(keys, **options)
+            logger.debug(f"Index {collection}.{name} ensured")
+        except errors.PyMongoError as e:
+            failed.append(f"{collection}.{keys}")
+            _log_failure(collection, keys, e)
+    return failed
+
+
+async def ensure_indexes_async(db, indexes):
+    """ensure_indexes on a Motor database."""
+    failed = []
+    for collection, keys, options in indexes:
+        try:
+            name = await db[collection].create_index(keys, **options)
+            logger.debug(f"Index {collection}.{name} ensured")
+        except errors.PyMongoError as e:
+            failed.append(f"{collection}.{keys}")
+            _log_failure(collection, keys, e)
+    return failed
+
+
+def plan_stages(plan):
+    """Yields every stage name in an explain() query plan tree."""
+    yield plan.get("stage")
+    for child in plan.get("inputStages", []) + [plan[key] for key in ("inputStage", "queryPlan") if key in plan]:
+        yield from plan_stages(child)
+
+
+def _query_planners(explained):
+    """queryPlanner sections of an explain(): a find's own, or those of an aggregation's $cursor stages."""
+    if "queryPlanner" in explained:
+        yield explained["queryPlanner"]
+    for stage in explained.get("stages", []):
+        if "$cursor" in stage:
+            yield from _query_planners(stage["$cursor"])
+
+
+def _bad_plan(explained, collection, description, bad_stages=("COLLSCAN",)):
+    stages = set()
+    for planner in _query_planners(explained):
+        stages.update(plan_stages(planner["winningPlan"]))
+    found = sorted(stage for stage in bad_stages if stage in stages)
+    if found:
+        logger.error(f"{'/'.join(found)} on {collection} for {description}")
+        return True
+    logger.info(f"{collection} {description}: {sorted(s for s in stages if s)}")
+    return False
+
+
+def check_query_plans(db, queries):
+    """Runs explain() on each hot query and returns the ones whose winning plan is a COLLSCAN."""
+    collscans = []
+    for collection, query, sort in queries:
+        cursor = db[collection].find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+        if _bad_plan(cursor.explain(), collection, f"{query} sort={sort}"):
+            collscans.append((collection, query, sort))
+    return collscans
+
+
+async def check_query_plans_async(db, queries):
+    """check_query_plans on a Motor database."""
+    collscans = []
+    for collection, query, sort in queries:
+        cursor = db[collection].find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+        if _bad_plan(await cursor.explain(), collection, f"{query} sort={sort}"):
+            collscans.append((collection, query, sort))
+    return collscans
+
+
+# a blocking SORT in the query layer means the leading $match/$sort is not served by an index
+_BAD_PIPELINE_STAGES = ("COLLSCAN", "SORT")
+
+
+def check_pipeline_plans(db, pipelines):
+    """
+    Explains each hot aggregation ((collection, pipeline)) and returns the ones
+    whose query layer scans the collection or sorts in memory.
+    """
+    bad = []
+    for collection, pipeline in pipelines:
+        explained = db.command("aggregate", collection, pipeline=pipeline, explain=True)
+        if _bad_plan(explained, collection, f"pipeline {pipeline[:2]}", _BAD_PIPELINE_STAGES):
+            bad.append((collection, pipeline))
+    return bad
+
+
+async def check_pipeline_plans_async(db, pipelines):
+    """check_pipeline_plans on a Motor database."""
+    bad = []
+    for collection, pipeline in pipelines:
+        explained = await db.command("aggregate", collection, pipeline=pipeline, explain=True)
+        if _bad_plan(explained, collection, f"pipeline {pipeline[:2]}", _BAD_PIPELINE_STAGES):
+            bad.append((collection, pipeline))
+    return bad
+
+
+def duplicates_pipeline(fields):
+    """
+    Groups of documents sharing the values of fields (missing and null count as
+    equal, as in a unique index), with their _ids newest first.
+    """
+    return [
+        {"$sort": {"_id": -1}},
+        {"$group": {
+            "_id": {field.replace(".", "_"): f"${field}" for field in fields},
+            "ids": {"$push": "$_id"},
+            "count": {"$sum": 1},
+        }},
+        {"$match": {"count": {"$gt": 1}}},
+    ]
+
+
+def remove_duplicates(db, collection, fields):
+    """
+    Deletes all but the newest document (highest ObjectId) of every group of
+    documents sharing fields, so a unique index on them can be built. Returns
+    the number of documents deleted.
+    """
+    deleted = 0
+    for group in db[collection].aggregate(duplicates_pipeline(fields), allowDiskUse=True):
+        deleted += db[collection].delete_many({"_id": {"$in": group["ids"][1:]}}).deleted_count
+    logger.info(f"Removed {deleted} duplicate documents from {collection} on {fields}")
+    return deleted
+
+
+async def remove_duplicates_async(db, collection, fields):
+    """remove_duplicates on a Motor database."""
+    deleted = 0
+    async for group in db[collection].aggregate(duplicates_pipeline(fields), allowDiskUse=True):
+        deleted += (await db[collection].delete_many({"_id": {"$in": group["ids"][1:]}})).deleted_count
+    logger.info(f"Removed {deleted} duplicate documents from {collection} on {fields}")
+    return deleted
+
+
+# index options whose change needs the index rebuilt
+_COMPARED_OPTIONS = ("unique", "sparse", "partialFilterExpression", "expireAfterSeconds")
+
+
+def _key_pattern(keys):
+    # the server may report 1 as 1.0
+    return [(field, int(direction) if isinstance(direction, (int, float)) else direction) for field, direction in keys]
+
+
+def changed_indexes(index_information, keys, options):
+    """Names of existing indexes on the same keys as (keys, options) but with different options."""
+    wanted = {option: options[option] for option in _COMPARED_OPTIONS if options.get(option)}
+    changed = []
+    for name, info in index_information.items():
+        if _key_pattern(info["key"]) != _key_pattern(keys):
+            continue
+        existing = {option: info[option] for option in _COMPARED_OPTIONS if info.get(option)}
+        if existing != wanted:
+            changed.append(name)
+    return changed
+
+
+def drop_changed_indexes(db, indexes):
+    """Drops indexes whose definition in indexes changed, so ensure_indexes can build the new one."""
+    dropped = []
+    for collection, keys, options in indexes:
+        for name in changed_indexes(db[collection].index_information(), keys, options):
+            db[collection].drop_index(name)
+            dropped.append(f"{collection}.{name}")
+            logger.info(f"Dropped index {collection}.{name}, its definition changed")
+    return dropped
+
+
+async def drop_changed_indexes_async(db, indexes):
+    """drop_changed_indexes on a Motor database."""
+    dropped = []
+    for collection, keys, options in indexes:
+        for name in changed_indexes(await db[collection].index_information(), keys, options):
+            await db[collection].drop_index(name)
+            dropped.append(f"{collection}.{name}")
+            logger.info(f"Dropped index {collection}.{name}, its definition changed")
+    return dropped
@@ -0,0 +1,84 @@
+# tests/test_indexes.py
+import pytest
+
+pytest.importorskip("pymongo")
+
+from pymongo import ASCENDING, DESCENDING, errors
+
+from mongo_indexes import check_pipeline_plans, ensure_indexes, plan_stages, remove_duplicates
+from mongo_indexes.indexes import changed_indexes
+
+
+class FakeCollection:
+    def __init__(self, fail=None, groups=()):
+        self.fail = fail
+        self.groups = list(groups)
+        self.created = []
+        self.deleted = []
+
+    def create_index(self, keys, **options):
+        if self.fail:
+            raise self.fail
+        self.created.append((keys, options))
+        return "_".join(field for field, _ in keys)
+
+    def aggregate(self, pipeline, allowDiskUse=False):
+        return iter(self.groups)
+
+    def delete_many(self, query):
+        ids = query["_id"]["$in"]
+        self.deleted.extend(ids)
+        return type("Result", (), {"deleted_count": len(ids)})()
+
+
+def test_ensure_indexes_continues_after_failure():
+    db = {
+        "a": FakeCollection(fail=errors.OperationFailure("E11000 duplicate key", code=11000)),
+        "b": FakeCollection(),
+    }
+    failed = ensure_indexes(db, [("a", [("x", ASCENDING)], {"unique": True}), ("b", [("y", ASCENDING)], {})])
+    assert failed == ["a.[('x', 1)]"]
+    assert db["b"].created == [([("y", ASCENDING)], {})]
+
+
+def test_remove_duplicates_keeps_newest():
+    db = {"screening_results": FakeCollection(groups=[{"ids": [3, 2, 1], "count": 3}, {"ids": [9, 8], "count": 2}])}
+    assert remove_duplicates(db, "screening_results", ["application_id", "job_id"]) == 3
+    assert db["screening_results"].deleted == [2, 1, 8]
+
+
+def test_plan_stages_walks_nested_plans():
+    plan = {
+        "stage": "LIMIT",
+        "inputStage": {"stage": "FETCH", "inputStage": {"stage": "IXSCAN"}},
+        "inputStages": [{"stage": "SORT"}],
+    }
+    assert set(plan_stages(plan)) == {"LIMIT", "FETCH", "IXSCAN", "SORT"}
+
+
+def test_changed_indexes():
+    info = {
+        "_id_": {"key": [("_id", 1)]},
+        "email_1": {"key": [("email", 1.0)], "unique": True},
+        "job_id_1__id_-1": {"key": [("job_id", 1), ("_id", -1)]},
+    }
+    assert changed_indexes(info, [("email", ASCENDING)], {"unique": True, "sparse": True}) == ["email_1"]
+    assert changed_indexes(info, [("email", ASCENDING)], {"unique": True}) == []
+    assert changed_indexes(info, [("job_id", ASCENDING), ("_id", DESCENDING)], {}) == []
+
+
+class FakeDatabase:
+    def __init__(self, plans):
+        self.plans = plans
+
+    def command(self, name, collection, pipeline, explain):
+        return {"stages": [{"$cursor": {"queryPlanner": {"winningPlan": self.plans[collection]}}}, {"$group": {}}]}
+
+
+def test_check_pipeline_plans_flags_in_memory_sort():
+    db = FakeDatabase({
+        "indexed": {"stage": "FETCH", "inputStage": {"stage": "IXSCAN"}},
+        "unindexed": {"stage": "SORT", "inputStage": {"stage": "COLLSCAN"}},
+    })
+    pipeline = [{"$match": {"job_id": "1"}}, {"$sort": {"application_id": 1}}]
+    assert check_pipeline_plans(db, [("indexed", pipeline), ("unindexed", pipeline)]) == [("unindexed", pipeline)]
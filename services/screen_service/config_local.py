@@ -15,11 +15,60 @@ class Config:
     QUEUE_NAME = os.getenv("QUEUE_NAME", "application_queue")
     UPLOAD_DIR = os.getenv("UPLOAD_DIR", "/shared_volume")
     GEMINI_KEY = os.getenv("GEMINI_API_KEY", None)
+    # worker pool: number of messages screened concurrently
+    SCREENING_WORKERS = int(os.getenv("SCREENING_WORKERS", 1))
+    PREFETCH_COUNT = int(os.getenv("PREFETCH_COUNT", SCREENING_WORKERS))
+    # LLM call budget: every Gemini call takes a token, and an uncached screening makes
+    # up to four (CV parsing, job weighting, keyword extraction, final scoring)
+    GEMINI_RATE_PER_MINUTE = float(os.getenv("GEMINI_RATE_PER_MINUTE", 12))
+    GEMINI_RATE_BURST = int(os.getenv("GEMINI_RATE_BURST", 4))
+    # run parse_cv, analyze_job_requirements and calculate_scores concurrently
+    PARALLEL_SCREENING_STAGES = os.getenv("PARALLEL_SCREENING_STAGES", "true").lower() == "true"
+    # job requirement weights cache: in-process LRU, optionally backed by mongo
+    JOB_ANALYSIS_CACHE_SIZE = int(os.getenv("JOB_ANALYSIS_CACHE_SIZE", 256))
+    JOB_ANALYSIS_CACHE_TIER = os.getenv("JOB_ANALYSIS_CACHE_TIER", "mongo")  # mongo | none
+    # embedding cache: in-memory LRU plus a sqlite file; empty path disables the disk tier
+    EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", 2048))
+    EMBEDDING_CACHE_PATH = os.getenv("EMBEDDING_CACHE_PATH", os.path.join(UPLOAD_DIR, "embedding_cache.sqlite3"))
+    # batched embedding: chunk size in word pieces, texts per forward pass, and how
+    # long to wait for other workers' texts before running a pass
+    EMBEDDING_CHUNK_TOKENS = int(os.getenv("EMBEDDING_CHUNK_TOKENS", 256))
+    EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", 32))
+    EMBEDDING_BATCH_WINDOW_MS = float(os.getenv("EMBEDDING_BATCH_WINDOW_MS", 20))
+    # model/corpus loading: OFFLINE_MODE never touches the network and loads from the
+    # pre-baked directories instead
+    OFFLINE_MODE = os.getenv("OFFLINE_MODE", "false").lower() == "true"
+    EMBEDDING_MODEL_NAME = os.getenv("EMBEDDING_MODEL_NAME", "sentence-transformers/all-MiniLM-L6-v2")
+    EMBEDDING_MODEL_DIR = os.getenv("EMBEDDING_MODEL_DIR", "")
+    NLTK_DATA_DIR = os.getenv("NLTK_DATA", "")
+    WARMUP_ON_START = os.getenv("WARMUP_ON_START", "true").lower() == "true"
+    # embedding inference: torch | torch-int8 | onnx | onnx-int8 (onnx needs onnxruntime)
+    EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "torch")
+    EMBEDDING_ONNX_PATH = os.getenv("EMBEDDING_ONNX_PATH", os.path.join(UPLOAD_DIR, "all-MiniLM-L6-v2.onnx"))
+    # memoize full screening outcomes in the screening_cache collection
+    SCREENING_RESULT_CACHE = os.getenv("SCREENING_RESULT_CACHE", "true").lower() == "true"
+    # talent pool: threads reading CVs whose embedding is not stored yet
+    TALENT_POOL_BACKFILL_WORKERS = int(os.getenv("TALENT_POOL_BACKFILL_WORKERS", 4))
+    # candidates of a recommendation run whose vectors are loaded, backfilled and ranked at a time
+    TALENT_POOL_CHUNK_SIZE = int(os.getenv("TALENT_POOL_CHUNK_SIZE", 500))
+    # OCR of image-only PDFs: worker processes (1 OCRs on the calling thread),
+    # render resolution bounds and pages whose text is kept in memory
+    OCR_WORKERS = int(os.getenv("OCR_WORKERS", min(4, os.cpu_count() or 1)))
+    OCR_MIN_DPI = int(os.getenv("OCR_MIN_DPI", 150))
+    OCR_MAX_DPI = int(os.getenv("OCR_MAX_DPI", 300))
+    OCR_CACHE_SIZE = int(os.getenv("OCR_CACHE_SIZE", 256))
+    # document text extraction (doc_extraction): worker processes (0 extracts on the
+    # calling thread) and extracted texts kept in memory, keyed by content digest
+    EXTRACTION_WORKERS = int(os.getenv("EXTRACTION_WORKERS", 0))
+    EXTRACTION_CACHE_SIZE = int(os.getenv("EXTRACTION_CACHE_SIZE", 128))
     @classmethod
     def check_config(cls):
         assert cls.RABBITMQ_URL, "RabbitMQ URL is not set"
         assert cls.MONGODB_URL, "MongoDB URL is not set"
         assert cls.QUEUE_NAME, "Queue name is not set"
         assert cls.UPLOAD_DIR, "Upload directory is not set"
+        assert cls.SCREENING_WORKERS > 0, "SCREENING_WORKERS must be positive"
+        assert cls.PREFETCH_COUNT >= cls.SCREENING_WORKERS, "PREFETCH_COUNT must be at least SCREENING_WORKERS"
+        assert cls.GEMINI_RATE_PER_MINUTE > 0, "GEMINI_RATE_PER_MINUTE must be positive"
 
 Config.check_config()
@@ -0,0 +1,77 @@
+"""
+Indexes for the collections screen_service queries, created idempotently when the
+consumer starts.
+
+    python -m src.database.indexes            # create the indexes
+    python -m src.database.indexes --check    # explain() the hot queries, exit 1 on a COLLSCAN
+    python -m src.database.indexes --migrate  # remove the duplicates that block a unique index first
+"""
+import argparse
+import logging
+import sys
+from mongo_indexes import check_query_plans as check_plans, ensure_indexes as ensure, remove_duplicates
+from pymongo import ASCENDING
+from src.database.database import database
+
+logger = logging.getLogger(__name__)
+
+# (collection, keys, options); shared indexes match job_service's definitions exactly
+INDEXES = [
+    # one web screening per application (job_id unset) and one per recommended job
+    ("screening_results", [("application_id", ASCENDING), ("job_id", ASCENDING)], {"unique": True}),
+    ("job_analysis_cache", [("job_ids", ASCENDING)], {}),
+    # extracted CV text, found by content digest or by file URL
+    ("extracted_texts", [("digest", ASCENDING)], {"unique": True, "sparse": True}),
+    ("extracted_texts", [("file_url", ASCENDING)], {}),
+]
+
+# (collection, filter, sort) for the queries that must be served by an index
+HOT_QUERIES = [
+    ("screening_results", {"application_id": "000000000000000000000000", "job_id": None}, None),
+    ("screening_results", {"application_id": "000000000000000000000000", "job_id": "000000000000000000000000"}, None),
+    ("extracted_texts", {"digest": "0" * 64}, None),
+    ("extracted_texts", {"file_url": "https://example.com/cv.pdf"}, None),
+]
+
+
+# (collection, fields) of unique indexes over data written before they existed;
+# recommendation runs inserted a screening_results row per run, the newest is kept
+DEDUPE = [
+    ("screening_results", ["application_id", "job_id"]),
+]
+
+
+def ensure_indexes(db=None, indexes=INDEXES):
+    """Creates the missing indexes; returns the ones that could not be created."""
+    return ensure(db if db is not None else database.db, indexes)
+
+
+def check_query_plans(db=None, queries=HOT_QUERIES):
+    """Returns the hot queries whose winning plan is a COLLSCAN."""
+    return check_plans(db if db is not None else database.db, queries)
+
+
+def migrate(db=None):
+    db = db if db is not None else database.db
+    for collection, fields in DEDUPE:
+        remove_duplicates(db, collection, fields)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="explain() the hot queries and fail on a COLLSCAN")
+    parser.add_argument("--migrate", action="store_true", help="remove duplicates under unique indexes first")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if args.migrate:
+        migrate()
+    failed = ensure_indexes()
+    if args.check and check_query_plans():
+        sys.exit(1)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -17,7 +17,14 @@ class BaseDocument:
 class ApplicationDocument(BaseDocument):
     collection_name = "applications"
 
-   
+    @classmethod
+    def set_screening_score(cls, application_id, score):
+        """Copies the screening score onto the application so listings can sort and filter by it."""
+        try:
+            cls.get_collection().update_one({"_id": ObjectId(application_id)}, {"$set": {"screening_score": score}})
+        except errors.PyMongoError as e:
+            # the screening result is already stored; only score ordering is affected
+            logger.exception(f"Error setting screening score for {application_id}: {e}")
 
     @classmethod
     def get_application_by_id(cls, application_id):
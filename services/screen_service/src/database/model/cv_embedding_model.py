@@ -0,0 +1,60 @@
+import logging
+from src.database.database import database
+from datetime import datetime
+from pymongo import UpdateOne, errors
+import numpy as np
+logger = logging.getLogger(__name__)
+class BaseDocument:
+    """Base class for common database operations."""
+    collection_name = ""
+
+    @classmethod
+    def get_collection(cls):
+        return database.get_collection(cls.collection_name)
+
+
+class CvEmbeddingDocument(BaseDocument):
+    """
+    Talent-pool index: one CV embedding per application, stored as a raw float32
+    blob. `namespace` names the model that produced the vector, so vectors from
+    another model or backend are treated as missing.
+    """
+    collection_name = "cv_embeddings"
+
+    @classmethod
+    def save_embeddings(cls, embeddings, namespace):
+        """embeddings maps application_id -> (vector, text_hash)."""
+        if not embeddings:
+            return
+        now = datetime.utcnow()
+        operations = [
+            UpdateOne(
+                {"_id": application_id},
+                {"$set": {
+                    "namespace": namespace,
+                    "vector": np.asarray(vector, dtype=np.float32).tobytes(),
+                    "text_hash": text_hash,
+                    "updated_at": now,
+                }},
+                upsert=True,
+            )
+            for application_id, (vector, text_hash) in embeddings.items()
+        ]
+        try:
+            cls.get_collection().bulk_write(operations, ordered=False)
+        except errors.PyMongoError as e:
+            # the embedding is recomputed the next time recommendations run
+            logger.warning(f"Error saving {len(operations)} CV embeddings: {e}")
+
+    @classmethod
+    def get_embeddings(cls, application_ids, namespace):
+        """Returns application_id -> vector for the ids embedded under namespace."""
+        try:
+            documents = cls.get_collection().find(
+                {"_id": {"$in": list(application_ids)}, "namespace": namespace},
+                {"vector": 1},
+            )
+            return {doc["_id"]: np.frombuffer(doc["vector"], dtype=np.float32) for doc in documents}
+        except errors.PyMongoError as e:
+            logger.exception(f"Error fetching CV embeddings: {e}")
+            raise Exception(f"Error fetching CV embeddings: {e}")
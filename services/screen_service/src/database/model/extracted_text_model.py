@@ -0,0 +1,44 @@
+import logging
+from src.database.database import database
+from datetime import datetime
+from pymongo import errors
+logger = logging.getLogger(__name__)
+class BaseDocument:
+    """Base class for common database operations."""
+    collection_name = ""
+
+    @classmethod
+    def get_collection(cls):
+        return database.get_collection(cls.collection_name)
+
+
+class ExtractedTextDocument(BaseDocument):
+    """
+    Text extracted from a stored CV, keyed by the SHA-256 digest of its bytes and
+    by its file URL. job_service writes it when it parses an upload; the
+    consumer writes it after parsing a file it had to download.
+    """
+    collection_name = "extracted_texts"
+
+    @classmethod
+    def get_text(cls, file_url, digest=None):
+        query = {"$or": [{"digest": digest}, {"file_url": file_url}]} if digest else {"file_url": file_url}
+        try:
+            document = cls.get_collection().find_one(query, {"text": 1})
+            return document["text"] if document else None
+        except errors.PyMongoError as e:
+            logger.warning(f"Error reading extracted text for {file_url}: {e}")
+            return None
+
+    @classmethod
+    def save_text(cls, file_url, text, digest=None):
+        if not text or not text.strip():
+            return
+        query = {"digest": digest} if digest else {"file_url": file_url}
+        fields = {"file_url": file_url, "text": text, "source": "screen_service", "created_at": datetime.utcnow()}
+        if digest:
+            fields["digest"] = digest
+        try:
+            cls.get_collection().update_one(query, {"$setOnInsert": fields}, upsert=True)
+        except errors.PyMongoError as e:
+            logger.warning(f"Error storing extracted text for {file_url}: {e}")
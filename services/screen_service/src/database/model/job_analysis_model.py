@@ -0,0 +1,43 @@
+import logging
+from src.database.database import database
+from datetime import datetime
+from pymongo import errors
+logger = logging.getLogger(__name__)
+class BaseDocument:
+    """Base class for common database operations."""
+    collection_name = ""
+
+    @classmethod
+    def get_collection(cls):
+        return database.get_collection(cls.collection_name)
+
+
+class JobAnalysisDocument(BaseDocument):
+    """
+    Persistent tier of the job-analysis cache. Documents are keyed by the
+    content hash of the sanitized job description and prompt version; job_id
+    is kept so job_service can invalidate entries when a job is edited.
+    """
+    collection_name = "job_analysis_cache"
+
+    @classmethod
+    def get_weights(cls, cache_key):
+        try:
+            result = cls.get_collection().find_one({"_id": cache_key}, {"weights": 1})
+            return result["weights"] if result else None
+        except errors.PyMongoError as e:
+            logger.warning(f"Error reading job analysis cache {cache_key}: {e}")
+            return None
+
+    @classmethod
+    def save_weights(cls, cache_key, weights, prompt_version, job_id=None):
+        try:
+            update = {
+                "$set": {"weights": weights, "prompt_version": prompt_version, "updated_at": datetime.utcnow()},
+                "$setOnInsert": {"created_at": datetime.utcnow()},
+            }
+            if job_id:
+                update["$addToSet"] = {"job_ids": job_id}
+            cls.get_collection().update_one({"_id": cache_key}, update, upsert=True)
+        except errors.PyMongoError as e:
+            logger.warning(f"Error writing job analysis cache {cache_key}: {e}")
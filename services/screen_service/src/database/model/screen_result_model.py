@@ -23,14 +23,15 @@ class ScreeningResultDocument(BaseDocument):
         return cls.get_collection().find_one({"_id": result.inserted_id})
 
     @classmethod
-    def update_or_create_result(cls, application_id, result_data):
+    def update_or_create_result(cls, application_id, result_data, job_id=None):
         """
         Updates a screening result if it exists, otherwise creates a new one.
+        Web screenings have no job_id; recommendation screenings are stored per job.
         """
         result_data["updated_at"] = datetime.utcnow()
         
-        # The filter to find the document
-        query = {"application_id": application_id}
+        # The filter to find the document; matches the unique (application_id, job_id) index
+        query = {"application_id": application_id, "job_id": job_id}
         
         # The update to apply
         update = {
@@ -0,0 +1,43 @@
+import logging
+from src.database.database import database
+from datetime import datetime
+from pymongo import errors
+logger = logging.getLogger(__name__)
+class BaseDocument:
+    """Base class for common database operations."""
+    collection_name = ""
+
+    @classmethod
+    def get_collection(cls):
+        return database.get_collection(cls.collection_name)
+
+
+class ScreeningCacheDocument(BaseDocument):
+    """
+    Memoized screening outcomes keyed by (resume text hash, job hash, prompt and
+    model versions), so re-screening the same CV for the same job skips the LLM.
+    """
+    collection_name = "screening_cache"
+
+    @classmethod
+    def get_result(cls, cache_key):
+        try:
+            result = cls.get_collection().find_one({"_id": cache_key})
+            if result:
+                cls.get_collection().update_one({"_id": cache_key}, {"$inc": {"hits": 1}})
+            return result
+        except errors.PyMongoError as e:
+            logger.warning(f"Error reading screening cache {cache_key}: {e}")
+            return None
+
+    @classmethod
+    def save_result(cls, cache_key, result_data):
+        try:
+            result_data["created_at"] = datetime.utcnow()
+            cls.get_collection().update_one(
+                {"_id": cache_key},
+                {"$set": result_data, "$setOnInsert": {"hits": 0}},
+                upsert=True,
+            )
+        except errors.PyMongoError as e:
+            logger.warning(f"Error writing screening cache {cache_key}: {e}")
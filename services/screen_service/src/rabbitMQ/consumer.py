@@ -4,29 +4,135 @@ setup_logging()
 import pika
 import json
 import logging
-import time
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pymongo.errors import PyMongoError
 
 from config_local import Config
+from src.database.indexes import ensure_indexes
+from src.database.model.application_model import ApplicationDocument
 from src.database.model.screen_result_model import ScreeningResultDocument
 from src.service.screening_service import scoreResume
+from src.service.talent_pool_service import index_cv, select_top_k
+from src.utils.sanitizer import sanitizer
+from src.utils.resources import warm_up
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 class Consumer:
     """
-    A synchronous RabbitMQ consumer that processes messages one by one.
+    A RabbitMQ consumer that screens up to `Config.SCREENING_WORKERS` messages
+    concurrently on a bounded thread pool.
+
+    pika's BlockingConnection is not thread-safe, so workers never touch the
+    channel directly: acks and nacks are scheduled back onto the connection
+    thread with `add_callback_threadsafe`.
     """
     def __init__(self):
         """Initializes the consumer."""
         self.connection = None
         self.channel = None
+        self.executor = ThreadPoolExecutor(
+            max_workers=Config.SCREENING_WORKERS,
+            thread_name_prefix="screening-worker",
+        )
+
+    def _ack(self, ch, delivery_tag):
+        self.connection.add_callback_threadsafe(
+            functools.partial(ch.basic_ack, delivery_tag=delivery_tag)
+        )
+
+    def _nack(self, ch, delivery_tag, requeue=False):
+        self.connection.add_callback_threadsafe(
+            functools.partial(ch.basic_nack, delivery_tag=delivery_tag, requeue=requeue)
+        )
+
+    def _publish_confirmed(self, messages):
+        """
+        Publishes messages on a connection of the calling worker's own, with
+        publisher confirms on, and returns once the broker has all of them. The
+        consumer connection thread is never blocked waiting on a confirm, so the
+        other workers' acks keep flowing. Raises if any publish is rejected.
+        """
+        connection = pika.BlockingConnection(pika.URLParameters(Config.RABBITMQ_URL))
+        try:
+            channel = connection.channel()
+            channel.confirm_delivery()
+            for message in messages:
+                channel.basic_publish(
+                    exchange="",
+                    routing_key=Config.QUEUE_NAME,
+                    body=json.dumps(message, ensure_ascii=False).encode(),
+                    properties=pika.BasicProperties(delivery_mode=2),  # persistent
+                )
+        finally:
+            if not connection.is_closed:
+                connection.close()
+
+    def process_recommendation_run(self, ch, delivery_tag, data, redelivered):
+        """
+        Pre-filters a recommendation run: ranks every candidate by CV embedding
+        similarity to the job and queues only the top K for LLM scoring. The run
+        is acked once the broker has confirmed every publish. Database and broker
+        errors requeue the run once; a run failing again after redelivery is
+        dropped and logged with its run id.
+        """
+        job_description = data.get("job_description", "")
+        job_skills = data.get("job_skills", "")
+        job_id = data.get("job_id", "")
+        run_id = data.get("run_id", "")
+        candidates = data.get("candidates", [])
+
+        try:
+            selected = select_top_k(
+                sanitizer(f"{job_description}\n{job_skills}"),
+                candidates,
+                int(data.get("top_k", len(candidates))),
+                float(data.get("min_similarity", -1.0)),
+            )
+            messages = [
+                {
+                    "job_description": job_description,
+                    "job_skills": job_skills,
+                    "application_id": candidate["application_id"],
+                    "resume_path": candidate["cv_link"],
+                    "resume_digest": candidate.get("cv_digest"),
+                    "from": "recommendation",
+                    "job_id": job_id,
+                    "similarity": round(similarity, 4),
+                }
+                for candidate, similarity in selected
+            ]
+            self._publish_confirmed(messages)
+        except (PyMongoError, pika.exceptions.AMQPError, OSError) as e:
+            requeue = not redelivered
+            logger.error(
+                f"Recommendation run {run_id} for job {job_id} failed, "
+                f"{'requeueing' if requeue else 'dropping it after redelivery'}: {e}"
+            )
+            self._nack(ch, delivery_tag, requeue=requeue)
+            return
+        except Exception as e:
+            logger.error(f"Recommendation run {run_id} for job {job_id} failed, dropping it: {e}", exc_info=True)
+            self._nack(ch, delivery_tag)
+            return
 
-    def process_message(self, ch, method, properties, body):
+        self._ack(ch, delivery_tag)
+        logger.info(
+            f"Recommendation run {run_id} for job {job_id}: "
+            f"{len(selected)} of {len(candidates)} candidates sent to scoring"
+        )
+
+    def on_message(self, ch, method, properties, body):
+        """Hands the message to the worker pool; runs on the connection thread."""
+        self.executor.submit(self.process_message, ch, method.delivery_tag, body, method.redelivered)
+
+    def process_message(self, ch, delivery_tag, body, redelivered=False):
         """
-        Callback function to process a single message.
-        It performs the scoring and database operations synchronously.
+        Processes a single message on a worker thread.
+        It performs the scoring and database operations, then schedules the ack.
         """
         try:
             logger.info("Processing message...")
@@ -37,12 +143,20 @@ class Consumer:
             job_id = data.get("job_id", "")
             application_id = data.get("application_id", "")
             resume_path = data.get("resume_path", "")
+            resume_digest = data.get("resume_digest")
             source = data.get('from', "")
 
+            if source == "recommendation_run":
+                self.process_recommendation_run(ch, delivery_tag, data, redelivered)
+                return
+
             try:
-            # Synchronously call the scoring function
+                # memoized screenings return without calling the LLM or consuming a rate-limit token
+                # web and bulk CVs join the talent pool used to pre-filter recommendations
+                on_resume_text = None if source == "recommendation" else functools.partial(index_cv, application_id)
                 llm_output, kw_score, vec_score, parsed_resume = scoreResume(
-                    job_description, job_skills, resume_path
+                    job_description, job_skills, resume_path, job_id,
+                    on_resume_text=on_resume_text, resume_digest=resume_digest,
                 )
 
                 overall_score = llm_output.get("overall_score", 0.0) if isinstance(llm_output, dict) else 0.0
@@ -62,7 +176,8 @@ class Consumer:
                         "reasoning": score_breakdown,
                         "application_id": application_id,
                     }
-                    ScreeningResultDocument.create_result(result)
+                    # keyed on (application_id, job_id), so re-running recommendations replaces the result
+                    ScreeningResultDocument.update_or_create_result(application_id, result, job_id=job_id)
                     logger.info(f"Consumer: Successfully processed application from recommendation with application_id {application_id}")
                 else:
                     result = {
@@ -73,6 +188,7 @@ class Consumer:
                         "parsed_cv": parsed_resume,
                     }
                     ScreeningResultDocument.update_or_create_result(application_id,result)
+                    ApplicationDocument.set_screening_score(application_id, result["score"])
                     logger.info(f"Consumer: Successfully processed application from web with application_id {application_id}")
             except Exception as e:
                 result = {
@@ -81,35 +197,43 @@ class Consumer:
                         "error_message": str(e),
                         "original_message": data
                     }
-                ScreeningResultDocument.update_or_create_result(application_id,result)
+                ScreeningResultDocument.update_or_create_result(
+                    application_id, result, job_id=job_id if source == "recommendation" else None
+                )
                 logger.error(f"Error processing application {application_id}: {str(e)}")   
               
             
             # Acknowledge the message
-            ch.basic_ack(delivery_tag=method.delivery_tag)
-            logger.info("Message processed successfully. Waiting for 20 seconds.")
-            time.sleep(20)
+            self._ack(ch, delivery_tag)
+            logger.info("Message processed successfully.")
 
         except json.JSONDecodeError:
             logger.error("Failed to decode JSON from message body.")
-            ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
+            self._nack(ch, delivery_tag)
         except PyMongoError as e:
             logger.error(f"Database error: {e}")
-            ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
+            self._nack(ch, delivery_tag)
         except Exception as e:
             logger.error(f"Unexpected error: {e}", exc_info=True)
-            ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
+            self._nack(ch, delivery_tag)
 
     def run(self):
         """Connects to RabbitMQ and starts consuming messages."""
+        if Config.WARMUP_ON_START:
+            # models load while we connect; the first message waits on the same lazy loaders
+            threading.Thread(target=warm_up, name="warm-up", daemon=True).start()
+        ensure_indexes()
         try:
-            logger.info("Starting synchronous consumer...")
+            logger.info(
+                f"Starting consumer with {Config.SCREENING_WORKERS} workers, "
+                f"prefetch {Config.PREFETCH_COUNT}, {Config.GEMINI_RATE_PER_MINUTE} Gemini calls/min"
+            )
             # Establish a connection to RabbitMQ
             self.connection = pika.BlockingConnection(pika.URLParameters(Config.RABBITMQ_URL))
             self.channel = self.connection.channel()
 
-            # Set prefetch count to 1 to process messages one by one
-            self.channel.basic_qos(prefetch_count=1)
+            # Prefetch bounds the number of unacked messages held by this node
+            self.channel.basic_qos(prefetch_count=Config.PREFETCH_COUNT)
             
             # Declare a durable queue
             self.channel.queue_declare(queue=Config.QUEUE_NAME, durable=True)
@@ -117,7 +241,7 @@ class Consumer:
             # Set up the consumer
             self.channel.basic_consume(
                 queue=Config.QUEUE_NAME,
-                on_message_callback=self.process_message
+                on_message_callback=self.on_message
             )
 
             logger.info(" [*] Waiting for messages. To exit press CTRL+C")
@@ -128,6 +252,8 @@ class Consumer:
         except Exception as e:
             logger.exception(f"A critical error occurred in the consumer run loop: {e}")
         finally:
+            # unacked in-flight messages are redelivered by the broker
+            self.executor.shutdown(wait=False, cancel_futures=True)
             if self.connection and not self.connection.is_closed:
                 self.connection.close()
                 logger.info("RabbitMQ connection closed.")
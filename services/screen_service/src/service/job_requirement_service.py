@@ -1,20 +1,69 @@
 from config_local import Config
 from dotenv import load_dotenv
-import google.generativeai as genai
+from src.utils.resources import get_gemini_model
+import hashlib
+import json
 import logging
+import re
+from src.utils.lru_cache import LRUCache
+from src.database.model.job_analysis_model import JobAnalysisDocument
 
 logger = logging.getLogger(__name__)
 load_dotenv()
 
-gemini_api_key = Config.GEMINI_KEY
-if not gemini_api_key:
-    raise ValueError("GEMINI_API_KEY is not set in the environment variables!")
+# Bump whenever the prompt below or the cached format changes so cached weights are recomputed
+JOB_ANALYSIS_PROMPT_VERSION = "2"
+JOB_ANALYSIS_CACHE = LRUCache(Config.JOB_ANALYSIS_CACHE_SIZE)
 
-genai.configure(api_key=gemini_api_key)
-model = genai.GenerativeModel("gemini-2.0-flash")
+def job_analysis_cache_key(job_text):
+   """
+   Content hash of the (already sanitized) job description and prompt version.
+   An edited description hashes to a new key, so neither cache tier can serve
+   the analysis of the old text.
+   """
+   return hashlib.sha256(f"{JOB_ANALYSIS_PROMPT_VERSION}:{job_text}".encode()).hexdigest()
+
+def analyze_job_requirements(job_text, job_id=None):
+   """
+   Returns category weights for job_text as a dict, or None when Gemini failed
+   or its output did not parse. Every application to a job shares the same
+   description, so parsed results are cached in-process and, when
+   JOB_ANALYSIS_CACHE_TIER is "mongo", in the job_analysis_cache collection.
+   None is never cached, so a failed analysis is retried on the next screening.
+   """
+   cache_key = job_analysis_cache_key(job_text)
+
+   def compute():
+      if Config.JOB_ANALYSIS_CACHE_TIER == "mongo":
+         weights = JobAnalysisDocument.get_weights(cache_key)
+         if isinstance(weights, dict):
+            logger.info(f"Job analysis cache hit (mongo) for {cache_key[:12]}")
+            return weights
+         weights = _analyze_job_requirements(job_text)
+         if weights is not None:
+            JobAnalysisDocument.save_weights(cache_key, weights, JOB_ANALYSIS_PROMPT_VERSION, job_id)
+         return weights
+      return _analyze_job_requirements(job_text)
+
+   return JOB_ANALYSIS_CACHE.get_or_compute(cache_key, compute)
+
+def parse_weights(response_text):
+   """The category weights in a Gemini response, or None if it holds no JSON object of numbers."""
+   match = re.search(r"\{.*\}", response_text or "", re.DOTALL)
+   if not match:
+      return None
+   try:
+      weights = json.loads(match.group(0))
+   except json.JSONDecodeError:
+      return None
+   if not isinstance(weights, dict) or not weights:
+      return None
+   if not all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in weights.values()):
+      return None
+   return {str(category): float(value) for category, value in weights.items()}
 
 # function to identify the weights
-def analyze_job_requirements(job_text):
+def _analyze_job_requirements(job_text):
 
    prompt = f"""
    Analyze the unstructured job requirements text contained in the 'job_text' string variable.
@@ -59,14 +108,15 @@ def analyze_job_requirements(job_text):
    """
    
    try:
-      response = model.generate_content(
+      response = get_gemini_model().generate_content(
          prompt, 
       )
-
-      
-
-      return response.text
-
+      response_text = response.text
    except Exception as e:
       logger.error(str(e))
-      return 
\ No newline at end of file
+      return None
+
+   weights = parse_weights(response_text)
+   if weights is None:
+      logger.warning("Job analysis returned no parsable weights, not caching it")
+   return weights 
\ No newline at end of file
@@ -0,0 +1,20 @@
+import logging
+from src.database.model.extracted_text_model import ExtractedTextDocument
+from src.utils.file_reader import extract_text_from_file
+
+logger = logging.getLogger(__name__)
+
+
+def get_resume_text(resume_path, digest=None):
+    """
+    Raw text of a CV. Text already extracted by job_service or an earlier
+    screening is read from the extracted_texts store; otherwise the file is
+    downloaded and parsed, and the text stored for next time.
+    """
+    text = ExtractedTextDocument.get_text(resume_path, digest)
+    if text:
+        logger.info(f"Extracted text store hit for {resume_path}")
+        return text
+    text = extract_text_from_file(resume_path)
+    ExtractedTextDocument.save_text(resume_path, text, digest)
+    return text
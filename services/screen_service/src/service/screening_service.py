@@ -1,27 +1,29 @@
+import hashlib
 import json
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from config_local import Config
 from dotenv import load_dotenv
-import google.generativeai as genai
+from src.utils.resources import get_gemini_model
 from src.utils.cv_parser import parse_cv
-from src.service.job_requirement_service import analyze_job_requirements
-from src.utils.file_reader import extract_text_from_file
+from src.service.job_requirement_service import analyze_job_requirements, JOB_ANALYSIS_PROMPT_VERSION
+from src.database.model.screening_cache_model import ScreeningCacheDocument
+from src.service.resume_text_service import get_resume_text
 from src.utils.vector_keyword_similarity import calculate_scores
 from src.utils.sanitizer import sanitizer
+from src.utils.embedder import EMBEDDING_NAMESPACE
 import logging
 load_dotenv()
 
 
 logger = logging.getLogger(__name__)
 
-# Load API key
-gemini_api_key = Config.GEMINI_KEY
-if not gemini_api_key:
-    raise ValueError("GEMINI_API_KEY is not set in the environment variables!")
-
-# Configure Gemini AI
-genai.configure(api_key=gemini_api_key)
-model = genai.GenerativeModel("gemini-2.0-flash")
+# Independent pre-scoring stages run here; three stages per in-flight screening
+STAGE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=3 * Config.SCREENING_WORKERS,
+    thread_name_prefix="screening-stage",
+)
 
 def balance_braces(json_str):
     """
@@ -33,29 +35,94 @@ def balance_braces(json_str):
         json_str += "}" * (open_braces - close_braces)
     return json_str
 
-def scoreResume(description_text, job_skills, resume_file_path):
+# Bump whenever the scoring prompt changes so memoized screenings are recomputed
+SCREENING_PROMPT_VERSION = "1"
+SCREENING_MODEL = "gemini-2.0-flash"
+
+def screening_cache_key(resume_text, description_text, job_skills):
+    """Key for a memoized screening: resume text, job content and every version that affects the score."""
+    resume_hash = hashlib.sha256(resume_text.encode()).hexdigest()
+    job_hash = hashlib.sha256(f"{description_text}\x00{job_skills}".encode()).hexdigest()
+    # the embedding namespace covers the model, backend and chunking of the vector score
+    versions = f"{SCREENING_PROMPT_VERSION}:{SCREENING_MODEL}:{JOB_ANALYSIS_PROMPT_VERSION}:{EMBEDDING_NAMESPACE}"
+    return hashlib.sha256(f"{resume_hash}:{job_hash}:{versions}".encode()).hexdigest()
+
+def _timed(stage, timings, fn, *args, **kwargs):
+    """Runs fn and records its wall time in seconds under timings[stage]."""
+    start = time.perf_counter()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        timings[stage] = round(time.perf_counter() - start, 3)
+
+def _parse_cv_stage(extracted_applicant_resume):
+    parsed_cv = parse_cv(extracted_applicant_resume)
+    # parse_cv returns None when Gemini failed
+    return sanitizer(parsed_cv) if parsed_cv is not None else None
+
+def degraded_stages(parsed_cv, weight, scores):
+    """Stages that fell back to a placeholder instead of a real result."""
+    failed = {
+        "parse_cv": parsed_cv is None,
+        "analyze_job_requirements": weight is None,
+        "calculate_scores": scores.get("degraded", False),
+    }
+    return [stage for stage, is_degraded in failed.items() if is_degraded]
+
+def run_scoring_stages(description_text, extracted_applicant_resume, timings, job_id=None):
+    """
+    Runs the stages the final prompt depends on: parse_cv, analyze_job_requirements
+    and calculate_scores. They are independent of each other, so with
+    PARALLEL_SCREENING_STAGES they run concurrently and the latency is that of
+    the slowest stage.
+    """
+    stages = [
+        ("parse_cv", _parse_cv_stage, (extracted_applicant_resume,)),
+        ("analyze_job_requirements", analyze_job_requirements, (description_text, job_id)),
+        ("calculate_scores", calculate_scores, (description_text, extracted_applicant_resume)),
+    ]
+    if not Config.PARALLEL_SCREENING_STAGES:
+        return tuple(_timed(name, timings, fn, *args) for name, fn, args in stages)
+
+    futures = [STAGE_EXECUTOR.submit(_timed, name, timings, fn, *args) for name, fn, args in stages]
+    return tuple(future.result() for future in futures)
+
+def scoreResume(description_text, job_skills, resume_file_path, job_id=None, on_resume_text=None, resume_digest=None):
     """
     Evaluates an applicant's resume against job requirements using Gemini AI.
     Returns a JSON analysis with scores, strengths, and critical gaps.
-    
+
+    Results are memoized on the extracted resume text and job content; on a
+    hit no LLM is called. Each Gemini call takes its own rate-limit token in the
+    client returned by get_gemini_model. on_resume_text, if given, receives the
+    sanitized resume text (the consumer indexes it in the talent pool).
+    resume_digest, the SHA-256 of the CV bytes, finds text already extracted by job_service.
     """
 
      # Sanitize inputs
     description_text = sanitizer(description_text)
     job_skills = sanitizer(job_skills)
 
-    # Extract text from the resume file
-    extracted_applicant_resume = extract_text_from_file(resume_file_path)
+    timings = {}
+    started = time.perf_counter()
+
+    # Extract text from the resume file, or read it from the shared store
+    extracted_applicant_resume = _timed("extract_text", timings, get_resume_text, resume_file_path, resume_digest)
     extracted_applicant_resume = sanitizer(extracted_applicant_resume) # sanitize
-    parsed_cv = parse_cv(extracted_applicant_resume)
-    parsed_cv = sanitizer(parsed_cv) # sanitize
+    if on_resume_text:
+        on_resume_text(extracted_applicant_resume)
+
+    cache_key = screening_cache_key(extracted_applicant_resume, description_text, job_skills)
+    if Config.SCREENING_RESULT_CACHE:
+        cached = ScreeningCacheDocument.get_result(cache_key)
+        if cached:
+            logger.info(f"Screening cache hit {cache_key[:12]}, skipping LLM calls")
+            return cached["llm_output"], cached["keyword_weight"], cached["vector_weight"], cached["parsed_cv"]
 
-    weight = analyze_job_requirements(description_text)
-    scores = calculate_scores(description_text, extracted_applicant_resume)
+    parsed_cv, weight, scores = run_scoring_stages(description_text, extracted_applicant_resume, timings, job_id)
     keyword_weight = scores["weighted_keyword"]
     vector_weight = scores["weighted_vector"]
 
-   
 
     # Construct the AI prompt
     prompt = f"""
@@ -66,7 +133,7 @@ def scoreResume(description_text, job_skills, resume_file_path):
 "job_requirements": "{description_text}",
     "required_skills": "{job_skills}"
     "applicant_resume": "{parsed_cv}",
-    "weights": {weight}
+    "weights": {json.dumps(weight)}
   }},
   "instructions": [
     {{
@@ -127,7 +194,7 @@ def scoreResume(description_text, job_skills, resume_file_path):
 
     # Generate response using Gemini AI
     try:
-        response = model.generate_content(
+        response = _timed("final_scoring", timings, get_gemini_model().generate_content,
             prompt,
             generation_config={
                 "temperature": 0.1,
@@ -149,6 +216,19 @@ def scoreResume(description_text, job_skills, resume_file_path):
         # Parse JSON safely
         result = json.loads(json_str)
 
+        timings["total"] = round(time.perf_counter() - started, 3)
+        logger.info(f"Screening stage timings (s): {timings}")
+        degraded = degraded_stages(parsed_cv, weight, scores)
+        if degraded:
+            # a transient failure must not become the permanent score of this CV and job
+            logger.warning(f"Screening used fallbacks for {degraded}, not caching the outcome")
+        elif Config.SCREENING_RESULT_CACHE:
+            ScreeningCacheDocument.save_result(cache_key, {
+                "llm_output": result,
+                "keyword_weight": float(keyword_weight),
+                "vector_weight": float(vector_weight),
+                "parsed_cv": parsed_cv,
+            })
         return result, keyword_weight, vector_weight, parsed_cv
 
     except Exception as e:
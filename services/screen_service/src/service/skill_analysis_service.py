@@ -1,7 +1,7 @@
 import json
 import re
 from dotenv import load_dotenv
-import google.generativeai as genai
+from src.utils.resources import get_gemini_model
 from config_local import Config
 from src.service.screening_service import balance_braces
 import logging
@@ -10,13 +10,6 @@ logger = logging.getLogger(__name__)
 
 load_dotenv()
 
-gemini_api_key = Config.GEMINI_KEY
-if not gemini_api_key:
-    raise ValueError("GEMINI_API_KEY is not set in the environment variables!")
-
-genai.configure(api_key=gemini_api_key)
-model = genai.GenerativeModel("gemini-2.0-flash")
-
 
 def analyze_job_skills(job_requirement_text):
     prompt = f"""
@@ -44,7 +37,7 @@ def analyze_job_skills(job_requirement_text):
     """
 
     # Generate content from the model
-    response = model.generate_content(
+    response = get_gemini_model().generate_content(
         prompt,
         generation_config={"temperature": 0.1, "top_p": 0.95}
     )
@@ -0,0 +1,88 @@
+import heapq
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from config_local import Config
+from src.database.model.cv_embedding_model import CvEmbeddingDocument
+from src.utils.embedder import EMBEDDING_NAMESPACE, embed, text_hash
+from src.service.resume_text_service import get_resume_text
+from src.utils.sanitizer import sanitizer
+
+logger = logging.getLogger(__name__)
+
+
+def index_cv(application_id, resume_text):
+    """Stores the CV embedding of a screened application in the talent pool."""
+    try:
+        vector = embed([resume_text])[0]
+        CvEmbeddingDocument.save_embeddings({application_id: (vector, text_hash(resume_text))}, EMBEDDING_NAMESPACE)
+    except Exception as e:
+        # the vector is backfilled the next time the application is a recommendation candidate
+        logger.warning(f"Could not index CV of application {application_id}: {e}")
+
+
+def _read_cv(candidate):
+    try:
+        return sanitizer(get_resume_text(candidate["cv_link"], candidate.get("cv_digest")))
+    except Exception as e:
+        logger.warning(f"Could not read CV of application {candidate['application_id']}: {e}")
+        return None
+
+
+def load_cv_vectors(candidates):
+    """
+    Returns application_id -> CV vector for the candidates. Applications that
+    were never indexed (screened before the talent pool existed, or by another
+    model) are read, embedded in one batch and stored. Unreadable CVs are left out.
+    """
+    vectors = CvEmbeddingDocument.get_embeddings([c["application_id"] for c in candidates], EMBEDDING_NAMESPACE)
+    missing = [c for c in candidates if c["application_id"] not in vectors]
+    if not missing:
+        return vectors
+
+    logger.info(f"Backfilling {len(missing)} of {len(candidates)} CV embeddings")
+    with ThreadPoolExecutor(max_workers=Config.TALENT_POOL_BACKFILL_WORKERS, thread_name_prefix="cv-backfill") as executor:
+        texts = list(executor.map(_read_cv, missing))
+    readable = [(c["application_id"], text) for c, text in zip(missing, texts) if text]
+    if readable:
+        computed = embed([text for _, text in readable])
+        backfilled = {app_id: (vector, text_hash(text)) for (app_id, text), vector in zip(readable, computed)}
+        CvEmbeddingDocument.save_embeddings(backfilled, EMBEDDING_NAMESPACE)
+        vectors.update({app_id: vector for app_id, (vector, _) in backfilled.items()})
+    return vectors
+
+
+def cosine_similarities(matrix, vector):
+    """Cosine similarity of every row of matrix to vector."""
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(vector)
+    return (matrix @ vector) / np.maximum(norms, 1e-12)
+
+
+def select_top_k(job_text, candidates, top_k, min_similarity, chunk_size=None):
+    """
+    Ranks recommendation candidates by cosine similarity between their CV
+    embedding and the job text. Returns at most top_k (candidate, similarity)
+    pairs scoring at least min_similarity, best first. Candidates are handled
+    chunk_size (Config.TALENT_POOL_CHUNK_SIZE) at a time, so only one chunk's
+    vectors and backfilled CVs are held besides the current top_k.
+    """
+    if not candidates or top_k <= 0:
+        return []
+    chunk_size = chunk_size or Config.TALENT_POOL_CHUNK_SIZE
+    job_vector = np.asarray(embed([job_text])[0], dtype=np.float32)
+
+    best = []  # (similarity, candidate), at most top_k
+    for start in range(0, len(candidates), chunk_size):
+        chunk = candidates[start:start + chunk_size]
+        vectors = load_cv_vectors(chunk)
+        ranked = [c for c in chunk if c["application_id"] in vectors]
+        if not ranked:
+            continue
+        matrix = np.stack([vectors[c["application_id"]] for c in ranked])
+        similarities = cosine_similarities(matrix, job_vector)
+        best += [(float(similarities[i]), ranked[i]) for i in np.flatnonzero(similarities >= min_similarity)]
+        # nlargest is stable, so ties keep the candidates' order
+        best = heapq.nlargest(top_k, best, key=lambda pair: pair[0])
+    return [(candidate, similarity) for similarity, candidate in best]
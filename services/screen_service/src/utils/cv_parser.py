@@ -1,19 +1,12 @@
 # Load environment variables
 from config_local import Config
-import google.generativeai as genai
+from src.utils.resources import get_gemini_model
 import logging
 from dotenv import load_dotenv
 logger = logging.getLogger(__name__)
 
 
 load_dotenv()
-gemini_api_key = Config.GEMINI_KEY
-if not gemini_api_key:
-    raise ValueError("GEMINI_API_KEY is missing in environment variables.")
-
-# Configure Gemini API
-genai.configure(api_key=gemini_api_key)
-model = genai.GenerativeModel("gemini-2.0-flash")
 
 def parse_cv(unstructured_cv):
     """format the resume."""
@@ -72,7 +65,7 @@ the unstructured_cv is {unstructured_cv}
     
 
     try:
-        response = model.generate_content(prompt, generation_config={"temperature": 0.7})
+        response = get_gemini_model().generate_content(prompt, generation_config={"temperature": 0.7})
         response_text = response.text
 
         # Normalize keywords
@@ -0,0 +1,167 @@
+import hashlib
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+
+import numpy as np
+from nltk.tokenize import sent_tokenize
+
+from config_local import Config
+from src.utils.embedding_backends import get_embedding_backend
+from src.utils.embedding_store import EmbeddingStore
+from src.utils.resources import ensure_nltk, get_tokenizer, lazy_resource
+
+logger = logging.getLogger(__name__)
+
+# all-MiniLM-L6-v2 was trained on sequences of at most 256 word pieces
+CHUNK_TOKENS = Config.EMBEDDING_CHUNK_TOKENS
+
+# Identifies the vectors this process produces; stored embeddings from another
+# model, backend or chunking are never mixed with them
+EMBEDDING_NAMESPACE = f"{Config.EMBEDDING_MODEL_NAME}:{Config.EMBEDDING_BACKEND}:chunk{CHUNK_TOKENS}"
+
+
+@lazy_resource("embedding_cache")
+def get_embedding_cache():
+    return EmbeddingStore(
+        Config.EMBEDDING_CACHE_SIZE,
+        path=Config.EMBEDDING_CACHE_PATH,
+        namespace=EMBEDDING_NAMESPACE,
+        dim=get_embedding_backend().dim,
+    )
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def chunk_text(text: str, max_tokens: int = CHUNK_TOKENS):
+    """
+    Splits text into sentence-aligned chunks of at most max_tokens word pieces
+    (excluding special tokens). Returns (chunk, token_count) pairs; a single
+    sentence longer than the limit becomes its own chunk and is truncated by
+    the tokenizer.
+    """
+    ensure_nltk()
+    sentences = [s for s in sent_tokenize(text) if s.strip()] or [text]
+    lengths = [len(ids) for ids in get_tokenizer()(sentences, add_special_tokens=False)["input_ids"]]
+    budget = max_tokens - 2  # [CLS] and [SEP]
+
+    chunks, current, current_len = [], [], 0
+    for sentence, length in zip(sentences, lengths):
+        if current and current_len + length > budget:
+            chunks.append((" ".join(current), current_len))
+            current, current_len = [], 0
+        current.append(sentence)
+        current_len += length
+    if current:
+        chunks.append((" ".join(current), current_len))
+    return [(chunk, max(1, min(length, budget))) for chunk, length in chunks]
+
+
+def _encode(chunks, backend=None):
+    """Mean-pooled embeddings for a list of chunks, in one padded forward pass."""
+    backend = backend or get_embedding_backend()
+    inputs = get_tokenizer()(chunks, return_tensors="pt", truncation=True, max_length=CHUNK_TOKENS, padding=True)
+    last_hidden = backend(inputs)
+    mask = inputs["attention_mask"].unsqueeze(-1)
+    summed = (last_hidden * mask).sum(dim=1)
+    counts = mask.sum(dim=1)
+    return (summed / counts).cpu().numpy()
+
+
+def embed_texts(texts, batch_size: int = Config.EMBEDDING_BATCH_SIZE):
+    """
+    Embeds many texts at once. Long texts are split into sentence chunks whose
+    vectors are averaged, weighted by token count, so nothing past the model's
+    sequence limit is dropped. Chunks from all uncached texts are sorted by
+    length and padded into batches of batch_size.
+    """
+    cache = get_embedding_cache()
+    hashes = [text_hash(text) for text in texts]
+    vectors = [cache.get(h) for h in hashes]
+
+    pending = {}
+    for text, h, vector in zip(texts, hashes, vectors):
+        if vector is None and h not in pending:
+            pending[h] = chunk_text(text)
+    if pending:
+        flat = [(h, chunk, weight) for h, chunks in pending.items() for chunk, weight in chunks]
+        order = sorted(range(len(flat)), key=lambda i: len(flat[i][1]))
+        chunk_vectors = [None] * len(flat)
+        for start in range(0, len(order), batch_size):
+            batch = order[start:start + batch_size]
+            for i, vector in zip(batch, _encode([flat[i][1] for i in batch])):
+                chunk_vectors[i] = vector
+
+        pooled = {}
+        for (h, _, weight), vector in zip(flat, chunk_vectors):
+            total, weights = pooled.get(h, (0, 0))
+            pooled[h] = (total + vector * weight, weights + weight)
+        computed = {}
+        for h, (total, weights) in pooled.items():
+            computed[h] = (total / weights).astype(np.float32)
+            cache.put(h, computed[h])
+
+        vectors = [vector if vector is not None else computed[h] for h, vector in zip(hashes, vectors)]
+    return vectors
+
+
+class EmbeddingBatcher:
+    """
+    Coalesces embedding requests from concurrent screening workers into a single
+    embed_texts call. Requests arriving within `window` seconds of each other
+    share a forward pass, up to `max_texts` texts per pass.
+    """
+
+    def __init__(self, window: float, max_texts: int):
+        self.window = window
+        self.max_texts = max_texts
+        self.requests = queue.Queue()
+        self.thread = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+        self.thread.start()
+
+    def embed(self, texts):
+        future = Future()
+        self.requests.put((list(texts), future))
+        return future.result()
+
+    def _run(self):
+        while True:
+            batch = [self.requests.get()]
+            count = len(batch[0][0])
+            while count < self.max_texts:
+                try:
+                    item = self.requests.get(timeout=self.window)
+                except queue.Empty:
+                    break
+                batch.append(item)
+                count += len(item[0])
+
+            texts = [text for item_texts, _ in batch for text in item_texts]
+            try:
+                vectors = embed_texts(texts)
+            except Exception as e:
+                logger.error(f"Batched embedding failed: {e}")
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            offset = 0
+            for item_texts, future in batch:
+                future.set_result(vectors[offset:offset + len(item_texts)])
+                offset += len(item_texts)
+
+
+# Only worth a background thread when several workers embed concurrently
+BATCHER = (
+    EmbeddingBatcher(Config.EMBEDDING_BATCH_WINDOW_MS / 1000, Config.EMBEDDING_BATCH_SIZE)
+    if Config.SCREENING_WORKERS > 1 else None
+)
+
+
+def embed(texts):
+    """Embeds texts, sharing a forward pass with other workers when possible."""
+    if BATCHER is not None:
+        return BATCHER.embed(texts)
+    return embed_texts(texts)
@@ -0,0 +1,101 @@
+import logging
+import os
+
+import numpy as np
+import torch
+
+from config_local import Config
+from src.utils.resources import get_embedding_model, get_tokenizer, lazy_resource
+
+logger = logging.getLogger(__name__)
+
+ONNX_INPUTS = ["input_ids", "attention_mask", "token_type_ids"]
+
+
+class TorchBackend:
+    """Eager PyTorch inference, optionally with dynamic int8 quantization of the Linear layers."""
+
+    def __init__(self, quantize: bool = False):
+        model = get_embedding_model()
+        if quantize:
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        self.model = model
+        self.dim = model.config.hidden_size
+
+    def __call__(self, inputs):
+        with torch.inference_mode():
+            return self.model(**inputs).last_hidden_state
+
+
+class OnnxBackend:
+    """onnxruntime inference over an exported (and optionally int8-quantized) graph."""
+
+    def __init__(self, path: str, quantize: bool = False):
+        try:
+            import onnxruntime
+        except ImportError as e:
+            raise RuntimeError("EMBEDDING_BACKEND=onnx requires the onnxruntime package") from e
+
+        if not os.path.exists(path):
+            export_onnx(path)
+        if quantize:
+            path = quantize_onnx(path)
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = onnxruntime.InferenceSession(path, options, providers=["CPUExecutionProvider"])
+        self.input_names = {i.name for i in self.session.get_inputs()}
+        self.dim = self.session.get_outputs()[0].shape[-1]
+
+    def __call__(self, inputs):
+        feed = {name: tensor.numpy().astype(np.int64) for name, tensor in inputs.items() if name in self.input_names}
+        last_hidden = self.session.run(["last_hidden_state"], feed)[0]
+        return torch.from_numpy(last_hidden)
+
+
+def export_onnx(path: str):
+    """Exports the embedding model to an ONNX graph with dynamic batch and sequence axes."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    model = get_embedding_model()
+    sample = get_tokenizer()(["warm up"], return_tensors="pt")
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in ONNX_INPUTS}
+    dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+    torch.onnx.export(
+        model,
+        tuple(sample[name] for name in ONNX_INPUTS),
+        path,
+        input_names=ONNX_INPUTS,
+        output_names=["last_hidden_state"],
+        dynamic_axes=dynamic_axes,
+        opset_version=14,
+    )
+    logger.info(f"Exported embedding model to {path}")
+    return path
+
+
+def quantize_onnx(path: str):
+    """Writes a dynamically int8-quantized copy of the ONNX graph next to it."""
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    quantized_path = path.replace(".onnx", ".int8.onnx")
+    if not os.path.exists(quantized_path):
+        quantize_dynamic(path, quantized_path, weight_type=QuantType.QInt8)
+        logger.info(f"Quantized ONNX graph written to {quantized_path}")
+    return quantized_path
+
+
+@lazy_resource("embedding_backend")
+def get_embedding_backend():
+    """Returns the inference backend selected by EMBEDDING_BACKEND."""
+    backend = Config.EMBEDDING_BACKEND
+    if backend == "torch":
+        return TorchBackend()
+    if backend == "torch-int8":
+        return TorchBackend(quantize=True)
+    if backend == "onnx":
+        return OnnxBackend(Config.EMBEDDING_ONNX_PATH)
+    if backend == "onnx-int8":
+        return OnnxBackend(Config.EMBEDDING_ONNX_PATH, quantize=True)
+    raise ValueError(f"Unknown EMBEDDING_BACKEND: {backend}")
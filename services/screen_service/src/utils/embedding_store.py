@@ -0,0 +1,99 @@
+import logging
+import os
+import sqlite3
+import threading
+
+import numpy as np
+
+from src.utils.lru_cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+
+class SqliteEmbeddingTier:
+    """
+    On-disk embedding tier. Vectors are stored as raw float32 blobs keyed by
+    (namespace, text hash), so they survive consumer restarts.
+    """
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        with self.lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                " namespace TEXT NOT NULL,"
+                " text_hash TEXT NOT NULL,"
+                " vector BLOB NOT NULL,"
+                " PRIMARY KEY (namespace, text_hash))"
+            )
+            self.conn.commit()
+
+    def get(self, namespace: str, text_hash: str):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT vector FROM embeddings WHERE namespace = ? AND text_hash = ?",
+                (namespace, text_hash),
+            ).fetchone()
+        if row is None:
+            return None
+        return np.frombuffer(row[0], dtype=np.float32)
+
+    def put(self, namespace: str, text_hash: str, vector: np.ndarray):
+        blob = np.asarray(vector, dtype=np.float32).tobytes()
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO embeddings (namespace, text_hash, vector) VALUES (?, ?, ?)",
+                (namespace, text_hash, blob),
+            )
+            self.conn.commit()
+
+
+class EmbeddingStore:
+    """
+    Two-tier embedding cache: a size-bounded in-memory LRU in front of an
+    optional SQLite tier. `namespace` identifies the model producing the
+    vectors so a model change never serves stale embeddings.
+    """
+
+    def __init__(self, maxsize: int, path: str = None, namespace: str = "default", dim: int = None):
+        self.memory = LRUCache(maxsize)
+        self.namespace = namespace
+        self.dim = dim
+        self.disk = None
+        if path:
+            try:
+                self.disk = SqliteEmbeddingTier(path)
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding disk cache unavailable at {path}: {e}")
+
+    def _valid(self, vector):
+        return vector is not None and (self.dim is None or len(vector) == self.dim)
+
+    def get(self, text_hash: str):
+        vector = self.memory.get(text_hash)
+        if self._valid(vector):
+            return vector
+        if self.disk is not None:
+            try:
+                vector = self.disk.get(self.namespace, text_hash)
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding disk cache read failed: {e}")
+                return None
+            if self._valid(vector):
+                self.memory.set(text_hash, vector)
+                return vector
+        return None
+
+    def put(self, text_hash: str, vector):
+        vector = np.asarray(vector, dtype=np.float32)
+        self.memory.set(text_hash, vector)
+        if self.disk is not None:
+            try:
+                self.disk.put(self.namespace, text_hash, vector)
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding disk cache write failed: {e}")
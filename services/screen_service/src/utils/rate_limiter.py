@@ -0,0 +1,57 @@
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket used to pace calls to rate-limited APIs.
+
+    Tokens refill continuously at `rate_per_minute`; up to `burst` tokens can
+    accumulate while the bucket is idle.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int = 1):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def acquire(self) -> float:
+        """Blocks until a token is available and returns the time spent waiting."""
+        waited = 0.0
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class RateLimitedModel:
+    """
+    Wraps an LLM client so that every generate_content call takes a token from
+    `bucket` first. Pacing individual calls, rather than screenings, keeps the
+    budget right however many calls a screening makes or runs concurrently.
+    """
+
+    def __init__(self, model, bucket: TokenBucket):
+        self.model = model
+        self.bucket = bucket
+
+    def generate_content(self, *args, **kwargs):
+        waited = self.bucket.acquire()
+        if waited:
+            logger.info(f"Rate limiter delayed an LLM call by {waited:.1f}s")
+        return self.model.generate_content(*args, **kwargs)
@@ -0,0 +1,126 @@
+import functools
+import logging
+import os
+import threading
+import time
+
+from config_local import Config
+from src.utils.rate_limiter import RateLimitedModel, TokenBucket
+
+logger = logging.getLogger(__name__)
+
+PROCESS_STARTED = time.perf_counter()
+STARTUP_TIMINGS = {}
+NLTK_CORPORA = {
+    "punkt": "tokenizers/punkt",
+    "punkt_tab": "tokenizers/punkt_tab",
+    "stopwords": "corpora/stopwords",
+    "wordnet": "corpora/wordnet",
+    "omw-1.4": "corpora/omw-1.4",
+}
+
+
+def lazy_resource(name):
+    """
+    Turns a zero-argument loader into a thread-safe singleton. The loader runs
+    on first use only, and its load time is recorded in STARTUP_TIMINGS.
+    """
+    def decorator(loader):
+        lock = threading.Lock()
+        instance = []
+
+        @functools.wraps(loader)
+        def get():
+            if instance:
+                return instance[0]
+            with lock:
+                if not instance:
+                    start = time.perf_counter()
+                    instance.append(loader())
+                    STARTUP_TIMINGS[name] = round(time.perf_counter() - start, 3)
+                    logger.info(f"Loaded {name} in {STARTUP_TIMINGS[name]}s")
+            return instance[0]
+
+        return get
+    return decorator
+
+
+@lazy_resource("nltk")
+def ensure_nltk():
+    """Makes the NLTK corpora available, downloading them only when online."""
+    import nltk
+
+    if Config.NLTK_DATA_DIR and Config.NLTK_DATA_DIR not in nltk.data.path:
+        nltk.data.path.insert(0, Config.NLTK_DATA_DIR)
+    for corpus, resource_path in NLTK_CORPORA.items():
+        try:
+            nltk.data.find(resource_path)
+        except LookupError:
+            if Config.OFFLINE_MODE:
+                raise RuntimeError(f"NLTK corpus '{corpus}' is missing and OFFLINE_MODE is set")
+            nltk.download(corpus, download_dir=Config.NLTK_DATA_DIR or None, quiet=True)
+    return True
+
+
+@lazy_resource("lemmatizer")
+def get_lemmatizer():
+    ensure_nltk()
+    from nltk.stem import WordNetLemmatizer
+    return WordNetLemmatizer()
+
+
+@lazy_resource("stopwords")
+def get_stopwords():
+    ensure_nltk()
+    from nltk.corpus import stopwords
+    return set(stopwords.words("english")).difference(set(["c++", "c"]))
+
+
+@lazy_resource("gemini")
+def get_gemini_model():
+    import google.generativeai as genai
+
+    if not Config.GEMINI_KEY:
+        raise ValueError("GEMINI_API_KEY is not set in the environment variables!")
+    genai.configure(api_key=Config.GEMINI_KEY)
+    # one bucket per process, shared by every stage and worker thread
+    return RateLimitedModel(
+        genai.GenerativeModel("gemini-2.0-flash"),
+        TokenBucket(Config.GEMINI_RATE_PER_MINUTE, Config.GEMINI_RATE_BURST),
+    )
+
+
+def embedding_model_source():
+    """The pre-baked model directory when present, otherwise the hub model name."""
+    if Config.EMBEDDING_MODEL_DIR and os.path.isdir(Config.EMBEDDING_MODEL_DIR):
+        return Config.EMBEDDING_MODEL_DIR
+    return Config.EMBEDDING_MODEL_NAME
+
+
+@lazy_resource("tokenizer")
+def get_tokenizer():
+    from transformers import AutoTokenizer
+    return AutoTokenizer.from_pretrained(embedding_model_source(), local_files_only=Config.OFFLINE_MODE)
+
+
+@lazy_resource("embedding_model")
+def get_embedding_model():
+    from transformers import AutoModel
+    model = AutoModel.from_pretrained(embedding_model_source(), local_files_only=Config.OFFLINE_MODE)
+    model.eval()
+    return model
+
+
+def warm_up():
+    """Loads every lazy resource and logs a cold-start timing report."""
+    from src.utils.embedder import get_embedding_cache
+
+    for loader in (ensure_nltk, get_lemmatizer, get_stopwords, get_gemini_model, get_tokenizer, get_embedding_cache):
+        try:
+            loader()
+        except Exception as e:
+            logger.error(f"Failed to load {loader.__name__}: {e}")
+    report = dict(STARTUP_TIMINGS)
+    report["since_process_start"] = round(time.perf_counter() - PROCESS_STARTED, 3)
+    logger.info(f"Startup timing report (s): {report}")
+    return report
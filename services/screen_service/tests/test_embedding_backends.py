@@ -0,0 +1,60 @@
+# tests/test_embedding_backends.py
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+pytest.importorskip("nltk")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+from src.utils.embedder import _encode
+from src.utils.embedding_backends import OnnxBackend, TorchBackend
+
+JOB_TEXT = (
+    "We are hiring a backend engineer with strong Python, FastAPI and MongoDB experience. "
+    "Experience with RabbitMQ and Docker is required."
+)
+RESUMES = [
+    "Backend developer, 4 years of Python. Built FastAPI services on MongoDB and deployed them with Docker.",
+    "Registered nurse with ten years of experience in intensive care units.",
+]
+
+
+def similarity(backend, job_text, resume_text):
+    job_emb, resume_emb = _encode([job_text, resume_text], backend)
+    return float(np.dot(job_emb, resume_emb) / (np.linalg.norm(job_emb) * np.linalg.norm(resume_emb))) * 100
+
+
+@pytest.fixture(scope="module")
+def reference():
+    return TorchBackend()
+
+
+def onnx_backend(tmp_path_factory, quantize):
+    pytest.importorskip("onnxruntime")
+    return OnnxBackend(str(tmp_path_factory.mktemp("onnx") / "minilm.onnx"), quantize=quantize)
+
+
+@pytest.mark.parametrize("name", ["torch-int8", "onnx", "onnx-int8"])
+def test_backend_scores_match_torch(name, reference, tmp_path_factory):
+    if name == "torch-int8":
+        backend = TorchBackend(quantize=True)
+    else:
+        backend = onnx_backend(tmp_path_factory, quantize=name == "onnx-int8")
+
+    assert backend.dim == reference.dim
+    tolerance = 0.5 if name == "onnx" else 3.0
+    for resume in RESUMES:
+        expected = similarity(reference, JOB_TEXT, resume)
+        assert abs(similarity(backend, JOB_TEXT, resume) - expected) < tolerance
+
+
+def test_onnx_embeddings_match_torch(reference, tmp_path_factory):
+    backend = onnx_backend(tmp_path_factory, quantize=False)
+    expected = _encode(RESUMES, reference)
+    actual = _encode(RESUMES, backend)
+    np.testing.assert_allclose(actual, expected, atol=1e-4)
@@ -0,0 +1,55 @@
+# tests/test_job_requirement_service.py
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+for module in ("pymongo", "dotenv"):
+    pytest.importorskip(module)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+# the client connects lazily; nothing here touches the database
+os.environ.setdefault("MONGODB_URI", "mongodb://localhost:27017")
+
+from src.service import job_requirement_service
+
+
+class FakeModel:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def generate_content(self, prompt):
+        self.calls += 1
+        return SimpleNamespace(text=self.responses.pop(0))
+
+
+@pytest.fixture(autouse=True)
+def in_process_cache(monkeypatch):
+    monkeypatch.setattr(job_requirement_service.Config, "JOB_ANALYSIS_CACHE_TIER", "memory")
+    job_requirement_service.JOB_ANALYSIS_CACHE.clear()
+    yield
+    job_requirement_service.JOB_ANALYSIS_CACHE.clear()
+
+
+def test_parse_weights_reads_fenced_json():
+    text = '```json\n{"Education": 40, "Experience": 60.5}\n```'
+    assert job_requirement_service.parse_weights(text) == {"Education": 40.0, "Experience": 60.5}
+
+
+@pytest.mark.parametrize("text", ["", "no json here", '{"Education": 40,', '{"Education": "high"}', "{}"])
+def test_parse_weights_rejects_unparsable_output(text):
+    assert job_requirement_service.parse_weights(text) is None
+
+
+def test_unparsable_output_is_not_cached(monkeypatch):
+    model = FakeModel("Sorry, I cannot help with that.", '{"Education": 50, "Experience": 50}')
+    monkeypatch.setattr(job_requirement_service, "get_gemini_model", lambda: model)
+
+    assert job_requirement_service.analyze_job_requirements("backend engineer") is None
+    weights = job_requirement_service.analyze_job_requirements("backend engineer")
+    assert weights == {"Education": 50.0, "Experience": 50.0}
+    assert job_requirement_service.analyze_job_requirements("backend engineer") == weights
+    assert model.calls == 2
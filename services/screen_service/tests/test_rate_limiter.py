@@ -0,0 +1,39 @@
+# tests/test_rate_limiter.py
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.utils.rate_limiter import RateLimitedModel, TokenBucket
+
+
+class FakeModel:
+    def generate_content(self, prompt, **kwargs):
+        return f"response to {prompt}"
+
+
+class CountingBucket(TokenBucket):
+    def __init__(self):
+        super().__init__(rate_per_minute=60)
+        self.acquired = 0
+
+    def acquire(self):
+        self.acquired += 1
+        return 0.0
+
+
+def test_every_llm_call_takes_a_token():
+    bucket = CountingBucket()
+    model = RateLimitedModel(FakeModel(), bucket)
+    responses = [model.generate_content(stage, generation_config={"temperature": 0.1}) for stage in ("cv", "job", "score")]
+    assert responses == ["response to cv", "response to job", "response to score"]
+    assert bucket.acquired == 3
+
+
+def test_bucket_allows_burst_then_waits(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("src.utils.rate_limiter.time.monotonic", lambda: now[0])
+    monkeypatch.setattr("src.utils.rate_limiter.time.sleep", lambda seconds: now.__setitem__(0, now[0] + seconds))
+    bucket = TokenBucket(rate_per_minute=60, burst=2)
+    assert [bucket.acquire(), bucket.acquire()] == [0.0, 0.0]
+    assert bucket.acquire() == 1.0
@@ -0,0 +1,55 @@
+# tests/test_talent_pool.py
+import sys
+from pathlib import Path
+
+import pytest
+
+for module in ("numpy", "torch", "transformers", "nltk", "pymongo", "doc_extraction"):
+    pytest.importorskip(module)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+from src.service import talent_pool_service
+
+JOB_VECTOR = np.array([1.0, 0.0, 0.0], dtype=np.float32)
+CV_VECTORS = {
+    "a": np.array([0.9, 0.1, 0.0], dtype=np.float32),
+    "b": np.array([0.0, 1.0, 0.0], dtype=np.float32),
+    "c": np.array([0.6, 0.6, 0.0], dtype=np.float32),
+    "d": np.array([1.0, 0.0, 0.1], dtype=np.float32),
+}
+CANDIDATES = [{"application_id": app_id, "cv_link": f"https://example.com/{app_id}.pdf"} for app_id in "abcde"]
+
+
+@pytest.fixture(autouse=True)
+def vectors(monkeypatch):
+    monkeypatch.setattr(talent_pool_service, "embed", lambda texts: [JOB_VECTOR for _ in texts])
+    # "e" has an unreadable CV and no stored vector
+    monkeypatch.setattr(talent_pool_service, "load_cv_vectors", lambda candidates: dict(CV_VECTORS))
+
+
+def selected_ids(top_k, min_similarity):
+    return [c["application_id"] for c, _ in talent_pool_service.select_top_k("job", CANDIDATES, top_k, min_similarity)]
+
+
+def test_returns_best_matches_first():
+    assert selected_ids(top_k=3, min_similarity=-1.0) == ["d", "a", "c"]
+
+
+def test_similarity_floor_applies_before_top_k():
+    assert selected_ids(top_k=10, min_similarity=0.8) == ["d", "a"]
+
+
+def test_chunks_rank_like_one_pass():
+    chunked = talent_pool_service.select_top_k("job", CANDIDATES, 3, -1.0, chunk_size=2)
+    assert [c["application_id"] for c, _ in chunked] == selected_ids(top_k=3, min_similarity=-1.0)
+
+
+def test_candidates_without_vectors_are_skipped():
+    assert "e" not in selected_ids(top_k=10, min_similarity=-1.0)
+
+
+def test_similarities_are_cosine():
+    matrix = np.stack([CV_VECTORS["b"], CV_VECTORS["c"]])
+    np.testing.assert_allclose(talent_pool_service.cosine_similarities(matrix, JOB_VECTOR), [0.0, np.sqrt(0.5)], rtol=1e-6)
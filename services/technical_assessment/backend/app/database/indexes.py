@@ -0,0 +1,51 @@
+"""
+Indexes for the collections technical_assessment queries, created idempotently at startup.
+
+    python -m app.database.indexes            # create the indexes
+    python -m app.database.indexes --check    # explain() the hot queries, exit 1 on a COLLSCAN
+"""
+import argparse
+import logging
+import sys
+from mongo_indexes import check_query_plans as check_plans, ensure_indexes as ensure
+from pymongo import ASCENDING
+from app.database.database import database
+
+logger = logging.getLogger(__name__)
+
+# (collection, keys, options)
+INDEXES = [
+    ("questions", [("difficulty", ASCENDING)], {}),
+]
+
+# (collection, filter, sort) for the queries that must be served by an index
+HOT_QUERIES = [
+    ("questions", {"difficulty": "Easy"}, None),
+]
+
+
+def ensure_indexes(db=None, indexes=INDEXES):
+    """Creates the missing indexes; returns the ones that could not be created."""
+    return ensure(db if db is not None else database.db, indexes)
+
+
+def check_query_plans(db=None, queries=HOT_QUERIES):
+    """Returns the hot queries whose winning plan is a COLLSCAN."""
+    return check_plans(db if db is not None else database.db, queries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="explain() the hot queries and fail on a COLLSCAN")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    failed = ensure_indexes()
+    if args.check and check_query_plans():
+        sys.exit(1)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,6 @@ from app.database.database import database
 from datetime import datetime
 from bson import ObjectId
 from pymongo import ReturnDocument, errors
-import random
 logger = logging.getLogger(__name__)
 
 class BaseDocument:
@@ -46,18 +45,17 @@ class QuestionDocument(BaseDocument):
     @classmethod
     def get_random_questions(cls, application_id):
         try:
-            questions = QuestionDocument.get_all_questions()
-            easy = [question for question in questions if question["difficulty"] == "Easy"]
-            medium =  [question for question in questions if question["difficulty"] == "Medium"]
-            hard =  [question for question in questions if question["difficulty"] == "Hard"]
-            logger.info(easy)
-            num_easy = len(easy)
-            num_medium = len(medium)
-            num_hard = len(hard)
+            # one random question per difficulty, sampled server side on the difficulty index
             interview_questions = []
-            interview_questions.append(easy[random.randint(0,num_easy-1)])
-            interview_questions.append(medium[random.randint(0,num_medium)-1])
-            interview_questions.append(hard[random.randint(0,num_hard-1)])
+            for difficulty in ("Easy", "Medium", "Hard"):
+                sampled = list(cls.get_collection().aggregate([
+                    {"$match": {"difficulty": difficulty}},
+                    {"$sample": {"size": 1}},
+                ]))
+                if not sampled:
+                    raise Exception(f"No {difficulty} questions available")
+                sampled[0]["_id"] = str(sampled[0]["_id"])
+                interview_questions.append(sampled[0])
             result = {
                 "application_id": application_id,
                 "questions": interview_questions
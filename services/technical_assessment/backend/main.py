@@ -1,11 +1,21 @@
 from logger import setup_logging
 setup_logging()
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware  
 from app.routes.question import router as question_router
 from app.routes.sumbission import router as submission_router
+from app.database.indexes import ensure_indexes
 
-app = FastAPI(title="Questions API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await asyncio.to_thread(ensure_indexes)
+    yield
+
+
+app = FastAPI(title="Questions API", lifespan=lifespan)
 
 
 app.add_middleware(